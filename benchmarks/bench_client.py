@@ -0,0 +1,298 @@
+"""
+Benchmarks de extremo a extremo del cliente contra un SIE local
+
+Mide latencia (p50/p95), throughput y memoria pico de los caminos calientes
+del cliente: consultas puntuales, rangos, peticiones agrupadas, streaming,
+hilos concurrentes, reintentos y el cliente asíncrono.
+
+Uso:
+    python benchmarks/bench_client.py
+    python benchmarks/bench_client.py --latency 0.02 --repeat 50 --only range
+    python benchmarks/bench_client.py --json resultados.json
+
+Con `--json` se guardan los números para comparar entre versiones. El
+servidor corre en un proceso aparte para que su trabajo no se cuente en los
+tiempos ni en la memoria del cliente.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+import requests
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from banxico_sie import (  # noqa: E402
+    AsyncBanxicoSIEClient,
+    BanxicoSIEClient,
+    Currency,
+    RateCache,
+    RetryPolicy,
+)
+
+TOKEN = "benchmark_token"
+ALL_CURRENCIES = list(Currency)
+
+
+class Result(NamedTuple):
+    """Resultado de un escenario"""
+
+    name: str
+    calls: int
+    p50_ms: float
+    p95_ms: float
+    ops_per_sec: float
+    peak_kib: float
+    requests: int
+    response_kib: float
+
+
+class Scenario(NamedTuple):
+    """Escenario: una operación `run(client)` y la configuración del servidor"""
+
+    name: str
+    run: Callable
+    client_kwargs: Dict = {}
+    server_kwargs: Dict = {}
+    threads: int = 1
+    is_async: bool = False
+
+
+def _percentile(samples: List[float], q: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(int(q * len(ordered)), len(ordered) - 1)]
+
+
+FAKE_SIE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fake_sie.py")
+
+
+class ServerProcess:
+    """`fake_sie.py` en un subproceso; ver `FakeSIEServer` para los parámetros"""
+
+    def __init__(self, latency: float = 0.0, rate_limit_every: int = 0, error_rate: float = 0.0):
+        self.args = [
+            "--latency",
+            str(latency),
+            "--rate-limit-every",
+            str(rate_limit_every),
+            "--error-rate",
+            str(error_rate),
+        ]
+
+    def __enter__(self) -> "ServerProcess":
+        self.process = subprocess.Popen(
+            [sys.executable, FAKE_SIE] + self.args, stdout=subprocess.PIPE, text=True
+        )
+        self.url = self.process.stdout.readline().strip()
+        self.stats_url = self.url.split("/SieAPIRest")[0] + "/stats"
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.process.terminate()
+        self.process.wait()
+
+    def stats(self, reset: bool = False) -> Dict:
+        """Contadores del servidor (peticiones y bytes enviados)"""
+        return requests.get(self.stats_url + ("?reset=1" if reset else "")).json()
+
+
+def _make_client(server: ServerProcess, kwargs: Dict, is_async: bool):
+    client_class = AsyncBanxicoSIEClient if is_async else BanxicoSIEClient
+    return client_class(TOKEN, base_url=server.url, **kwargs)
+
+
+def _threaded(run: Callable, threads: int) -> Callable:
+    """Ejecuta `run` en `threads` hilos simultáneos, compartiendo el cliente"""
+
+    def wrapper(client, i):
+        with ThreadPoolExecutor(threads) as executor:
+            list(executor.map(lambda j: run(client, i * threads + j), range(threads)))
+
+    return wrapper
+
+
+def run_scenario(scenario: Scenario, repeat: int, latency: float) -> Result:
+    """
+    Corre un escenario contra un servidor nuevo
+
+    Args:
+        scenario: Escenario a medir
+        repeat: Número de llamadas medidas (después de una de calentamiento)
+        latency: Latencia por petición del servidor, en segundos
+
+    Returns:
+        Resultado con latencias, throughput y memoria pico
+    """
+    server_kwargs = dict({"latency": latency}, **scenario.server_kwargs)
+    run = scenario.run
+    if scenario.threads > 1:
+        run = _threaded(run, scenario.threads)
+
+    with ServerProcess(**server_kwargs) as server:
+        client = _make_client(server, scenario.client_kwargs, scenario.is_async)
+        if scenario.is_async:
+            loop = asyncio.new_event_loop()
+            call = lambda i: loop.run_until_complete(run(client, i))  # noqa: E731
+        else:
+            call = lambda i: run(client, i)  # noqa: E731
+
+        call(0)
+        server.stats(reset=True)
+
+        samples = []
+        started = time.perf_counter()
+        for i in range(1, repeat + 1):
+            t0 = time.perf_counter()
+            call(i)
+            samples.append(time.perf_counter() - t0)
+        elapsed = time.perf_counter() - started
+        stats = server.stats()
+
+        # La memoria se mide aparte: tracemalloc distorsiona los tiempos
+        tracemalloc.start()
+        call(repeat + 1)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        if scenario.is_async:
+            loop.run_until_complete(client.close())
+            loop.close()
+        else:
+            client.close()
+
+    calls = repeat * scenario.threads
+    return Result(
+        name=scenario.name,
+        calls=calls,
+        p50_ms=statistics.median(samples) * 1000,
+        p95_ms=_percentile(samples, 0.95) * 1000,
+        ops_per_sec=calls / elapsed,
+        peak_kib=peak / 1024,
+        requests=stats["requests"],
+        response_kib=stats["bytes_sent"] / 1024 / max(stats["requests"], 1),
+    )
+
+
+def _day(i: int) -> str:
+    """Un día hábil distinto por llamada, para no medir sólo la caché"""
+    day = date(2024, 1, 1) + timedelta(days=i % 3000)
+    while day.weekday() >= 5:
+        day -= timedelta(days=1)
+    return day.isoformat()
+
+
+def scenarios() -> List[Scenario]:
+    """Escenarios a medir"""
+    usd = Currency.USD
+
+    async def async_rates_many(client, i):
+        await client.get_rates_range_many(ALL_CURRENCIES, "2023-01-01", "2023-12-31")
+
+    async def async_get_rate_burst(client, i):
+        await asyncio.gather(*(client.get_rate(usd, _day(i * 16 + j)) for j in range(16)))
+
+    return [
+        Scenario("get_rate", lambda c, i: c.get_rate(usd, _day(i))),
+        Scenario(
+            "get_rate (cache)",
+            lambda c, i: c.get_rate(usd, "2024-12-26"),
+            client_kwargs={"cache": RateCache()},
+        ),
+        Scenario("get_rate x16 hilos", lambda c, i: c.get_rate(usd, _day(i)), threads=16),
+        Scenario(
+            "get_rates_range 1 año",
+            lambda c, i: c.get_rates_range(usd, "2023-01-01", "2023-12-31"),
+        ),
+        Scenario(
+            "get_rates_range 10 años",
+            lambda c, i: c.get_rates_range(usd, "2014-01-01", "2023-12-31"),
+        ),
+        Scenario(
+            "get_rates_range 10 años as_series",
+            lambda c, i: c.get_rates_range(usd, "2014-01-01", "2023-12-31", as_series=True),
+        ),
+        Scenario(
+            "get_rates_range 10 años chunked",
+            lambda c, i: c.get_rates_range(usd, "2014-01-01", "2023-12-31"),
+            client_kwargs={"chunk_days": 366},
+        ),
+        Scenario(
+            "iter_rates_range 10 años x6",
+            lambda c, i: sum(
+                1 for _ in c.iter_rates_range(ALL_CURRENCIES, "2014-01-01", "2023-12-31")
+            ),
+        ),
+        Scenario(
+            "get_rates_range_many 1 año x6",
+            lambda c, i: c.get_rates_range_many(ALL_CURRENCIES, "2023-01-01", "2023-12-31"),
+        ),
+        Scenario("get_latest_many x6", lambda c, i: c.get_latest_many(ALL_CURRENCIES)),
+        Scenario(
+            "get_rate con 429 (1 de 3)",
+            lambda c, i: c.get_rate(usd, _day(i)),
+            client_kwargs={"retry": RetryPolicy(max_retries=3, backoff_factor=0.001, jitter=False)},
+            server_kwargs={"rate_limit_every": 3},
+        ),
+        Scenario(
+            "get_rate con 5% de 503",
+            lambda c, i: c.get_rate(usd, _day(i)),
+            client_kwargs={"retry": RetryPolicy(max_retries=5, backoff_factor=0.001, jitter=False)},
+            server_kwargs={"error_rate": 0.05},
+        ),
+        Scenario("async get_rates_range_many 1 año x6", async_rates_many, is_async=True),
+        Scenario("async get_rate x16 gather", async_get_rate_burst, is_async=True),
+    ]
+
+
+def print_results(results: List[Result]) -> None:
+    """Imprime una tabla con los resultados"""
+    header = (
+        f"{'escenario':<38}{'llamadas':>9}{'p50 ms':>10}{'p95 ms':>10}"
+        f"{'ops/s':>10}{'pico KiB':>11}{'HTTP':>7}{'KiB/resp':>10}"
+    )
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        print(
+            f"{r.name:<38}{r.calls:>9}{r.p50_ms:>10.2f}{r.p95_ms:>10.2f}"
+            f"{r.ops_per_sec:>10.1f}{r.peak_kib:>11.1f}{r.requests:>7}{r.response_kib:>10.1f}"
+        )
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20, help="llamadas medidas por escenario")
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="latencia del servidor en segundos"
+    )
+    parser.add_argument("--only", help="sólo escenarios cuyo nombre contenga este texto")
+    parser.add_argument("--json", help="guarda los resultados en este archivo")
+    args = parser.parse_args(argv)
+
+    selected = [s for s in scenarios() if not args.only or args.only in s.name]
+    results = []
+    for scenario in selected:
+        try:
+            results.append(run_scenario(scenario, args.repeat, args.latency))
+        except ImportError as e:
+            print(f"# {scenario.name}: omitido ({e})", file=sys.stderr)
+
+    print_results(results)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump([r._asdict() for r in results], f, indent=2, ensure_ascii=False)
+
+
+if __name__ == "__main__":
+    main()
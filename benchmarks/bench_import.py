@@ -0,0 +1,72 @@
+"""
+Benchmark del tiempo de importación del paquete
+
+Mide, en intérpretes nuevos, cuánto cuesta `import banxico_sie` y el primer
+uso del cliente, y qué dependencias pesadas quedan cargadas.
+
+Uso:
+    python benchmarks/bench_import.py
+    python benchmarks/bench_import.py --repeat 20 --max-ms 20
+
+Con `--max-ms` termina con error si `import banxico_sie` excede el presupuesto
+(útil en CI).
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+HEAVY = ("requests", "urllib3", "aiohttp", "dateutil", "sqlite3", "orjson")
+
+CASES = [
+    ("import banxico_sie", "import banxico_sie"),
+    ("from banxico_sie import Currency", "from banxico_sie import Currency"),
+    ("from banxico_sie import BanxicoSIEClient", "from banxico_sie import BanxicoSIEClient"),
+    ("BanxicoSIEClient(...) + fecha", (
+        "from banxico_sie import BanxicoSIEClient\n"
+        "BanxicoSIEClient('token')._format_date('2024-12-26')"
+    )),
+]
+
+
+def measure(code: str) -> tuple:
+    """Corre `code` en un intérprete nuevo; regresa (ms, módulos pesados cargados)"""
+    script = (
+        "import sys, time\n"
+        "t0 = time.perf_counter()\n"
+        f"{code}\n"
+        "ms = (time.perf_counter() - t0) * 1000\n"
+        f"print(ms, ','.join(m for m in {HEAVY!r} if m in sys.modules))"
+    )
+    env = dict(os.environ, PYTHONPATH=SRC)
+    output = subprocess.run(
+        [sys.executable, "-c", script], env=env, check=True, capture_output=True, text=True
+    ).stdout.split()
+    return float(output[0]), output[1] if len(output) > 1 else "-"
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=10, help="intérpretes por caso")
+    parser.add_argument("--max-ms", type=float, help="presupuesto para `import banxico_sie`")
+    args = parser.parse_args(argv)
+
+    print(f"{'caso':<42}{'mediana ms':>12}  dependencias cargadas")
+    print("-" * 80)
+    medians = {}
+    for name, code in CASES:
+        runs = [measure(code) for _ in range(args.repeat)]
+        medians[name] = statistics.median(ms for ms, _ in runs)
+        print(f"{name:<42}{medians[name]:>12.1f}  {runs[-1][1]}")
+
+    if args.max_ms is not None and medians["import banxico_sie"] > args.max_ms:
+        sys.exit(f"import banxico_sie tardó {medians['import banxico_sie']:.1f} ms "
+                 f"(presupuesto: {args.max_ms} ms)")
+
+
+if __name__ == "__main__":
+    main()
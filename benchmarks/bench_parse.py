@@ -0,0 +1,106 @@
+"""
+Benchmark de decodificación JSON y parseo de respuestas grandes
+
+Compara, sobre una respuesta sintética de N años, la decodificación con
+`response.json()` de requests contra el decodificador del paquete (orjson si
+está instalado), y el parseo actual de `_parse_datos` contra la
+implementación anterior (que recalculaba los campos de la moneda en cada fila).
+
+Uso:
+    python benchmarks/bench_parse.py
+    python benchmarks/bench_parse.py --years 30 --repeat 10
+"""
+
+import argparse
+import json
+import os
+import sys
+import timeit
+from datetime import date
+
+import requests
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from banxico_sie import BanxicoSIEClient, Currency  # noqa: E402
+from banxico_sie import _json  # noqa: E402
+
+from fake_sie import synthetic_response  # noqa: E402
+
+
+def parse_datos_reference(series_data, currency):
+    """`_parse_datos` antes de la optimización, como referencia"""
+    results = []
+    for item in series_data:
+        valor = None
+        if item["dato"]:
+            try:
+                valor = float(item["dato"])
+            except (ValueError, TypeError):
+                valor = None
+
+        results.append({
+            "fecha": item["fecha"],
+            "moneda": currency.name.replace("_SPOT", ""),
+            "moneda_nombre": currency.name_es,
+            "simbolo": currency.symbol,
+            "valor": valor,
+            "tipo": currency.tipo
+        })
+
+    return results
+
+
+def make_requests_response(body: bytes) -> requests.Response:
+    """`requests.Response` con el cuerpo ya descargado, como lo deja `Session.get`"""
+    response = requests.Response()
+    response._content = body
+    response.status_code = 200
+    response.headers["Content-Type"] = "application/json"
+    return response
+
+
+def best_ms(fn, repeat: int) -> float:
+    return min(timeit.repeat(fn, number=1, repeat=repeat)) * 1000
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--years", type=int, default=20, help="años de datos en la respuesta")
+    parser.add_argument("--repeat", type=int, default=5, help="repeticiones (se toma la mejor)")
+    args = parser.parse_args(argv)
+
+    end = date(2024, 12, 31)
+    start = date(end.year - args.years + 1, 1, 1)
+    currency = Currency.USD
+    body = json.dumps(synthetic_response([currency.value], start, end)).encode("utf-8")
+    data = json.loads(body)
+    series_data = data["bmx"]["series"][0]["datos"]
+    client = BanxicoSIEClient("benchmark_token")
+    rows = len(series_data)
+
+    print(f"{rows} filas, {len(body) / 1024:.0f} KiB, decodificador: {_json.JSON_BACKEND}")
+    print(f"{'etapa':<40}{'ms':>10}{'filas/s':>14}")
+    print("-" * 64)
+
+    measurements = [
+        ("decode: response.json() (antes)", lambda: make_requests_response(body).json()),
+        (f"decode: {_json.JSON_BACKEND}.loads(bytes)", lambda: client.json_loads(body)),
+        ("parse: _parse_datos (antes)", lambda: parse_datos_reference(series_data, currency)),
+        ("parse: _parse_datos", lambda: client._parse_datos(series_data, currency)),
+        ("parse: as_series", lambda: client._parse_datos(series_data, currency, as_series=True)),
+        (
+            "total: antes",
+            lambda: parse_datos_reference(
+                make_requests_response(body).json()["bmx"]["series"][0]["datos"], currency
+            ),
+        ),
+        ("total: ahora", lambda: client._parse_response(client._decode_body(body), currency)),
+    ]
+    for name, fn in measurements:
+        ms = best_ms(fn, args.repeat)
+        print(f"{name:<40}{ms:>10.2f}{rows / ms * 1000:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
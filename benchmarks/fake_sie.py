@@ -0,0 +1,237 @@
+"""
+Servidor local que imita la API del SIE de Banxico para benchmarks
+
+Responde las rutas `/series/{ids}/datos/{inicio}/{fin}` y
+`/series/{ids}/datos/oportuno` con datos sintéticos (un dato por día hábil),
+con latencia, respuestas 429 y errores 5xx inyectables.
+
+`/stats` regresa los contadores del servidor (`?reset=1` los reinicia).
+
+Uso en el mismo proceso:
+    >>> with FakeSIEServer(latency=0.02, error_rate=0.01) as server:
+    ...     client = BanxicoSIEClient("token", base_url=server.url)
+
+O como proceso aparte (imprime la URL base y atiende hasta Ctrl+C):
+    python benchmarks/fake_sie.py --latency 0.02 --rate-limit-every 10
+"""
+
+import argparse
+
+import json
+import random
+import threading
+import time
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+
+
+SERIES_PATH = "/SieAPIRest/service/v1/series"
+STATS_PATH = "/stats"
+
+
+def synthetic_datos(series_id: str, start: date, end: date) -> List[Dict]:
+    """
+    Genera los datos de una serie: un valor determinista por día hábil
+
+    Args:
+        series_id: ID de la serie (define el nivel del tipo de cambio)
+        start: Fecha inicial (inclusive)
+        end: Fecha final (inclusive)
+
+    Returns:
+        Lista de {"fecha": "dd/mm/yyyy", "dato": str} como en el SIE
+    """
+    base = 10 + sum(map(ord, series_id)) % 20
+    datos = []
+    day = start
+    one_day = timedelta(days=1)
+    while day <= end:
+        if day.weekday() < 5:
+            value = base + (day.toordinal() % 997) / 1000
+            datos.append({"fecha": day.strftime("%d/%m/%Y"), "dato": f"{value:.4f}"})
+        day += one_day
+    return datos
+
+
+def synthetic_response(series_ids: List[str], start: date, end: date) -> Dict:
+    """Respuesta `bmx.series` completa para varias series"""
+    return {"bmx": {"series": [
+        {
+            "idSerie": series_id,
+            "titulo": f"Serie sintética {series_id}",
+            "datos": synthetic_datos(series_id, start, end),
+        }
+        for series_id in series_ids
+    ]}}
+
+
+class FakeSIEServer:
+    """
+    Servidor HTTP (un hilo por petición) con la forma de la API del SIE
+
+    Args:
+        latency: Segundos de espera antes de responder cada petición
+        rate_limit_every: Si es N > 0, una de cada N peticiones responde 429
+        retry_after: Valor del header Retry-After en las respuestas 429
+        error_rate: Probabilidad de responder 503 a una petición
+        seed: Semilla para la inyección de errores
+        host: Interfaz donde escuchar (default: 127.0.0.1)
+        port: Puerto (default: 0, uno libre)
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        rate_limit_every: int = 0,
+        retry_after: float = 0,
+        error_rate: float = 0.0,
+        seed: Optional[int] = 0,
+        host: str = "127.0.0.1",
+        port: int = 0
+    ):
+        self.latency = latency
+        self.rate_limit_every = rate_limit_every
+        self.retry_after = retry_after
+        self.error_rate = error_rate
+        self.requests = 0
+        self.bytes_sent = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """URL base para el argumento `base_url` de los clientes"""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}{SERIES_PATH}"
+
+    def start(self) -> "FakeSIEServer":
+        """Arranca el servidor en un hilo de fondo"""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Detiene el servidor y libera el puerto"""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "FakeSIEServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def _next_fault(self) -> Optional[int]:
+        """Decide si la siguiente petición falla y con qué status"""
+        with self._lock:
+            self.requests += 1
+            if self.rate_limit_every and self.requests % self.rate_limit_every == 0:
+                return 429
+            if self.error_rate and self._random.random() < self.error_rate:
+                return 503
+        return None
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Sin Nagle, para no sumar la espera del ACK retrasado a cada respuesta
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                if self.path.startswith(STATS_PATH):
+                    return self._send_stats()
+
+                if server.latency:
+                    time.sleep(server.latency)
+
+                if not self.headers.get("Bmx-Token"):
+                    return self._send(401, {"error": {"mensaje": "Token inválido"}})
+
+                fault = server._next_fault()
+                if fault == 429:
+                    return self._send(
+                        429, {"error": {"mensaje": "Límite excedido"}},
+                        {"Retry-After": str(server.retry_after)}
+                    )
+                if fault is not None:
+                    return self._send(fault, {"error": {"mensaje": "No disponible"}})
+
+                parts = self.path.split("?")[0][len(SERIES_PATH):].strip("/").split("/")
+                try:
+                    series_ids = parts[0].split(",")
+                    if parts[1:] == ["datos", "oportuno"]:
+                        start = end = date.today() - timedelta(days=1)
+                        while start.weekday() >= 5:
+                            start = end = start - timedelta(days=1)
+                    else:
+                        start, end = date.fromisoformat(parts[2]), date.fromisoformat(parts[3])
+                except (IndexError, ValueError):
+                    return self._send(404, {"error": {"mensaje": "Ruta no encontrada"}})
+
+                self._send(200, synthetic_response(series_ids, start, end))
+
+            def _send(self, status: int, payload: Dict, headers: Optional[Dict] = None):
+                body = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+                with server._lock:
+                    server.bytes_sent += len(body)
+
+            def _send_stats(self):
+                with server._lock:
+                    stats = {"requests": server.requests, "bytes_sent": server.bytes_sent}
+                    if self.path.endswith("reset=1"):
+                        server.requests = server.bytes_sent = 0
+                body = json.dumps(stats).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="SIE de Banxico local para benchmarks")
+    parser.add_argument("--port", type=int, default=0)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--rate-limit-every", type=int, default=0)
+    parser.add_argument("--retry-after", type=float, default=0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    args = parser.parse_args(argv)
+
+    server = FakeSIEServer(
+        latency=args.latency,
+        rate_limit_every=args.rate_limit_every,
+        retry_after=args.retry_after,
+        error_rate=args.error_rate,
+        port=args.port,
+    )
+    print(server.url, flush=True)
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
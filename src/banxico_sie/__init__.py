@@ -1,23 +1,91 @@
-"""
-banxico-sie: Cliente Python para la API de tipos de cambio del SIE de Banxico
-
-Ejemplo de uso:
-    >>> from banxico_sie import BanxicoSIEClient, Currency
-    >>> client = BanxicoSIEClient("tu_token")
-    >>> rate = client.get_rate(Currency.USD)
-    >>> print(f"USD: ${rate['valor']}")
-"""
-
-from .client import BanxicoSIEClient
-from .enums import Currency
-from .exceptions import BanxicoAPIError, BanxicoRateLimitError, BanxicoAuthError
-
-__version__ = "0.1.0"
-__author__ = "Tu Nombre"
-__all__ = [
-    "BanxicoSIEClient",
-    "Currency",
-    "BanxicoAPIError",
-    "BanxicoRateLimitError",
-    "BanxicoAuthError",
-]
+"""
+banxico-sie: Cliente Python para la API de tipos de cambio del SIE de Banxico
+
+Ejemplo de uso:
+    >>> from banxico_sie import BanxicoSIEClient, Currency
+    >>> client = BanxicoSIEClient("tu_token")
+    >>> rate = client.get_rate(Currency.USD)
+    >>> print(f"USD: ${rate['valor']}")
+"""
+
+import importlib
+from typing import TYPE_CHECKING
+
+from .enums import Currency
+from .exceptions import (
+    BanxicoAPIError, BanxicoRateLimitError, BanxicoAuthError, BanxicoCircuitOpenError
+)
+
+if TYPE_CHECKING:
+    from .async_client import AsyncBanxicoSIEClient
+    from .business_days import BusinessCalendar
+    from .cache import RateCache
+    from .client import BanxicoSIEClient
+    from .instrumentation import (
+        OpenTelemetryInstrumentation, PrometheusInstrumentation, RequestEvent
+    )
+    from .prefetch import PrefetchScheduler
+    from .proxy import SIEProxyServer
+    from .ratelimit import CircuitBreaker, RetryPolicy, TokenBucket
+    from .series import RateSeries
+    from .shared_cache import SQLiteRateCache
+    from .store import SQLiteRateStore
+
+__version__ = "0.1.0"
+__author__ = "Tu Nombre"
+__all__ = [
+    "BanxicoSIEClient",
+    "AsyncBanxicoSIEClient",
+    "Currency",
+    "RateSeries",
+    "SQLiteRateStore",
+    "RateCache",
+    "SQLiteRateCache",
+    "BusinessCalendar",
+    "TokenBucket",
+    "RetryPolicy",
+    "CircuitBreaker",
+    "PrefetchScheduler",
+    "SIEProxyServer",
+    "RequestEvent",
+    "PrometheusInstrumentation",
+    "OpenTelemetryInstrumentation",
+    "BanxicoAPIError",
+    "BanxicoRateLimitError",
+    "BanxicoAuthError",
+    "BanxicoCircuitOpenError",
+]
+
+# Los módulos con dependencias pesadas (requests, aiohttp, sqlite3...) se importan
+# la primera vez que se usa alguno de sus nombres (PEP 562), para que
+# `import banxico_sie` sea barato en funciones serverless y scripts cortos.
+_LAZY = {
+    "BanxicoSIEClient": ".client",
+    "AsyncBanxicoSIEClient": ".async_client",
+    "RateSeries": ".series",
+    "SQLiteRateStore": ".store",
+    "RateCache": ".cache",
+    "SQLiteRateCache": ".shared_cache",
+    "BusinessCalendar": ".business_days",
+    "TokenBucket": ".ratelimit",
+    "RetryPolicy": ".ratelimit",
+    "CircuitBreaker": ".ratelimit",
+    "PrefetchScheduler": ".prefetch",
+    "SIEProxyServer": ".proxy",
+    "RequestEvent": ".instrumentation",
+    "PrometheusInstrumentation": ".instrumentation",
+    "OpenTelemetryInstrumentation": ".instrumentation",
+}
+
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
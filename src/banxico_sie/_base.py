@@ -0,0 +1,431 @@
+"""Lógica compartida por los clientes síncrono y asíncrono del SIE"""
+
+import time
+from datetime import datetime, date
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Union, List, Dict, Iterable, Iterator, Optional, Tuple
+
+from . import _json
+from ._dates import format_date, parse_fecha, to_date
+from .enums import Currency
+from .series import RateSeries
+from .exceptions import (
+    BanxicoAPIError,
+    BanxicoAuthError,
+    BanxicoRateLimitError,
+    BanxicoDataNotFoundError,
+)
+
+
+class _BaseSIEClient:
+    """
+    Base de los clientes del SIE: formateo de fechas, URLs, manejo de errores HTTP
+    y parseo de respuestas. No realiza peticiones por sí misma.
+    """
+    
+    BASE_URL = "https://www.banxico.org.mx/SieAPIRest/service/v1/series"
+    
+    def __init__(
+        self,
+        api_token: str,
+        timeout: int = 30,
+        json_loads: Optional[Callable[[bytes], Any]] = None,
+        parse_dates: bool = False,
+        base_url: Optional[str] = None
+    ):
+        if not api_token:
+            raise ValueError("Se requiere un token de API válido")
+        
+        self.api_token = api_token
+        self.timeout = timeout
+        self.json_loads = json_loads or _json.loads
+        self.parse_dates = parse_dates
+        if base_url is not None:
+            self.BASE_URL = base_url.rstrip("/")
+    
+    def _format_date(self, date_obj: Union[str, date, datetime]) -> str:
+        """
+        Convierte fecha a formato YYYY-MM-DD requerido por la API
+        
+        Los strings 'YYYY-MM-DD' y 'dd/mm/yyyy' se convierten sin dateutil y los
+        resultados se memorizan; otros formatos se interpretan con el día primero.
+        
+        Args:
+            date_obj: Fecha como string, date o datetime
+            
+        Returns:
+            Fecha en formato YYYY-MM-DD
+        """
+        return format_date(date_obj)
+    
+    def _to_date(self, date_obj: Union[str, date, datetime]) -> date:
+        """
+        Convierte fecha a objeto date
+        
+        Args:
+            date_obj: Fecha como string, date o datetime
+            
+        Returns:
+            Fecha como date
+        """
+        return to_date(date_obj)
+    
+    def _build_url(self, series_ids: List[str], start_date: str, end_date: str) -> str:
+        """
+        Construye la URL de consulta de datos de una o varias series
+        
+        Args:
+            series_ids: Lista de IDs de series a consultar
+            start_date: Fecha inicial en formato YYYY-MM-DD
+            end_date: Fecha final en formato YYYY-MM-DD
+            
+        Returns:
+            URL de la API
+        """
+        series_str = ",".join(series_ids)
+        return f"{self.BASE_URL}/{series_str}/datos/{start_date}/{end_date}"
+    
+    def _build_latest_url(self, series_ids: List[str]) -> str:
+        """
+        Construye la URL del dato más reciente ("oportuno") de una o varias series
+        
+        Args:
+            series_ids: Lista de IDs de series a consultar
+            
+        Returns:
+            URL de la API
+        """
+        series_str = ",".join(series_ids)
+        return f"{self.BASE_URL}/{series_str}/datos/oportuno"
+    
+    def _raise_for_status(
+        self,
+        status_code: int,
+        response: Optional[Dict],
+        retry_after: Optional[str] = None
+    ) -> None:
+        """
+        Lanza la excepción correspondiente a un código de error HTTP
+        
+        Args:
+            status_code: Código HTTP de la respuesta
+            response: Cuerpo JSON de la respuesta (si lo hay)
+            retry_after: Valor del encabezado `Retry-After` (si lo hay)
+            
+        Raises:
+            BanxicoAuthError: Si el token es inválido
+            BanxicoRateLimitError: Si se excede el límite de peticiones
+            BanxicoAPIError: Para otros errores de la API
+        """
+        if status_code == 401:
+            raise BanxicoAuthError(status_code=status_code, response=response)
+        elif status_code == 429:
+            raise BanxicoRateLimitError(
+                status_code=status_code,
+                response=response,
+                retry_after=self._parse_retry_after(retry_after)
+            )
+        elif status_code >= 400:
+            raise BanxicoAPIError(
+                f"Error HTTP {status_code}",
+                status_code=status_code,
+                response=response
+            )
+    
+    def _decode_body(self, content: bytes) -> Dict:
+        """
+        Decodifica el cuerpo JSON de una respuesta con `json_loads`
+        
+        Raises:
+            BanxicoAPIError: Si el cuerpo no es JSON válido
+        """
+        try:
+            return self.json_loads(content)
+        except ValueError as e:
+            raise BanxicoAPIError(f"Respuesta inválida de Banxico: {e}")
+    
+    def _decode_error_body(self, content: bytes) -> Optional[Dict]:
+        """Cuerpo JSON de una respuesta de error, o None si está vacío o no es JSON"""
+        if not content:
+            return None
+        try:
+            return self.json_loads(content)
+        except ValueError:
+            return None
+    
+    def _parse_retry_after(self, value: Optional[str]) -> Optional[float]:
+        """
+        Convierte el encabezado `Retry-After` (segundos o fecha HTTP) a segundos
+        
+        Args:
+            value: Valor del encabezado
+            
+        Returns:
+            Segundos a esperar, o None si no hay encabezado o no es válido
+        """
+        if not isinstance(value, str) or not value:
+            return None
+        try:
+            return max(float(value), 0.0)
+        except ValueError:
+            pass
+        try:
+            return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+        except (TypeError, ValueError):
+            return None
+    
+    def _parse_response(
+        self,
+        data: Dict,
+        currency: Currency,
+        as_series: bool = False
+    ) -> Union[List[Dict], RateSeries]:
+        """
+        Parsea la respuesta JSON de la API
+        
+        Args:
+            data: Respuesta JSON de la API
+            currency: Moneda consultada
+            as_series: Si True, regresa un RateSeries en lugar de lista de dicts
+            
+        Returns:
+            Lista de diccionarios con los datos parseados (o RateSeries)
+            
+        Raises:
+            BanxicoDataNotFoundError: Si no hay datos disponibles
+            BanxicoAPIError: Si hay error parseando la respuesta
+        """
+        try:
+            series_data = data["bmx"]["series"][0]["datos"]
+            
+            if not series_data:
+                raise BanxicoDataNotFoundError(
+                    f"No hay datos disponibles para {currency.name_es}"
+                )
+            
+            return self._parse_datos(series_data, currency, as_series)
+            
+        except (KeyError, IndexError) as e:
+            raise BanxicoAPIError(f"Error parseando respuesta de Banxico: {e}")
+    
+    def _parse_series_response(
+        self,
+        data: Dict,
+        currencies: List[Currency],
+        as_series: bool = False
+    ) -> Dict[Currency, Union[List[Dict], RateSeries]]:
+        """
+        Parsea una respuesta con varias series, indexándolas por idSerie
+        
+        Args:
+            data: Respuesta JSON de la API
+            currencies: Monedas consultadas
+            as_series: Si True, cada moneda se regresa como RateSeries
+            
+        Returns:
+            Dict de Currency a lista de datos parseados, en el orden de `currencies`.
+            Las series sin datos se omiten.
+            
+        Raises:
+            BanxicoAPIError: Si hay error parseando la respuesta
+        """
+        series_by_id = self._extract_series(data)
+        
+        results = {}
+        for currency in currencies:
+            series_data = series_by_id.get(currency.value)
+            if series_data:
+                results[currency] = self._parse_datos(series_data, currency, as_series)
+        
+        return results
+    
+    def _extract_series(self, data: Dict) -> Dict[str, List[Dict]]:
+        """
+        Extrae los datos crudos de cada serie de la respuesta, indexados por idSerie
+        
+        Args:
+            data: Respuesta JSON de la API
+            
+        Returns:
+            Dict de idSerie a su lista `datos` (vacía si la serie no trae datos)
+            
+        Raises:
+            BanxicoAPIError: Si hay error parseando la respuesta
+        """
+        try:
+            return {serie["idSerie"]: serie.get("datos") or [] for serie in data["bmx"]["series"]}
+        except (KeyError, TypeError) as e:
+            raise BanxicoAPIError(f"Error parseando respuesta de Banxico: {e}")
+    
+    def _parse_datos(
+        self,
+        series_data: List[Dict],
+        currency: Currency,
+        as_series: bool = False
+    ) -> Union[List[Dict], RateSeries]:
+        """
+        Convierte los datos crudos de una serie en diccionarios de tipo de cambio
+        
+        Args:
+            series_data: Lista `datos` de una serie de la respuesta
+            currency: Moneda de la serie
+            as_series: Si True, regresa un RateSeries columnar
+            
+        Returns:
+            Lista de diccionarios con los datos parseados (o RateSeries)
+        """
+        if as_series:
+            return RateSeries.from_datos(currency, series_data)
+        
+        return list(self._iter_datos(series_data, currency))
+    
+    def _iter_datos(self, series_data: Iterable[Dict], currency: Currency) -> Iterator[Dict]:
+        """
+        Produce los diccionarios de tipo de cambio de los datos crudos de una serie
+        
+        Args:
+            series_data: Elementos `datos` de una serie (lista o iterador)
+            currency: Moneda de la serie
+            
+        Yields:
+            Diccionarios con los datos parseados
+        """
+        # Los campos de la moneda son iguales en todas las filas: se calculan una vez
+        moneda = currency.name.replace("_SPOT", "")
+        moneda_nombre = currency.name_es
+        simbolo = currency.symbol
+        tipo = currency.tipo
+        
+        parse_dates = self.parse_dates
+        for item in series_data:
+            # Manejar valores N/E (No Existe) u otros no numéricos
+            dato = item["dato"]
+            try:
+                valor = float(dato) if dato else None
+            except (ValueError, TypeError):
+                valor = None
+            
+            yield {
+                "fecha": parse_fecha(item["fecha"]) if parse_dates else item["fecha"],
+                "moneda": moneda,
+                "moneda_nombre": moneda_nombre,
+                "simbolo": simbolo,
+                "valor": valor,
+                "tipo": tipo
+            }
+    
+    def _merge_responses(self, responses: List[Dict]) -> Dict:
+        """
+        Combina respuestas de ventanas consecutivas en una sola respuesta
+        
+        Los `datos` de cada serie se concatenan en el orden de las respuestas y
+        se descartan fechas repetidas en las fronteras entre ventanas.
+        
+        Args:
+            responses: Respuestas JSON de la API, en orden de fecha
+            
+        Returns:
+            Respuesta JSON con el mismo formato que la API
+        """
+        merged = {}
+        seen = {}
+        for data in responses:
+            for series_id, series_data in self._extract_series(data).items():
+                if series_id not in merged:
+                    merged[series_id] = []
+                    seen[series_id] = set()
+                for item in series_data:
+                    if item["fecha"] not in seen[series_id]:
+                        seen[series_id].add(item["fecha"])
+                        merged[series_id].append(item)
+        
+        return {"bmx": {"series": [
+            {"idSerie": series_id, "datos": series_data}
+            for series_id, series_data in merged.items()
+        ]}}
+    
+    def _cached_latest(
+        self,
+        currencies: List[Currency]
+    ) -> Tuple[Dict[Currency, Dict], List[Currency]]:
+        """
+        Separa las monedas cuyo dato más reciente está en caché de las que faltan
+        
+        Args:
+            currencies: Monedas a consultar
+            
+        Returns:
+            Tupla (dict de Currency a dato en caché, lista de monedas faltantes)
+        """
+        if self.cache is None:
+            return {}, list(currencies)
+        
+        cached_results = {}
+        missing = []
+        for currency in currencies:
+            cached = self.cache.get((currency.value, "latest"))
+            if cached is not None:
+                cached_results[currency] = dict(cached)
+            else:
+                missing.append(currency)
+        return cached_results, missing
+    
+    def _latest_results(
+        self,
+        data: Dict,
+        currencies: List[Currency],
+        cached_results: Dict[Currency, Dict]
+    ) -> Dict[Currency, Dict]:
+        """
+        Parsea una respuesta "oportuno", la guarda en caché y la une con lo cacheado
+        
+        Args:
+            data: Respuesta JSON de la API (None si todo estaba en caché)
+            currencies: Monedas consultadas, en el orden deseado
+            cached_results: Datos obtenidos de la caché
+            
+        Returns:
+            Dict de Currency a su dato más reciente; las monedas sin dato se omiten
+            
+        Raises:
+            BanxicoDataNotFoundError: Si ninguna moneda tiene datos
+        """
+        results = dict(cached_results)
+        if data is not None:
+            fetched = self._parse_series_response(data, currencies)
+            for currency, rates in fetched.items():
+                results[currency] = rates[-1]
+            if self.cache is not None:
+                for currency, rates in fetched.items():
+                    self.cache.set(
+                        (currency.value, "latest"), dict(rates[-1]),
+                        self._latest_expires_at(rates[-1]["fecha"])
+                    )
+        
+        if not results:
+            raise BanxicoDataNotFoundError("No hay datos disponibles")
+        
+        return {currency: results[currency] for currency in currencies if currency in results}
+    
+    def _latest_expires_at(self, fecha: Union[str, date]) -> float:
+        """
+        Expiración en caché de un dato "oportuno" según su fecha
+        
+        Sólo se guarda hasta la siguiente publicación si ya es el dato de la
+        última publicación (días hábiles del `calendar` del cliente, si tiene);
+        un dato anterior se vuelve a pedir pronto.
+        
+        Args:
+            fecha: Fecha de la observación ('dd/mm/yyyy' o date)
+        """
+        calendar = getattr(self, "calendar", None)
+        return self.cache.expires_at_for_latest(
+            to_date(fecha), calendar.is_business_day if calendar is not None else None
+        )
+    
+    def _unique_currencies(self, currencies: List[Currency]) -> List[Currency]:
+        """Quita monedas repetidas conservando el orden; exige al menos una"""
+        currencies = list(dict.fromkeys(currencies))
+        if not currencies:
+            raise ValueError("Se requiere al menos una moneda")
+        return currencies
@@ -0,0 +1,73 @@
+"""Conversión rápida de fechas: ISO y dd/mm/yyyy sin dateutil, con memoización"""
+
+import re
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Union
+
+
+# ISO con o sin hora ('2024-12-01T10:30:00Z', '2024-12-01 10:30'): sólo importa la fecha
+_ISO_RE = re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2})(?:[T ].*)?", re.DOTALL)
+_DMY_RE = re.compile(r"(\d{1,2})/(\d{1,2})/(\d{4})")
+# Empieza con el año: '2024/12/01', '2024.12.01 10:30' o compacto '20241201T1030'
+_YEAR_FIRST_RE = re.compile(r"\d{4}(?:\D|\d{4}(?:\D|$))")
+
+
+@lru_cache(maxsize=4096)
+def parse_date_string(value: str) -> date:
+    """
+    Convierte un string a date
+
+    'YYYY-MM-DD' (también con hora) y 'dd/mm/yyyy' (el formato del SIE) se
+    resuelven sin dateutil; cualquier otro formato se delega a dateutil, con
+    el día primero salvo que el string empiece con el año.
+
+    Args:
+        value: Fecha como string
+
+    Returns:
+        Fecha como date
+
+    Raises:
+        ValueError: Si el string no es una fecha válida
+    """
+    text = value.strip()
+    match = _ISO_RE.fullmatch(text)
+    if match is not None:
+        year, month, day = match.groups()
+        return date(int(year), int(month), int(day))
+
+    match = _DMY_RE.fullmatch(text)
+    if match is not None:
+        day, month, year = match.groups()
+        return date(int(year), int(month), int(day))
+
+    from dateutil.parser import parse
+
+    return parse(text, dayfirst=_YEAR_FIRST_RE.match(text) is None).date()
+
+
+def to_date(value: Union[str, date, datetime]) -> date:
+    """Convierte string, date o datetime a date"""
+    if isinstance(value, str):
+        return parse_date_string(value)
+    if isinstance(value, datetime):
+        return value.date()
+    return value
+
+
+@lru_cache(maxsize=4096)
+def _format_date_string(value: str) -> str:
+    return parse_date_string(value).strftime("%Y-%m-%d")
+
+
+def format_date(value: Union[str, date, datetime]) -> str:
+    """Convierte string, date o datetime al formato YYYY-MM-DD de la API"""
+    if isinstance(value, str):
+        return _format_date_string(value)
+    return value.strftime("%Y-%m-%d")
+
+
+def parse_fecha(fecha: str) -> date:
+    """Convierte un `fecha` 'dd/mm/yyyy' de una respuesta del SIE a date"""
+    return date(int(fecha[6:10]), int(fecha[3:5]), int(fecha[0:2]))
@@ -0,0 +1,32 @@
+"""Decodificador JSON: orjson si está instalado, si no la biblioteca estándar"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - dependencia opcional
+    orjson = None
+
+
+JSON_BACKEND = "json" if orjson is None else "orjson"
+
+
+def loads(content: Union[bytes, str]) -> Any:
+    """
+    Decodifica un cuerpo JSON directamente desde bytes (sin decodificar a str)
+
+    Args:
+        content: Cuerpo de la respuesta
+
+    Returns:
+        Objeto decodificado
+
+    Raises:
+        ValueError: Si el contenido no es JSON válido
+    """
+    return json.loads(content)
+
+
+if orjson is not None:
+    loads = orjson.loads  # noqa: F811
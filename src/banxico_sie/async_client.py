@@ -0,0 +1,337 @@
+"""Cliente asíncrono (asyncio + aiohttp) para la API del SIE de Banxico"""
+
+import asyncio
+from datetime import datetime, date
+from typing import Any, Callable, Union, List, Dict, Optional
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - dependencia opcional
+    aiohttp = None
+
+from ._base import _BaseSIEClient
+from .cache import RateCache, _NotFound
+from .enums import Currency
+from .exceptions import BanxicoAPIError, BanxicoDataNotFoundError
+
+
+class AsyncBanxicoSIEClient(_BaseSIEClient):
+    """
+    Cliente asíncrono para consultar tipos de cambio del SIE de Banxico
+
+    Usa una sola sesión aiohttp con un pool de conexiones keep-alive y limita
+    el número de peticiones simultáneas con un semáforo. Requiere el extra
+    `async` (`pip install banxico-sie-xp[async]`).
+
+    Args:
+        api_token: Token de API de Banxico
+        timeout: Timeout para las peticiones HTTP en segundos (default: 30)
+        max_concurrency: Máximo de peticiones simultáneas a la API (default: 10)
+        pool_size: Máximo de conexiones abiertas en el pool (default: 100)
+        keepalive_timeout: Segundos que una conexión ociosa se mantiene abierta (default: 30)
+        cache: Caché en memoria opcional para `get_rate` y `get_latest`
+        json_loads: Función que decodifica el cuerpo (bytes) de las respuestas
+            (default: orjson si está instalado, si no `json.loads`)
+        parse_dates: Si True, `fecha` se regresa como `datetime.date` (convertida una
+            sola vez al procesar la respuesta) en lugar de string 'dd/mm/yyyy'
+        base_url: URL base de la API, p. ej. la de un proxy `banxico-sie serve`
+            (default: la API pública del SIE)
+
+    Example:
+        >>> async with AsyncBanxicoSIEClient("tu_token_aqui") as client:
+        ...     rate = await client.get_rate(Currency.USD)
+        ...     print(f"USD: ${rate['valor']}")
+    """
+
+    def __init__(
+        self,
+        api_token: str,
+        timeout: int = 30,
+        max_concurrency: int = 10,
+        pool_size: int = 100,
+        keepalive_timeout: float = 30,
+        cache: Optional[RateCache] = None,
+        json_loads: Optional[Callable[[bytes], Any]] = None,
+        parse_dates: bool = False,
+        base_url: Optional[str] = None
+    ):
+        if aiohttp is None:
+            raise ImportError(
+                "AsyncBanxicoSIEClient requiere aiohttp: pip install banxico-sie-xp[async]"
+            )
+        if max_concurrency <= 0:
+            raise ValueError("max_concurrency debe ser mayor a cero")
+
+        super().__init__(api_token, timeout, json_loads, parse_dates, base_url)
+
+        self.max_concurrency = max_concurrency
+        self.pool_size = pool_size
+        self.keepalive_timeout = keepalive_timeout
+        self.cache = cache
+        self._session = None
+        self._semaphore = None
+
+    async def __aenter__(self) -> "AsyncBanxicoSIEClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Cierra la sesión HTTP y sus conexiones"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+            self._semaphore = None
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        """Crea la sesión (dentro del event loop) la primera vez que se usa"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.pool_size,
+                keepalive_timeout=self.keepalive_timeout
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers={
+                    "Bmx-Token": self.api_token,
+                    "Accept": "application/json"
+                }
+            )
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._session
+
+    async def _make_request(self, series_ids: List[str], start_date: str, end_date: str) -> Dict:
+        """
+        Realiza la petición HTTP a la API de Banxico
+
+        Args:
+            series_ids: Lista de IDs de series a consultar
+            start_date: Fecha inicial en formato YYYY-MM-DD
+            end_date: Fecha final en formato YYYY-MM-DD
+
+        Returns:
+            Respuesta JSON de la API
+
+        Raises:
+            BanxicoAuthError: Si el token es inválido
+            BanxicoRateLimitError: Si se excede el límite de peticiones
+            BanxicoAPIError: Para otros errores de la API
+        """
+        return await self._get_json(self._build_url(series_ids, start_date, end_date))
+
+    async def _get_json(self, url: str) -> Dict:
+        """Realiza un GET a la API y regresa el cuerpo JSON (ver `_make_request`)"""
+        session = self._get_session()
+
+        try:
+            async with self._semaphore:
+                async with session.get(url) as response:
+                    status_code = response.status
+                    content = await response.read()
+        except asyncio.TimeoutError:
+            raise BanxicoAPIError("Timeout al conectar con la API de Banxico")
+        except aiohttp.ClientConnectionError:
+            raise BanxicoAPIError("Error de conexión con la API de Banxico")
+        except aiohttp.ClientError as e:
+            raise BanxicoAPIError(f"Error en la petición: {str(e)}")
+
+        # Manejo de errores HTTP
+        if status_code >= 400:
+            self._raise_for_status(status_code, self._decode_error_body(content))
+
+        return self._decode_body(content)
+
+    async def get_rate(
+        self,
+        currency: Currency,
+        fecha: Optional[Union[str, date, datetime]] = None
+    ) -> Dict:
+        """
+        Obtiene el tipo de cambio para una fecha específica
+
+        Args:
+            currency: Moneda a consultar
+            fecha: Fecha de consulta (default: fecha actual)
+
+        Returns:
+            Dict con la información del tipo de cambio (mismo formato que el cliente síncrono)
+
+        Raises:
+            BanxicoDataNotFoundError: Si no hay datos para la fecha
+            BanxicoAPIError: Para otros errores
+        """
+        if fecha is None:
+            fecha = datetime.now()
+
+        fecha_str = self._format_date(fecha)
+        if self.cache is None:
+            return await self._fetch_rate(currency, fecha_str)
+
+        cache_key = (currency.value, fecha_str)
+        cached = self.cache.get(cache_key)
+        if isinstance(cached, _NotFound):
+            raise BanxicoDataNotFoundError(cached.message)
+        if cached is not None:
+            return dict(cached)
+
+        fecha_date = self._to_date(fecha_str)
+        try:
+            result = await self._fetch_rate(currency, fecha_str)
+        except BanxicoDataNotFoundError as e:
+            self.cache.set_not_found(cache_key, fecha_date, e.message)
+            raise
+        self.cache.set(cache_key, dict(result), self.cache.expires_at_for(fecha_date))
+        return result
+
+    async def _fetch_rate(self, currency: Currency, fecha_str: str) -> Dict:
+        """Obtiene el tipo de cambio de una fecha (YYYY-MM-DD) sin pasar por la caché"""
+        data = await self._make_request([currency.value], fecha_str, fecha_str)
+        results = self._parse_response(data, currency)
+
+        if not results:
+            raise BanxicoDataNotFoundError(
+                f"No hay datos disponibles para {currency.name_es} en {fecha_str}"
+            )
+
+        return results[0]
+
+    async def get_rates_range(
+        self,
+        currency: Currency,
+        start_date: Union[str, date, datetime],
+        end_date: Union[str, date, datetime]
+    ) -> List[Dict]:
+        """
+        Obtiene tipos de cambio para un rango de fechas
+
+        Args:
+            currency: Moneda a consultar
+            start_date: Fecha inicial del rango
+            end_date: Fecha final del rango
+
+        Returns:
+            Lista de dicts con los tipos de cambio para cada fecha
+
+        Raises:
+            BanxicoDataNotFoundError: Si no hay datos para el rango
+            BanxicoAPIError: Para otros errores
+        """
+        start_str = self._format_date(start_date)
+        end_str = self._format_date(end_date)
+
+        data = await self._make_request([currency.value], start_str, end_str)
+        return self._parse_response(data, currency)
+
+    async def get_latest(self, currency: Currency) -> Dict:
+        """
+        Obtiene el tipo de cambio más reciente disponible (endpoint "oportuno")
+
+        Args:
+            currency: Moneda a consultar
+
+        Returns:
+            Dict con el tipo de cambio más reciente
+
+        Raises:
+            BanxicoDataNotFoundError: Si la serie no tiene datos
+            BanxicoAPIError: Para otros errores
+        """
+        return (await self.get_latest_many([currency]))[currency]
+
+    async def get_latest_many(self, currencies: List[Currency]) -> Dict[Currency, Dict]:
+        """
+        Obtiene el tipo de cambio más reciente de varias monedas en una sola petición
+
+        Args:
+            currencies: Monedas a consultar
+
+        Returns:
+            Dict de Currency a su tipo de cambio más reciente; las monedas sin
+            datos se omiten
+
+        Raises:
+            BanxicoDataNotFoundError: Si ninguna moneda tiene datos
+            BanxicoAPIError: Para otros errores
+        """
+        currencies = self._unique_currencies(currencies)
+        cached_results, missing = self._cached_latest(currencies)
+
+        data = None
+        if missing:
+            data = await self._get_json(self._build_latest_url([c.value for c in missing]))
+
+        return self._latest_results(data, currencies, cached_results)
+
+    async def get_rates_many(
+        self,
+        currencies: List[Currency],
+        fecha: Optional[Union[str, date, datetime]] = None
+    ) -> Dict[Currency, Dict]:
+        """
+        Obtiene el tipo de cambio de varias monedas en una sola petición HTTP
+
+        Args:
+            currencies: Monedas a consultar
+            fecha: Fecha de consulta (default: fecha actual)
+
+        Returns:
+            Dict de Currency al dict de tipo de cambio; las monedas sin dato se omiten
+
+        Raises:
+            BanxicoDataNotFoundError: Si ninguna moneda tiene datos para la fecha
+            BanxicoAPIError: Para otros errores
+        """
+        if fecha is None:
+            fecha = datetime.now()
+
+        fecha_str = self._format_date(fecha)
+        results = await self._get_series_many(currencies, fecha_str, fecha_str)
+
+        return {currency: rates[0] for currency, rates in results.items()}
+
+    async def get_rates_range_many(
+        self,
+        currencies: List[Currency],
+        start_date: Union[str, date, datetime],
+        end_date: Union[str, date, datetime]
+    ) -> Dict[Currency, List[Dict]]:
+        """
+        Obtiene tipos de cambio de varias monedas para un rango en una sola petición HTTP
+
+        Args:
+            currencies: Monedas a consultar
+            start_date: Fecha inicial del rango
+            end_date: Fecha final del rango
+
+        Returns:
+            Dict de Currency a la lista de tipos de cambio; las monedas sin datos se omiten
+
+        Raises:
+            BanxicoDataNotFoundError: Si ninguna moneda tiene datos para el rango
+            BanxicoAPIError: Para otros errores
+        """
+        start_str = self._format_date(start_date)
+        end_str = self._format_date(end_date)
+
+        return await self._get_series_many(currencies, start_str, end_str)
+
+    async def _get_series_many(
+        self,
+        currencies: List[Currency],
+        start_str: str,
+        end_str: str
+    ) -> Dict[Currency, List[Dict]]:
+        """Consulta varias series en una petición y parsea todas las de la respuesta"""
+        currencies = self._unique_currencies(currencies)
+
+        data = await self._make_request([c.value for c in currencies], start_str, end_str)
+        results = self._parse_series_response(data, currencies)
+
+        if not results:
+            raise BanxicoDataNotFoundError(
+                f"No hay datos disponibles entre {start_str} y {end_str}"
+            )
+
+        return results
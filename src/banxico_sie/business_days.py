@@ -0,0 +1,158 @@
+"""Calendario de días hábiles bancarios en México"""
+
+import threading
+from datetime import date, timedelta
+from typing import Dict, FrozenSet, Iterable, Optional
+
+
+def _easter_sunday(year: int) -> date:
+    """Domingo de Pascua (algoritmo gregoriano anónimo)"""
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    weekday_shift = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * weekday_shift) // 451
+    month, day = divmod(h + weekday_shift - 7 * m + 114, 31)
+    return date(year, month, day + 1)
+
+
+def _nth_monday(year: int, month: int, n: int) -> date:
+    """N-ésimo lunes de un mes"""
+    first = date(year, month, 1)
+    return first + timedelta(days=(7 - first.weekday()) % 7 + 7 * (n - 1))
+
+
+def mexican_bank_holidays(year: int) -> FrozenSet[date]:
+    """
+    Días inhábiles bancarios de un año (además de sábados y domingos)
+
+    Sigue el calendario de la CNBV: días de descanso obligatorio (con los
+    lunes largos vigentes desde 2006/2007), Jueves y Viernes Santo, 2 de
+    noviembre, 12 de diciembre y el día de la transmisión del Poder Ejecutivo.
+
+    Args:
+        year: Año a calcular
+
+    Returns:
+        Conjunto de fechas inhábiles
+    """
+    easter = _easter_sunday(year)
+    holidays = {
+        date(year, 1, 1),
+        _nth_monday(year, 2, 1) if year >= 2006 else date(year, 2, 5),
+        _nth_monday(year, 3, 3) if year >= 2007 else date(year, 3, 21),
+        easter - timedelta(days=3),
+        easter - timedelta(days=2),
+        date(year, 5, 1),
+        date(year, 9, 16),
+        date(year, 11, 2),
+        _nth_monday(year, 11, 3) if year >= 2006 else date(year, 11, 20),
+        date(year, 12, 12),
+        date(year, 12, 25),
+    }
+    # Transmisión del Poder Ejecutivo Federal (cada seis años)
+    if year >= 2024 and (year - 2024) % 6 == 0:
+        holidays.add(date(year, 10, 1))
+    elif year < 2024 and (year - 2018) % 6 == 0:
+        holidays.add(date(year, 12, 1))
+    return frozenset(holidays)
+
+
+class BusinessCalendar:
+    """
+    Calendario precalculado de días hábiles bancarios (días con publicación)
+
+    Permite al cliente descartar sin red las consultas a fines de semana y
+    días festivos, o recorrerlas al día hábil anterior.
+
+    Args:
+        extra_holidays: Días inhábiles adicionales (p. ej. decretos extraordinarios)
+        first_year: Primer año a precalcular (default: 1991)
+        last_year: Último año a precalcular (default: el año siguiente al actual)
+
+    Example:
+        >>> calendar = BusinessCalendar()
+        >>> calendar.is_business_day(date(2024, 12, 25))
+        False
+        >>> client = BanxicoSIEClient("tu_token", calendar=calendar, non_business_day="previous")
+    """
+
+    def __init__(
+        self,
+        extra_holidays: Iterable[date] = (),
+        first_year: int = 1991,
+        last_year: Optional[int] = None
+    ):
+        self.extra_holidays = frozenset(extra_holidays)
+        self._holidays: Dict[int, FrozenSet[date]] = {}
+        self._lock = threading.Lock()
+
+        if last_year is None:
+            last_year = date.today().year + 1
+        for year in range(first_year, last_year + 1):
+            self.holidays(year)
+
+    def holidays(self, year: int) -> FrozenSet[date]:
+        """
+        Días inhábiles (sin contar fines de semana) de un año
+
+        Args:
+            year: Año a consultar
+
+        Returns:
+            Conjunto de fechas inhábiles
+        """
+        holidays = self._holidays.get(year)
+        if holidays is None:
+            with self._lock:
+                holidays = mexican_bank_holidays(year) | {
+                    d for d in self.extra_holidays if d.year == year
+                }
+                self._holidays[year] = holidays
+        return holidays
+
+    def is_business_day(self, day: date) -> bool:
+        """
+        Indica si una fecha es día hábil bancario
+
+        Args:
+            day: Fecha a evaluar
+
+        Returns:
+            True si no es fin de semana ni día inhábil
+        """
+        return day.weekday() < 5 and day not in self.holidays(day.year)
+
+    def previous_business_day(self, day: date, inclusive: bool = True) -> date:
+        """
+        Regresa el día hábil más reciente en (o antes de) una fecha
+
+        Args:
+            day: Fecha de referencia
+            inclusive: Si True y `day` es hábil, regresa `day`
+
+        Returns:
+            Día hábil anterior
+        """
+        if not inclusive:
+            day -= timedelta(days=1)
+        while not self.is_business_day(day):
+            day -= timedelta(days=1)
+        return day
+
+    def has_business_day(self, start: date, end: date) -> bool:
+        """
+        Indica si hay al menos un día hábil en [start, end]
+
+        Args:
+            start: Fecha inicial (inclusive)
+            end: Fecha final (inclusive)
+
+        Returns:
+            True si el rango contiene algún día hábil
+        """
+        return start <= end and self.previous_business_day(end) >= start
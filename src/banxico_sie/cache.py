@@ -0,0 +1,249 @@
+"""Caché en memoria (LRU con expiración) para tipos de cambio"""
+
+import threading
+import time as _time
+from collections import OrderedDict
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Any, Callable, Hashable, NamedTuple, Optional
+
+
+# Hora de la Ciudad de México (sin horario de verano desde 2022)
+MEXICO_CITY_TZ = timezone(timedelta(hours=-6), "America/Mexico_City")
+
+# Banxico determina y publica el FIX a partir de las 12:00 (hora de la Ciudad de México)
+FIX_PUBLICATION_TIME = time(12, 0)
+
+
+class CacheInfo(NamedTuple):
+    """Estadísticas de uso de la caché"""
+
+    hits: int
+    misses: int
+    evictions: int
+    currsize: int
+    maxsize: int
+
+
+class _NotFound(NamedTuple):
+    """Resultado negativo en caché: la consulta no tuvo datos"""
+
+    message: str
+
+
+class RateCache:
+    """
+    Caché LRU acotada para resultados de `get_rate` y `get_latest`
+
+    Las fechas pasadas se consideran inmutables y no expiran; las entradas
+    de hoy (o futuras) expiran en la siguiente hora de publicación del FIX.
+    Las de "más reciente" también, si ya son de la última publicación; si
+    no (el dato del día todavía no aparece), sólo duran `negative_ttl`.
+
+    También se recuerdan las consultas sin datos: para fechas pasadas (días
+    sin publicación) de forma permanente, y para hoy o fechas futuras
+    durante `negative_ttl` segundos, sin pasar de la siguiente publicación.
+
+    Args:
+        maxsize: Número máximo de entradas (default: 1024)
+        publication_time: Hora de publicación diaria del FIX (default: 12:00)
+        tz: Zona horaria de la publicación (default: Ciudad de México)
+        clock: Función que regresa el tiempo actual en segundos epoch
+        stale_ttl: Segundos que una entrada expirada se conserva para servirla
+            como dato viejo mientras se actualiza (default: no se conserva)
+        negative_ttl: Segundos que se recuerda que hoy no tiene datos (default: 300);
+            None desactiva la caché de consultas sin datos
+
+    Example:
+        >>> cache = RateCache(maxsize=512)
+        >>> client = BanxicoSIEClient("tu_token", cache=cache)
+        >>> client.get_latest(Currency.USD)
+        >>> print(cache.info())
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        publication_time: time = FIX_PUBLICATION_TIME,
+        tz: timezone = MEXICO_CITY_TZ,
+        clock: Callable[[], float] = _time.time,
+        stale_ttl: Optional[float] = None,
+        negative_ttl: Optional[float] = 300.0
+    ):
+        if maxsize <= 0:
+            raise ValueError("maxsize debe ser mayor a cero")
+
+        self.maxsize = maxsize
+        self.publication_time = publication_time
+        self.tz = tz
+        self.clock = clock
+        self.stale_ttl = stale_ttl
+        self.negative_ttl = negative_ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Obtiene un valor vigente de la caché
+
+        Args:
+            key: Llave de la entrada
+
+        Returns:
+            El valor guardado, o None si no existe o ya expiró
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                now = self.clock()
+                if expires_at is None or expires_at > now:
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return value
+                if not self._keeps_stale(expires_at, now):
+                    del self._data[key]
+            self.misses += 1
+            return None
+
+    def get_stale(self, key: Hashable) -> Optional[Any]:
+        """
+        Obtiene un valor aunque haya expirado, si sigue dentro de `stale_ttl`
+
+        No cuenta como acierto ni como fallo en las estadísticas.
+
+        Args:
+            key: Llave de la entrada
+
+        Returns:
+            El valor guardado, o None si no existe o ya pasó su ventana `stale_ttl`
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            now = self.clock()
+            if expires_at is None or expires_at > now or self._keeps_stale(expires_at, now):
+                return value
+            del self._data[key]
+            return None
+
+    def _keeps_stale(self, expires_at: float, now: float) -> bool:
+        return self.stale_ttl is not None and expires_at + self.stale_ttl > now
+
+    def set(self, key: Hashable, value: Any, expires_at: Optional[float] = None) -> None:
+        """
+        Guarda un valor, desalojando la entrada menos usada si la caché está llena
+
+        Args:
+            key: Llave de la entrada
+            value: Valor a guardar
+            expires_at: Instante de expiración en segundos epoch (None: no expira)
+        """
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def set_not_found(self, key: Hashable, fecha: date, message: str) -> None:
+        """
+        Recuerda que la consulta de una fecha no tuvo datos
+
+        `get` regresará un `_NotFound` con el mensaje hasta que expire.
+
+        Args:
+            key: Llave de la entrada
+            fecha: Fecha consultada
+            message: Mensaje del BanxicoDataNotFoundError original
+        """
+        if self.negative_ttl is None:
+            return
+        expires_at = None
+        if fecha >= self.today():
+            expires_at = min(self.clock() + self.negative_ttl, self.next_publication())
+        self.set(key, _NotFound(message), expires_at)
+
+    def expires_at_for(self, fecha: date) -> Optional[float]:
+        """
+        Calcula la expiración para el dato de una fecha
+
+        Args:
+            fecha: Fecha del tipo de cambio
+
+        Returns:
+            None para fechas pasadas (inmutables); para hoy o fechas futuras,
+            la siguiente hora de publicación
+        """
+        if fecha < self.today():
+            return None
+        return self.next_publication()
+
+    def expires_at_for_latest(
+        self,
+        fecha: date,
+        is_business_day: Optional[Callable[[date], bool]] = None
+    ) -> float:
+        """
+        Calcula la expiración para un dato "más reciente" (oportuno)
+
+        Args:
+            fecha: Fecha de la observación más reciente
+            is_business_day: Función que indica si un día tiene publicación
+                (default: de lunes a viernes)
+
+        Returns:
+            La siguiente hora de publicación si `fecha` ya es la de la última
+            publicación; si no, `negative_ttl` segundos (sin pasar de la
+            siguiente publicación), para volver a buscar el dato del día
+        """
+        next_publication = self.next_publication()
+        if fecha >= self.publication_day(is_business_day):
+            return next_publication
+        return min(self.clock() + (self.negative_ttl or 0.0), next_publication)
+
+    def publication_day(self, is_business_day: Optional[Callable[[date], bool]] = None) -> date:
+        """
+        Regresa el día de la publicación más reciente que ya ocurrió
+
+        Args:
+            is_business_day: Función que indica si un día tiene publicación
+                (default: de lunes a viernes)
+        """
+        now = datetime.fromtimestamp(self.clock(), self.tz)
+        day = now.date()
+        if now.time() < self.publication_time:
+            day -= timedelta(days=1)
+        while not (is_business_day(day) if is_business_day else day.weekday() < 5):
+            day -= timedelta(days=1)
+        return day
+
+    def next_publication(self) -> float:
+        """Regresa el siguiente instante de publicación del FIX en segundos epoch"""
+        now = datetime.fromtimestamp(self.clock(), self.tz)
+        publication = datetime.combine(now.date(), self.publication_time, tzinfo=self.tz)
+        if publication <= now:
+            publication += timedelta(days=1)
+        return publication.timestamp()
+
+    def today(self) -> date:
+        """Regresa la fecha actual en la zona horaria de publicación"""
+        return datetime.fromtimestamp(self.clock(), self.tz).date()
+
+    def info(self) -> CacheInfo:
+        """Regresa las estadísticas de uso de la caché"""
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.evictions, len(self._data), self.maxsize)
+
+    def clear(self) -> None:
+        """Vacía la caché y reinicia las estadísticas"""
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
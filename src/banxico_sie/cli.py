@@ -0,0 +1,349 @@
+"""
+Línea de comandos `banxico-sie`
+
+Ejemplos:
+    banxico-sie export --currency USD,EUR --from 2000-01-01 --to 2024-12-31 \\
+        --format csv --output tipos.csv
+    banxico-sie serve --port 8080 --shared-cache /tmp/banxico-cache.db
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+from datetime import date, timedelta
+from typing import Dict, List, Optional
+
+from .enums import Currency
+
+
+FIELDS = ["fecha", "moneda", "serie", "valor"]
+
+
+def _parse_currencies(value: str) -> List[Currency]:
+    """'USD,EUR' o 'all' a lista de Currency"""
+    if value.strip().lower() == "all":
+        return list(Currency)
+    try:
+        return [Currency[name.strip().upper()] for name in value.split(",") if name.strip()]
+    except KeyError as e:
+        names = ", ".join(c.name for c in Currency)
+        raise argparse.ArgumentTypeError(f"moneda desconocida {e}; opciones: {names}")
+
+
+def _parse_date(value: str) -> date:
+    from ._dates import parse_date_string
+
+    try:
+        return parse_date_string(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"fecha inválida: {value!r}")
+
+
+class _CsvWriter:
+    """Escribe filas CSV conforme llegan; al reanudar agrega al final del archivo"""
+
+    def __init__(self, path: str, append: bool):
+        exists = append and os.path.exists(path) and os.path.getsize(path) > 0
+        self._file = open(path, "a" if append else "w", newline="", encoding="utf-8")
+        self._writer = csv.DictWriter(self._file, FIELDS)
+        if not exists:
+            self._writer.writeheader()
+
+    @staticmethod
+    def last_dates(path: str) -> Dict[str, date]:
+        _truncate_partial_line(path)
+        last: Dict[str, date] = {}
+        with open(path, newline="", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                _update_last(last, row["moneda"], row["fecha"])
+        return last
+
+    def write(self, row: Dict) -> None:
+        self._writer.writerow(row)
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class _JsonlWriter:
+    """Escribe un objeto JSON por línea; al reanudar agrega al final del archivo"""
+
+    def __init__(self, path: str, append: bool):
+        self._file = open(path, "a" if append else "w", encoding="utf-8")
+
+    @staticmethod
+    def last_dates(path: str) -> Dict[str, date]:
+        _truncate_partial_line(path)
+        last: Dict[str, date] = {}
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                row = json.loads(line)
+                _update_last(last, row["moneda"], row["fecha"])
+        return last
+
+    def write(self, row: Dict) -> None:
+        self._file.write(json.dumps(row, ensure_ascii=False) + "\n")
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class _ParquetWriter:
+    """
+    Escribe un dataset Parquet: un directorio con un archivo por bloque de filas
+
+    Cada bloque se escribe a un temporal y se renombra al completarse, así que
+    una exportación interrumpida sólo pierde el bloque en curso.
+    """
+
+    def __init__(self, path: str, append: bool, rows_per_file: int = 100_000):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise SystemExit(
+                "El formato parquet requiere pyarrow: pip install banxico-sie-xp[parquet]"
+            )
+
+        self._pa = pyarrow
+        self._pq = pyarrow.parquet
+        self._path = path
+        self._rows_per_file = rows_per_file
+        self._schema = pyarrow.schema([
+            ("fecha", pyarrow.date32()),
+            ("moneda", pyarrow.string()),
+            ("serie", pyarrow.string()),
+            ("valor", pyarrow.float64()),
+        ])
+        os.makedirs(path, exist_ok=True)
+        if not append:
+            for name in os.listdir(path):
+                if name.endswith(".parquet"):
+                    os.remove(os.path.join(path, name))
+        self._part = len([n for n in os.listdir(path) if n.endswith(".parquet")])
+        self._columns: Dict[str, list] = {field: [] for field in FIELDS}
+
+    @staticmethod
+    def last_dates(path: str) -> Dict[str, date]:
+        import pyarrow.parquet
+
+        last: Dict[str, date] = {}
+        for name in sorted(os.listdir(path)):
+            if name.endswith(".parquet"):
+                table = pyarrow.parquet.read_table(
+                    os.path.join(path, name), columns=["moneda", "fecha"]
+                )
+                monedas = table.column("moneda").to_pylist()
+                fechas = table.column("fecha").to_pylist()
+                for moneda, fecha in zip(monedas, fechas):
+                    _update_last(last, moneda, fecha.isoformat())
+        return last
+
+    def write(self, row: Dict) -> None:
+        for field in FIELDS:
+            self._columns[field].append(row[field])
+        if len(self._columns["fecha"]) >= self._rows_per_file:
+            self._flush()
+
+    def _flush(self) -> None:
+        if not self._columns["fecha"]:
+            return
+        columns = dict(self._columns)
+        columns["fecha"] = [date.fromisoformat(fecha) for fecha in columns["fecha"]]
+        table = self._pa.Table.from_pydict(columns, schema=self._schema)
+        final = os.path.join(self._path, f"part-{self._part:05d}.parquet")
+        self._pq.write_table(table, final + ".tmp")
+        os.replace(final + ".tmp", final)
+        self._part += 1
+        self._columns = {field: [] for field in FIELDS}
+
+    def close(self) -> None:
+        self._flush()
+
+
+WRITERS = {"csv": _CsvWriter, "jsonl": _JsonlWriter, "parquet": _ParquetWriter}
+
+
+def _update_last(last: Dict[str, date], moneda: str, fecha: str) -> None:
+    fecha_date = date.fromisoformat(fecha)
+    if moneda not in last or fecha_date > last[moneda]:
+        last[moneda] = fecha_date
+
+
+def _truncate_partial_line(path: str) -> None:
+    """Descarta una última línea incompleta (escritura interrumpida)"""
+    with open(path, "rb+") as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        if size == 0:
+            return
+        f.seek(size - 1)
+        if f.read(1) == b"\n":
+            return
+        position = size
+        while position > 0:
+            step = min(4096, position)
+            position -= step
+            f.seek(position)
+            index = f.read(step).rfind(b"\n")
+            if index >= 0:
+                f.truncate(position + index + 1)
+                return
+        f.truncate(0)
+
+
+def _currency_of(rate: Dict, by_key: Dict) -> Currency:
+    """Moneda de un registro (USD y USD_SPOT comparten `moneda`; `tipo` las distingue)"""
+    return by_key[(rate["moneda"], rate["tipo"])]
+
+
+def export(args: argparse.Namespace) -> int:
+    """
+    Exporta las series pedidas a un archivo, en ventanas y sin cargar todo en memoria
+
+    Con `--resume`, lee lo ya escrito, pide sólo desde la última fecha completa y
+    descarta las filas que ya estaban en el archivo.
+    """
+    from .client import BanxicoSIEClient
+    from .exceptions import BanxicoAPIError
+
+    token = args.token or os.environ.get("BANXICO_TOKEN")
+    if not token:
+        print("Falta el token: usa --token o la variable BANXICO_TOKEN", file=sys.stderr)
+        return 2
+
+    currencies = args.currency
+    start, end = args.start, args.end or date.today()
+    writer_class = WRITERS[args.format]
+
+    last: Dict[str, date] = {}
+    if args.resume and os.path.exists(args.output):
+        last = writer_class.last_dates(args.output)
+        pending = [last.get(c.name) for c in currencies]
+        if all(pending):
+            start = max(start, min(pending) + timedelta(days=1))
+        if start > end:
+            print("Nada que exportar: el archivo ya está completo", file=sys.stderr)
+            return 0
+
+    client = BanxicoSIEClient(token, chunk_days=args.chunk_days, parse_dates=True)
+    by_key = {(c.name.replace("_SPOT", ""), c.tipo): c for c in currencies}
+    writer = writer_class(args.output, append=args.resume)
+    rows = 0
+    try:
+        for rate in client.iter_rates_range(currencies, start, end):
+            currency = _currency_of(rate, by_key)
+            if currency.name in last and rate["fecha"] <= last[currency.name]:
+                continue
+            writer.write({
+                "fecha": rate["fecha"].isoformat(),
+                "moneda": currency.name,
+                "serie": currency.value,
+                "valor": rate["valor"],
+            })
+            rows += 1
+    except BanxicoAPIError as e:
+        print(f"Error de la API: {e.message} ({rows} filas escritas; usa --resume para continuar)",
+              file=sys.stderr)
+        return 1
+    finally:
+        writer.close()
+        client.close()
+
+    print(f"{rows} filas escritas en {args.output}", file=sys.stderr)
+    return 0
+
+
+def serve(args: argparse.Namespace) -> int:
+    """
+    Corre un proxy local con caché (ver `SIEProxyServer`) hasta Ctrl+C
+
+    Todos los servicios que apunten `base_url` al proxy comparten su caché, su
+    coalescencia y su cuota de peticiones a la API.
+    """
+    from .cache import RateCache
+    from .client import BanxicoSIEClient
+    from .proxy import SIEProxyServer
+    from .ratelimit import RetryPolicy
+
+    token = args.token or os.environ.get("BANXICO_TOKEN")
+    if not token:
+        print("Falta el token: usa --token o la variable BANXICO_TOKEN", file=sys.stderr)
+        return 2
+
+    if args.shared_cache:
+        from .shared_cache import SQLiteRateCache
+
+        cache = SQLiteRateCache(args.shared_cache, maxsize=args.cache_size)
+    else:
+        cache = RateCache(maxsize=args.cache_size)
+
+    client = BanxicoSIEClient(
+        token, cache=cache, chunk_days=args.chunk_days, retry=RetryPolicy()
+    )
+    proxy = SIEProxyServer(client, host=args.host, port=args.port)
+    print(f"Proxy del SIE en {proxy.url} (usa base_url=\"{proxy.url}\")", file=sys.stderr)
+    try:
+        proxy.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        proxy.stop()
+        client.close()
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="banxico-sie", description="Herramientas para el SIE de Banxico"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    export_parser = commands.add_parser(
+        "export", help="exporta tipos de cambio a CSV, JSON Lines o Parquet"
+    )
+    export_parser.add_argument(
+        "--currency", type=_parse_currencies, required=True,
+        help="monedas separadas por coma (p. ej. USD,EUR) o 'all'"
+    )
+    export_parser.add_argument("--from", dest="start", type=_parse_date, required=True,
+                               help="fecha inicial (YYYY-MM-DD)")
+    export_parser.add_argument("--to", dest="end", type=_parse_date,
+                               help="fecha final (default: hoy)")
+    export_parser.add_argument("--format", choices=sorted(WRITERS), default="csv")
+    export_parser.add_argument("--output", "-o", required=True,
+                               help="archivo de salida (directorio para parquet)")
+    export_parser.add_argument("--resume", action="store_true",
+                               help="continúa una exportación interrumpida")
+    export_parser.add_argument("--chunk-days", type=int, default=366,
+                               help="días por petición a la API (default: 366)")
+    export_parser.add_argument("--token", help="token de la API (default: $BANXICO_TOKEN)")
+    export_parser.set_defaults(handler=export)
+
+    serve_parser = commands.add_parser(
+        "serve", help="proxy HTTP local con caché, compatible con las rutas del SIE"
+    )
+    serve_parser.add_argument("--host", default="127.0.0.1",
+                              help="interfaz donde escuchar (default: 127.0.0.1)")
+    serve_parser.add_argument("--port", type=int, default=8080, help="puerto (default: 8080)")
+    serve_parser.add_argument("--cache-size", type=int, default=4096,
+                              help="entradas máximas en caché (default: 4096)")
+    serve_parser.add_argument("--shared-cache",
+                              help="archivo SQLite para compartir la caché entre procesos")
+    serve_parser.add_argument("--chunk-days", type=int, default=None,
+                              help="divide los rangos largos en ventanas de estos días")
+    serve_parser.add_argument("--token", help="token de la API (default: $BANXICO_TOKEN)")
+    serve_parser.set_defaults(handler=serve)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
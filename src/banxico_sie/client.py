@@ -1,277 +1,1163 @@
-"""Cliente principal para interactuar con la API del SIE de Banxico"""
-
-import requests
-from datetime import datetime, date
-from typing import Union, List, Dict, Optional
-from dateutil.parser import parse as parse_date
-
-from .enums import Currency
-from .exceptions import (
-    BanxicoAPIError,
-    BanxicoAuthError,
-    BanxicoRateLimitError,
-    BanxicoDataNotFoundError,
-)
-
-
-class BanxicoSIEClient:
-    """
-    Cliente para consultar tipos de cambio del Sistema de Información Económica (SIE) de Banxico
-    
-    Args:
-        api_token: Token de API de Banxico (obtener en https://www.banxico.org.mx/SieAPIRest/service/v1/)
-        timeout: Timeout para las peticiones HTTP en segundos (default: 30)
-    
-    Example:
-        >>> client = BanxicoSIEClient("tu_token_aqui")
-        >>> rate = client.get_rate(Currency.USD)
-        >>> print(f"USD: ${rate['valor']}")
-    """
-    
-    BASE_URL = "https://www.banxico.org.mx/SieAPIRest/service/v1/series"
-    
-    def __init__(self, api_token: str, timeout: int = 30):
-        if not api_token:
-            raise ValueError("Se requiere un token de API válido")
-        
-        self.api_token = api_token
-        self.timeout = timeout
-        self.session = requests.Session()
-        self.session.headers.update({
-            "Bmx-Token": api_token,
-            "Accept": "application/json"
-        })
-    
-    def _format_date(self, date_obj: Union[str, date, datetime]) -> str:
-        """
-        Convierte fecha a formato YYYY-MM-DD requerido por la API
-        
-        Args:
-            date_obj: Fecha como string, date o datetime
-            
-        Returns:
-            Fecha en formato YYYY-MM-DD
-        """
-        if isinstance(date_obj, str):
-            date_obj = parse_date(date_obj)
-        return date_obj.strftime("%Y-%m-%d")
-    
-    def _make_request(self, series_ids: List[str], start_date: str, end_date: str) -> Dict:
-        """
-        Realiza la petición HTTP a la API de Banxico
-        
-        Args:
-            series_ids: Lista de IDs de series a consultar
-            start_date: Fecha inicial en formato YYYY-MM-DD
-            end_date: Fecha final en formato YYYY-MM-DD
-            
-        Returns:
-            Respuesta JSON de la API
-            
-        Raises:
-            BanxicoAuthError: Si el token es inválido
-            BanxicoRateLimitError: Si se excede el límite de peticiones
-            BanxicoAPIError: Para otros errores de la API
-        """
-        series_str = ",".join(series_ids)
-        url = f"{self.BASE_URL}/{series_str}/datos/{start_date}/{end_date}"
-        
-        try:
-            response = self.session.get(url, timeout=self.timeout)
-            
-            # Manejo de errores HTTP
-            if response.status_code == 401:
-                raise BanxicoAuthError(
-                    status_code=response.status_code,
-                    response=response.json() if response.content else None
-                )
-            elif response.status_code == 429:
-                raise BanxicoRateLimitError(
-                    status_code=response.status_code,
-                    response=response.json() if response.content else None
-                )
-            elif response.status_code >= 400:
-                raise BanxicoAPIError(
-                    f"Error HTTP {response.status_code}",
-                    status_code=response.status_code,
-                    response=response.json() if response.content else None
-                )
-            
-            response.raise_for_status()
-            return response.json()
-            
-        except requests.exceptions.Timeout:
-            raise BanxicoAPIError("Timeout al conectar con la API de Banxico")
-        except requests.exceptions.ConnectionError:
-            raise BanxicoAPIError("Error de conexión con la API de Banxico")
-        except requests.exceptions.RequestException as e:
-            raise BanxicoAPIError(f"Error en la petición: {str(e)}")
-    
-    def _parse_response(self, data: Dict, currency: Currency) -> List[Dict]:
-        """
-        Parsea la respuesta JSON de la API
-        
-        Args:
-            data: Respuesta JSON de la API
-            currency: Moneda consultada
-            
-        Returns:
-            Lista de diccionarios con los datos parseados
-            
-        Raises:
-            BanxicoDataNotFoundError: Si no hay datos disponibles
-            BanxicoAPIError: Si hay error parseando la respuesta
-        """
-        try:
-            series_data = data["bmx"]["series"][0]["datos"]
-            
-            if not series_data:
-                raise BanxicoDataNotFoundError(
-                    f"No hay datos disponibles para {currency.name_es}"
-                )
-            
-            results = []
-            for item in series_data:
-                # Manejar valores N/E (No Existe) u otros no numéricos
-                valor = None
-                if item["dato"]:
-                    try:
-                        valor = float(item["dato"])
-                    except (ValueError, TypeError):
-                        valor = None
-                
-                results.append({
-                    "fecha": item["fecha"],
-                    "moneda": currency.name.replace("_SPOT", ""),
-                    "moneda_nombre": currency.name_es,
-                    "simbolo": currency.symbol,
-                    "valor": valor,
-                    "tipo": currency.tipo
-                })
-            
-            return results
-            
-        except (KeyError, IndexError) as e:
-            raise BanxicoAPIError(f"Error parseando respuesta de Banxico: {e}")
-    
-    def get_rate(
-        self,
-        currency: Currency,
-        fecha: Optional[Union[str, date, datetime]] = None
-    ) -> Dict:
-        """
-        Obtiene el tipo de cambio para una fecha específica
-        
-        Args:
-            currency: Moneda a consultar (Currency.USD, Currency.USD_PAGOS, Currency.EUR, etc)
-            fecha: Fecha de consulta (default: fecha actual)
-            
-        Returns:
-            Dict con la información del tipo de cambio:
-            {
-                'fecha': '26/12/2024',
-                'moneda': 'USD',
-                'moneda_nombre': 'Dólar estadounidense',
-                'simbolo': '$',
-                'valor': 20.3456,
-                'tipo': 'FIX - Determinación publicada en DOF'
-            }
-            
-        Raises:
-            BanxicoDataNotFoundError: Si no hay datos para la fecha
-            BanxicoAPIError: Para otros errores
-            
-        Example:
-            >>> # USD FIX (por determinación)
-            >>> rate = client.get_rate(Currency.USD)
-            >>> print(f"USD: ${rate['valor']}")
-            
-            >>> # USD para liquidación
-            >>> rate = client.get_rate(Currency.USD_PAGOS)
-            >>> print(f"USD PAGOS: ${rate['valor']}")
-            
-            >>> # Euro
-            >>> rate = client.get_rate(Currency.EUR, fecha="2024-12-01")
-        """
-        if fecha is None:
-            fecha = datetime.now()
-        
-        fecha_str = self._format_date(fecha)
-        data = self._make_request([currency.value], fecha_str, fecha_str)
-        results = self._parse_response(data, currency)
-        
-        if not results:
-            raise BanxicoDataNotFoundError(
-                f"No hay datos disponibles para {currency.name_es} en {fecha_str}"
-            )
-        
-        return results[0]
-    
-    def get_rates_range(
-        self,
-        currency: Currency,
-        start_date: Union[str, date, datetime],
-        end_date: Union[str, date, datetime]
-    ) -> List[Dict]:
-        """
-        Obtiene tipos de cambio para un rango de fechas
-        
-        Args:
-            currency: Moneda a consultar (Currency.USD, Currency.USD_PAGOS, Currency.EUR, etc)
-            start_date: Fecha inicial del rango
-            end_date: Fecha final del rango
-            
-        Returns:
-            Lista de dicts con los tipos de cambio para cada fecha
-            
-        Raises:
-            BanxicoDataNotFoundError: Si no hay datos para el rango
-            BanxicoAPIError: Para otros errores
-            
-        Example:
-            >>> # Histórico USD FIX
-            >>> rates = client.get_rates_range(
-            ...     Currency.USD,
-            ...     start_date="2024-01-01",
-            ...     end_date="2024-01-31"
-            ... )
-            
-            >>> # Histórico USD para liquidación
-            >>> rates = client.get_rates_range(
-            ...     Currency.USD_PAGOS,
-            ...     start_date="2024-12-01",
-            ...     end_date="2024-12-31"
-            ... )
-            
-            >>> for rate in rates:
-            ...     print(f"{rate['fecha']}: ${rate['valor']}")
-        """
-        start_str = self._format_date(start_date)
-        end_str = self._format_date(end_date)
-        
-        data = self._make_request([currency.value], start_str, end_str)
-        results = self._parse_response(data, currency)
-        
-        return results
-    
-    def get_latest(self, currency: Currency) -> Dict:
-        """
-        Obtiene el tipo de cambio más reciente disponible
-        
-        Args:
-            currency: Moneda a consultar (Currency.USD, Currency.USD_PAGOS, Currency.EUR, etc)
-            
-        Returns:
-            Dict con el tipo de cambio más reciente
-            
-        Example:
-            >>> # Último USD FIX
-            >>> latest = client.get_latest(Currency.USD)
-            >>> print(f"Último USD: ${latest['valor']} ({latest['fecha']})")
-            
-            >>> # Último USD para liquidación
-            >>> latest = client.get_latest(Currency.USD_PAGOS)
-            >>> print(f"Último USD PAGOS: ${latest['valor']} ({latest['fecha']})")
-        """
-        return self.get_rate(currency)
-
+"""Cliente principal para interactuar con la API del SIE de Banxico"""
+
+import functools
+import threading
+import time
+import warnings
+import requests
+from requests.adapters import HTTPAdapter
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from datetime import datetime, date, timedelta
+from itertools import groupby
+from operator import itemgetter
+from typing import (
+    TYPE_CHECKING, Any, Callable, Union, List, Dict, Iterable, Iterator, Mapping, Optional,
+    Sequence, Tuple
+)
+
+from ._base import _BaseSIEClient
+from ._dates import parse_fecha
+from .business_days import BusinessCalendar
+from .cache import RateCache, _NotFound
+from .coalesce import SingleFlight
+from .enums import Currency
+from .instrumentation import RequestEvent, _Recorder
+from .ratelimit import CircuitBreaker, RetryPolicy, TokenBucket
+from .series import RateSeries, _numpy, _to_ordinal_array
+from .streaming import iter_series_items
+from .exceptions import BanxicoAPIError, BanxicoDataNotFoundError, BanxicoRateLimitError
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from .store import SQLiteRateStore
+
+
+def _instrumented(operation: str):
+    """Emite un RequestEvent por llamada al método (sólo la llamada más externa)"""
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if not self.hooks:
+                return method(self, *args, **kwargs)
+            with self._observe(operation):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+class BanxicoSIEClient(_BaseSIEClient):
+    """
+    Cliente para consultar tipos de cambio del Sistema de Información Económica (SIE) de Banxico
+    
+    Args:
+        api_token: Token de API de Banxico (obtener en https://www.banxico.org.mx/SieAPIRest/service/v1/)
+        timeout: Timeout para las peticiones HTTP en segundos (default: 30)
+        store: Almacén local opcional; si se indica, los rangos se responden desde
+            disco y sólo se piden a la API los sub-intervalos faltantes
+        cache: Caché en memoria opcional para `get_rate` y `get_latest`; también
+            recuerda las fechas sin datos (ver `RateCache`)
+        chunk_days: Si se indica, los rangos más largos se dividen en ventanas de
+            este número de días que se piden en paralelo (default: sin dividir)
+        max_workers: Máximo de ventanas pedidas en paralelo (default: 4)
+        rate_limiter: Token bucket compartido por todas las peticiones del cliente
+        retry: Política de reintentos para 429, 5xx y errores de red (default: sin reintentos)
+        deadline: Tiempo máximo en segundos por petición a la API, incluyendo
+            esperas del limitador y reintentos (default: sin límite)
+        calendar: Calendario de días hábiles; si se indica, las consultas a días
+            sin publicación se resuelven sin ir a la red
+        non_business_day: Qué hacer con una fecha inhábil cuando hay `calendar`:
+            "raise" lanza BanxicoDataNotFoundError, "previous" usa el día hábil anterior
+        coalesce: Si True (default), las peticiones idénticas concurrentes (mismas
+            series y fechas) comparten una sola llamada HTTP y el JSON decodificado;
+            cada llamada parsea después sus propios resultados
+        pool_connections: Número de hosts cuyo pool de conexiones se conserva (default: 1)
+        pool_maxsize: Máximo de conexiones keep-alive conservadas por host (default: 10)
+        pool_block: Si True, los hilos esperan una conexión libre en lugar de abrir
+            conexiones extra que se descartan al terminar (default: False)
+        hooks: Funciones que reciben un RequestEvent al terminar cada consulta
+            (series, rango, status, duración por fase, bytes, reintentos y caché)
+        json_loads: Función que decodifica el cuerpo (bytes) de las respuestas
+            (default: orjson si está instalado, si no `json.loads`)
+        parse_dates: Si True, `fecha` se regresa como `datetime.date` (convertida una
+            sola vez al procesar la respuesta) en lugar de string 'dd/mm/yyyy'
+        circuit_breaker: Interruptor de circuito; tras fallas repetidas (timeouts,
+            conexión o 5xx) las peticiones fallan de inmediato con
+            BanxicoCircuitOpenError en lugar de esperar el timeout
+        stale_while_revalidate: Si True, `get_rate` y `get_latest` regresan al
+            instante el último dato conocido de la caché cuando ya expiró
+            (marcado con `'stale': True`) y lo actualizan en segundo plano.
+            Requiere una `cache` con `stale_ttl`
+        base_url: URL base de la API, p. ej. la de un proxy `banxico-sie serve`
+            (default: la API pública del SIE)
+    
+    El cliente puede compartirse entre hilos: cada hilo usa su propia
+    `requests.Session`, pero todas montan el mismo pool de conexiones, de modo
+    que las conexiones TLS abiertas se reutilizan entre hilos.
+    
+    Example:
+        >>> client = BanxicoSIEClient("tu_token_aqui")
+        >>> rate = client.get_rate(Currency.USD)
+        >>> print(f"USD: ${rate['valor']}")
+    """
+    
+    def __init__(
+        self,
+        api_token: str,
+        timeout: int = 30,
+        store: Optional["SQLiteRateStore"] = None,
+        cache: Optional[RateCache] = None,
+        chunk_days: Optional[int] = None,
+        max_workers: int = 4,
+        rate_limiter: Optional[TokenBucket] = None,
+        retry: Optional[RetryPolicy] = None,
+        deadline: Optional[float] = None,
+        calendar: Optional[BusinessCalendar] = None,
+        non_business_day: str = "raise",
+        coalesce: bool = True,
+        pool_connections: int = 1,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        hooks: Sequence[Callable[[RequestEvent], None]] = (),
+        json_loads: Optional[Callable[[bytes], Any]] = None,
+        parse_dates: bool = False,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        stale_while_revalidate: bool = False,
+        base_url: Optional[str] = None
+    ):
+        super().__init__(api_token, timeout, json_loads, parse_dates, base_url)
+        
+        if chunk_days is not None and chunk_days <= 0:
+            raise ValueError("chunk_days debe ser mayor a cero")
+        if max_workers <= 0:
+            raise ValueError("max_workers debe ser mayor a cero")
+        if non_business_day not in ("raise", "previous"):
+            raise ValueError('non_business_day debe ser "raise" o "previous"')
+        if pool_connections <= 0 or pool_maxsize <= 0:
+            raise ValueError("pool_connections y pool_maxsize deben ser mayores a cero")
+        if stale_while_revalidate and (cache is None or cache.stale_ttl is None):
+            raise ValueError("stale_while_revalidate requiere una cache con stale_ttl")
+        
+        self.store = store
+        self.cache = cache
+        self.chunk_days = chunk_days
+        self.max_workers = max_workers
+        self.rate_limiter = rate_limiter
+        self.retry = retry
+        self.deadline = deadline
+        self.calendar = calendar
+        self.non_business_day = non_business_day
+        self.circuit_breaker = circuit_breaker
+        self.stale_while_revalidate = stale_while_revalidate
+        self._revalidating = set()
+        self._revalidating_lock = threading.Lock()
+        self._inflight = SingleFlight() if coalesce else None
+        self._headers = {
+            "Bmx-Token": api_token,
+            "Accept": "application/json"
+        }
+        self._adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block
+        )
+        self._local = threading.local()
+        self._session: Optional[requests.Session] = None
+        self.hooks = list(hooks)
+    
+    @property
+    def session(self) -> requests.Session:
+        """
+        Sesión HTTP del hilo actual
+        
+        `requests.Session` no es thread-safe, así que cada hilo tiene la suya;
+        todas comparten el mismo `HTTPAdapter` y por lo tanto el pool de conexiones.
+        
+        Se puede asignar una sesión propia (p. ej. un mock o una con proxies o
+        certificados): se usa tal cual en todos los hilos, así que debe llevar
+        el header `Bmx-Token` y ser segura para el uso concurrente que se le dé.
+        Asignar None regresa a las sesiones por hilo.
+        """
+        if self._session is not None:
+            return self._session
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update(self._headers)
+            session.mount("https://", self._adapter)
+            session.mount("http://", self._adapter)
+            self._local.session = session
+        return session
+    
+    @session.setter
+    def session(self, session: Optional[requests.Session]) -> None:
+        self._session = session
+    
+    def __enter__(self) -> "BanxicoSIEClient":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """Cierra las conexiones abiertas del pool compartido"""
+        self._adapter.close()
+    
+    @contextmanager
+    def _observe(self, operation: str):
+        """
+        Mide una consulta y entrega su RequestEvent a los hooks al terminar
+        
+        Las consultas anidadas (p. ej. `get_latest` sobre `get_latest_many`) se
+        acumulan en la más externa.
+        """
+        if self._recorder() is not None:
+            yield
+            return
+        
+        recorder = self._local.recorder = _Recorder(operation)
+        try:
+            yield
+        except BaseException as e:
+            recorder.error = e
+            raise
+        finally:
+            self._local.recorder = None
+            self._emit(recorder.event())
+    
+    def _emit(self, event: RequestEvent) -> None:
+        """Entrega un evento a los hooks; un hook que falla no afecta la consulta"""
+        for hook in self.hooks:
+            try:
+                hook(event)
+            except Exception as e:
+                warnings.warn(f"Hook de instrumentación falló: {e!r}", RuntimeWarning)
+    
+    def _recorder(self) -> Optional[_Recorder]:
+        """Mediciones de la consulta en curso en este hilo (None sin hooks)"""
+        return getattr(self._local, "recorder", None)
+    
+    def _phase(self, name: str):
+        """Mide una fase de la consulta en curso, si la hay"""
+        recorder = self._recorder()
+        return nullcontext() if recorder is None else recorder.phase(name)
+    
+    def _make_request(self, series_ids: List[str], start_date: str, end_date: str) -> Dict:
+        """
+        Realiza la petición HTTP a la API de Banxico
+        
+        Respeta el limitador de peticiones y reintenta según `retry`, sin
+        exceder el `deadline` configurado.
+        
+        Args:
+            series_ids: Lista de IDs de series a consultar
+            start_date: Fecha inicial en formato YYYY-MM-DD
+            end_date: Fecha final en formato YYYY-MM-DD
+            
+        Returns:
+            Respuesta JSON de la API
+            
+        Raises:
+            BanxicoAuthError: Si el token es inválido
+            BanxicoRateLimitError: Si se excede el límite de peticiones
+            BanxicoAPIError: Para otros errores de la API
+        """
+        recorder = self._recorder()
+        if recorder is not None:
+            recorder.describe(series_ids, start_date, end_date)
+        
+        url = self._build_url(series_ids, start_date, end_date)
+        return self._request_with_retries(url)
+    
+    def _request_with_retries(self, url: str, stream: bool = False):
+        """
+        Realiza la petición respetando el limitador, los reintentos y el deadline
+        
+        Args:
+            url: URL de la API
+            stream: Si True, regresa la respuesta sin leer el cuerpo
+            
+        Returns:
+            Respuesta JSON de la API, o el `requests.Response` si `stream` es True
+        """
+        if stream or self._inflight is None:
+            return self._request_with_retries_uncoalesced(url, stream)
+        
+        # La URL identifica la consulta: series, fecha inicial y fecha final. Se
+        # comparte la petición y el JSON decodificado (que nadie modifica); cada
+        # quien lo parsea con sus propias opciones (as_series, caché)
+        return self._inflight.do(url, lambda: self._request_with_retries_uncoalesced(url))
+    
+    def _request_with_retries_uncoalesced(self, url: str, stream: bool = False):
+        """Implementación de `_request_with_retries` sin coalescencia"""
+        deadline_at = None if self.deadline is None else time.monotonic() + self.deadline
+        
+        recorder = self._recorder()
+        attempt = 0
+        while True:
+            with self._phase("wait"):
+                self._acquire_token(deadline_at)
+            # Un deadline agotado es un error local: no cuenta para el circuito
+            timeout = self._request_timeout(deadline_at)
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.before_request()
+            try:
+                result = self._send_request(url, timeout, stream)
+            except BanxicoAPIError as e:
+                if self.circuit_breaker is not None:
+                    self.circuit_breaker.record(e)
+                if not self._should_retry(e, attempt):
+                    raise
+                
+                delay = self.retry.delay(attempt, getattr(e, "retry_after", None))
+                if deadline_at is not None and time.monotonic() + delay >= deadline_at:
+                    raise
+                
+                if recorder is not None:
+                    recorder.retry()
+                if isinstance(e, BanxicoRateLimitError) and self.rate_limiter is not None:
+                    # Pausa a todo el cliente; el siguiente acquire hace la espera
+                    self.rate_limiter.pause(delay)
+                else:
+                    with self._phase("wait"):
+                        time.sleep(delay)
+                attempt += 1
+            else:
+                if self.circuit_breaker is not None:
+                    self.circuit_breaker.record()
+                return result
+    
+    def _send_request(self, url: str, timeout: float, stream: bool = False):
+        """
+        Realiza un solo intento de petición HTTP
+        
+        Returns:
+            Respuesta JSON de la API, o el `requests.Response` si `stream` es True
+            
+        Raises:
+            BanxicoAuthError: Si el token es inválido
+            BanxicoRateLimitError: Si se excede el límite de peticiones
+            BanxicoAPIError: Para otros errores de la API
+        """
+        recorder = self._recorder()
+        try:
+            started = time.perf_counter()
+            response = self.session.get(url, timeout=timeout, stream=stream)
+            if recorder is not None:
+                self._record_response(recorder, response, time.perf_counter() - started, stream)
+            
+            # Manejo de errores HTTP
+            if response.status_code >= 400:
+                self._raise_for_status(
+                    response.status_code,
+                    self._decode_error_body(response.content),
+                    retry_after=response.headers.get("Retry-After")
+                )
+            
+            response.raise_for_status()
+            if stream:
+                return response
+            with self._phase("decode"):
+                return self._decode_body(response.content)
+            
+        except requests.exceptions.Timeout:
+            raise BanxicoAPIError("Timeout al conectar con la API de Banxico")
+        except requests.exceptions.ConnectionError:
+            raise BanxicoAPIError("Error de conexión con la API de Banxico")
+        except requests.exceptions.RequestException as e:
+            raise BanxicoAPIError(f"Error en la petición: {str(e)}")
+    
+    def _record_response(
+        self,
+        recorder: _Recorder,
+        response: requests.Response,
+        elapsed: float,
+        stream: bool
+    ) -> None:
+        """Registra status, bytes y tiempos (headers vs. cuerpo) de una respuesta"""
+        if stream:
+            recorder.add("http", elapsed)
+            size = int(response.headers.get("Content-Length") or 0)
+        else:
+            # `elapsed` de requests llega hasta los headers; el resto es el cuerpo
+            to_headers = min(response.elapsed.total_seconds(), elapsed)
+            recorder.add("http", to_headers)
+            recorder.add("download", elapsed - to_headers)
+            size = len(response.content)
+        recorder.response(response.status_code, size)
+    
+    def _acquire_token(self, deadline_at: Optional[float]) -> None:
+        """Espera un token del limitador, sin rebasar el deadline"""
+        if self.rate_limiter is None:
+            return
+        
+        timeout = None if deadline_at is None else max(deadline_at - time.monotonic(), 0.0)
+        if not self.rate_limiter.acquire(timeout):
+            raise BanxicoRateLimitError(
+                "Límite de peticiones local: no hay cupo antes del deadline"
+            )
+    
+    def _request_timeout(self, deadline_at: Optional[float]) -> float:
+        """Timeout HTTP del intento: el configurado, acotado por lo que resta del deadline"""
+        if deadline_at is None:
+            return self.timeout
+        
+        remaining = deadline_at - time.monotonic()
+        if remaining <= 0:
+            raise BanxicoAPIError("Se agotó el deadline de la consulta a la API de Banxico")
+        return min(self.timeout, remaining)
+    
+    def _should_retry(self, error: BanxicoAPIError, attempt: int) -> bool:
+        """Indica si un error es transitorio (429, 5xx o de red) y quedan reintentos"""
+        if self.retry is None or attempt >= self.retry.max_retries:
+            return False
+        if isinstance(error, BanxicoRateLimitError):
+            return True
+        return error.status_code is None or error.status_code >= 500
+    
+    def _request_range(self, series_ids: List[str], start_date: str, end_date: str) -> Dict:
+        """
+        Pide un rango a la API, dividiéndolo en ventanas paralelas si es largo
+        
+        Las ventanas se piden en un pool de a lo más `max_workers` hilos y sus
+        respuestas se combinan en orden de fecha, como si fuera una sola.
+        
+        Args:
+            series_ids: Lista de IDs de series a consultar
+            start_date: Fecha inicial en formato YYYY-MM-DD
+            end_date: Fecha final en formato YYYY-MM-DD
+            
+        Returns:
+            Respuesta JSON de la API (combinada si hubo varias ventanas)
+        """
+        recorder = self._recorder()
+        if recorder is not None:
+            recorder.describe(series_ids, start_date, end_date)
+        
+        windows = self._split_range(self._to_date(start_date), self._to_date(end_date))
+        if len(windows) <= 1:
+            return self._make_request(series_ids, start_date, end_date)
+        
+        def fetch_window(window):
+            # Las ventanas de los hilos del pool se acumulan en la misma consulta
+            self._local.recorder = recorder
+            try:
+                return self._make_request(series_ids, *window)
+            finally:
+                self._local.recorder = None
+        
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(windows))) as executor:
+            responses = list(executor.map(fetch_window, windows))
+        
+        return self._merge_responses(responses)
+    
+    def _split_range(self, start: date, end: date) -> List[Tuple[str, str]]:
+        """Divide [start, end] en ventanas consecutivas de `chunk_days` días"""
+        if self.chunk_days is None or start > end:
+            return [(start.strftime("%Y-%m-%d"), end.strftime("%Y-%m-%d"))]
+        
+        windows = []
+        window_start = start
+        while window_start <= end:
+            window_end = min(window_start + timedelta(days=self.chunk_days - 1), end)
+            windows.append((window_start.strftime("%Y-%m-%d"), window_end.strftime("%Y-%m-%d")))
+            window_start = window_end + timedelta(days=1)
+        return windows
+    
+    @_instrumented("get_rate")
+    def get_rate(
+        self,
+        currency: Currency,
+        fecha: Optional[Union[str, date, datetime]] = None
+    ) -> Dict:
+        """
+        Obtiene el tipo de cambio para una fecha específica
+        
+        Args:
+            currency: Moneda a consultar (Currency.USD, Currency.USD_PAGOS, Currency.EUR, etc)
+            fecha: Fecha de consulta (default: fecha actual)
+            
+        Returns:
+            Dict con la información del tipo de cambio:
+            {
+                'fecha': '26/12/2024',
+                'moneda': 'USD',
+                'moneda_nombre': 'Dólar estadounidense',
+                'simbolo': '$',
+                'valor': 20.3456,
+                'tipo': 'FIX - Determinación publicada en DOF'
+            }
+            
+        Raises:
+            BanxicoDataNotFoundError: Si no hay datos para la fecha
+            BanxicoAPIError: Para otros errores
+            
+        Example:
+            >>> # USD FIX (por determinación)
+            >>> rate = client.get_rate(Currency.USD)
+            >>> print(f"USD: ${rate['valor']}")
+            
+            >>> # USD para liquidación
+            >>> rate = client.get_rate(Currency.USD_PAGOS)
+            >>> print(f"USD PAGOS: ${rate['valor']}")
+            
+            >>> # Euro
+            >>> rate = client.get_rate(Currency.EUR, fecha="2024-12-01")
+        """
+        if fecha is None:
+            fecha = datetime.now()
+        
+        fecha_str = self._resolve_business_day(self._format_date(fecha))
+        if self.cache is None:
+            return self._fetch_rate(currency, fecha_str)
+        
+        cache_key = (currency.value, fecha_str)
+        cached = self.cache.get(cache_key)
+        stale = None
+        if cached is None and self.stale_while_revalidate:
+            stale = self.cache.get_stale(cache_key)
+            if isinstance(stale, _NotFound):
+                stale = None
+        recorder = self._recorder()
+        if recorder is not None:
+            recorder.cache = (
+                "hit" if cached is not None else "stale" if stale is not None else "miss"
+            )
+            recorder.describe([currency.value], fecha_str, fecha_str)
+        if isinstance(cached, _NotFound):
+            raise BanxicoDataNotFoundError(cached.message)
+        if cached is not None:
+            return dict(cached)
+        
+        def refresh():
+            fecha_date = self._to_date(fecha_str)
+            try:
+                result = self._fetch_rate(currency, fecha_str)
+            except BanxicoDataNotFoundError as e:
+                self.cache.set_not_found(cache_key, fecha_date, e.message)
+                raise
+            self.cache.set(cache_key, dict(result), self.cache.expires_at_for(fecha_date))
+            return result
+        
+        if stale is not None:
+            self._revalidate(cache_key, refresh)
+            return dict(stale, stale=True)
+        return refresh()
+    
+    def _revalidate(self, key: Any, refresh: Callable[[], Any]) -> None:
+        """
+        Ejecuta `refresh` en un hilo de fondo, a lo más uno a la vez por llave
+        
+        Si falla (p. ej. el circuito sigue abierto) se descarta el error: el
+        dato viejo sigue en la caché y el siguiente acceso lo vuelve a intentar.
+        """
+        with self._revalidating_lock:
+            if key in self._revalidating:
+                return
+            self._revalidating.add(key)
+        
+        def run():
+            try:
+                refresh()
+            except BanxicoAPIError:
+                pass
+            finally:
+                with self._revalidating_lock:
+                    self._revalidating.discard(key)
+        
+        threading.Thread(target=run, name="banxico-sie-revalidate", daemon=True).start()
+    
+    def _resolve_business_day(self, fecha_str: str) -> str:
+        """
+        Aplica el calendario de días hábiles a una fecha YYYY-MM-DD, sin usar la red
+        
+        Raises:
+            BanxicoDataNotFoundError: Si la fecha es inhábil y `non_business_day` es "raise"
+        """
+        if self.calendar is None:
+            return fecha_str
+        
+        fecha_date = self._to_date(fecha_str)
+        if self.calendar.is_business_day(fecha_date):
+            return fecha_str
+        if self.non_business_day == "previous":
+            return self.calendar.previous_business_day(fecha_date).strftime("%Y-%m-%d")
+        raise BanxicoDataNotFoundError(
+            f"{fecha_str} no es día hábil bancario: no hay publicación de Banxico"
+        )
+    
+    def _check_business_range(self, start: date, end: date) -> None:
+        """
+        Lanza BanxicoDataNotFoundError sin usar la red si el rango no tiene días hábiles
+        """
+        if self.calendar is not None and not self.calendar.has_business_day(start, end):
+            raise BanxicoDataNotFoundError(
+                f"No hay días hábiles bancarios entre {start} y {end}"
+            )
+    
+    def _fetch_rate(self, currency: Currency, fecha_str: str) -> Dict:
+        """
+        Obtiene el tipo de cambio de una fecha (YYYY-MM-DD) sin pasar por la caché
+        
+        Raises:
+            BanxicoDataNotFoundError: Si no hay datos para la fecha
+        """
+        if self.store is not None:
+            fecha_date = self._to_date(fecha_str)
+            results = self._get_stored_range(currency, fecha_date, fecha_date)
+        else:
+            data = self._make_request([currency.value], fecha_str, fecha_str)
+            with self._phase("parse"):
+                results = self._parse_response(data, currency)
+        
+        if not results:
+            raise BanxicoDataNotFoundError(
+                f"No hay datos disponibles para {currency.name_es} en {fecha_str}"
+            )
+        
+        return results[0]
+    
+    @_instrumented("get_rates_range")
+    def get_rates_range(
+        self,
+        currency: Currency,
+        start_date: Union[str, date, datetime],
+        end_date: Union[str, date, datetime],
+        as_series: bool = False
+    ) -> Union[List[Dict], RateSeries]:
+        """
+        Obtiene tipos de cambio para un rango de fechas
+        
+        Args:
+            currency: Moneda a consultar (Currency.USD, Currency.USD_PAGOS, Currency.EUR, etc)
+            start_date: Fecha inicial del rango
+            end_date: Fecha final del rango
+            as_series: Si True, regresa un RateSeries columnar (fechas y valores en
+                arreglos contiguos) en lugar de una lista de dicts
+            
+        Returns:
+            Lista de dicts con los tipos de cambio para cada fecha (o RateSeries)
+            
+        Raises:
+            BanxicoDataNotFoundError: Si no hay datos para el rango
+            BanxicoAPIError: Para otros errores
+            
+        Example:
+            >>> # Histórico USD FIX
+            >>> rates = client.get_rates_range(
+            ...     Currency.USD,
+            ...     start_date="2024-01-01",
+            ...     end_date="2024-01-31"
+            ... )
+            
+            >>> # Histórico USD para liquidación
+            >>> rates = client.get_rates_range(
+            ...     Currency.USD_PAGOS,
+            ...     start_date="2024-12-01",
+            ...     end_date="2024-12-31"
+            ... )
+            
+            >>> for rate in rates:
+            ...     print(f"{rate['fecha']}: ${rate['valor']}")
+        """
+        self._check_business_range(self._to_date(start_date), self._to_date(end_date))
+        
+        if self.store is not None:
+            return self._get_stored_range(
+                currency, self._to_date(start_date), self._to_date(end_date), as_series
+            )
+        
+        start_str = self._format_date(start_date)
+        end_str = self._format_date(end_date)
+        
+        data = self._request_range([currency.value], start_str, end_str)
+        with self._phase("parse"):
+            results = self._parse_response(data, currency, as_series)
+        
+        return results
+    
+    def iter_rates_range(
+        self,
+        currencies: Union[Currency, List[Currency]],
+        start_date: Union[str, date, datetime],
+        end_date: Union[str, date, datetime]
+    ) -> Iterator[Dict]:
+        """
+        Itera los tipos de cambio de un rango conforme se descarga la respuesta
+        
+        El cuerpo se procesa por fragmentos, sin materializar el JSON ni la lista
+        completa, así que la memoria no depende del tamaño del rango y el primer
+        dato sale antes de terminar la descarga. Si el cliente tiene `chunk_days`,
+        las ventanas se piden una tras otra.
+        
+        Args:
+            currencies: Moneda o lista de monedas a consultar (en una sola petición)
+            start_date: Fecha inicial del rango
+            end_date: Fecha final del rango
+            
+        Yields:
+            Dicts con el mismo formato que `get_rates_range`, en el orden de la
+            respuesta (serie por serie). Si no hay datos no se produce ninguno.
+            
+        Raises:
+            BanxicoAPIError: Para errores de la API o de la conexión
+            
+        Example:
+            >>> for rate in client.iter_rates_range(Currency.USD, "1991-01-01", "2024-12-31"):
+            ...     writer.writerow([rate['fecha'], rate['valor']])
+        """
+        if isinstance(currencies, Currency):
+            currencies = [currencies]
+        currencies = self._unique_currencies(currencies)
+        by_id = {currency.value: currency for currency in currencies}
+        series_ids = list(by_id)
+        
+        windows = self._split_range(self._to_date(start_date), self._to_date(end_date))
+        for window_start, window_end in windows:
+            url = self._build_url(series_ids, window_start, window_end)
+            if self.hooks:
+                # El evento cubre la petición hasta los headers; el cuerpo se
+                # consume después, al ritmo de quien itera
+                with self._observe("iter_rates_range"):
+                    self._recorder().describe(series_ids, window_start, window_end)
+                    response = self._request_with_retries(url, stream=True)
+            else:
+                response = self._request_with_retries(url, stream=True)
+            try:
+                items = iter_series_items(response.iter_content(65536), self.json_loads)
+                # Los elementos llegan serie por serie: cada tramo se parsea con
+                # los campos de su moneda calculados una sola vez
+                for series_id, run in groupby(items, key=itemgetter(0)):
+                    currency = by_id.get(series_id)
+                    if currency is not None:
+                        yield from self._iter_datos(map(itemgetter(1), run), currency)
+            except requests.exceptions.RequestException as e:
+                raise BanxicoAPIError(f"Error leyendo la respuesta de Banxico: {str(e)}")
+            finally:
+                response.close()
+    
+    def _get_stored_range(
+        self,
+        currency: Currency,
+        start: date,
+        end: date,
+        as_series: bool = False
+    ) -> Union[List[Dict], RateSeries]:
+        """
+        Responde un rango desde el almacén local, pidiendo a la API sólo lo faltante
+        
+        Los días a partir de hoy nunca se marcan como consultados, porque el dato
+        del día puede no estar publicado todavía.
+        
+        Args:
+            currency: Moneda a consultar
+            start: Fecha inicial del rango
+            end: Fecha final del rango
+            as_series: Si True, regresa un RateSeries
+            
+        Returns:
+            Lista de dicts con los tipos de cambio para cada fecha (o RateSeries)
+            
+        Raises:
+            BanxicoDataNotFoundError: Si no hay datos para el rango
+        """
+        series_id = currency.value
+        last_final_day = date.today() - timedelta(days=1)
+        
+        for gap_start, gap_end in self.store.missing_intervals(series_id, start, end):
+            data = self._request_range(
+                [series_id], gap_start.strftime("%Y-%m-%d"), gap_end.strftime("%Y-%m-%d")
+            )
+            self.store.add_points(series_id, self._extract_series(data).get(series_id, []))
+            
+            covered_end = min(gap_end, last_final_day)
+            if covered_end >= gap_start:
+                self.store.mark_covered(series_id, gap_start, covered_end)
+        
+        series_data = self.store.get_points(series_id, start, end)
+        if not series_data:
+            raise BanxicoDataNotFoundError(
+                f"No hay datos disponibles para {currency.name_es}"
+            )
+        
+        with self._phase("parse"):
+            return self._parse_datos(series_data, currency, as_series)
+    
+    @_instrumented("rates_asof")
+    def rates_asof(
+        self,
+        fechas: Union[Iterable, "np.ndarray"],
+        currency: Currency,
+        lookback_days: int = 10
+    ) -> Union[array, "np.ndarray"]:
+        """
+        Tipo de cambio aplicable a muchas fechas con una sola consulta de rango
+        
+        Pide el histórico que cubre todas las fechas (más `lookback_days` hacia
+        atrás, para cubrir festivos al inicio) y resuelve cada fecha con búsqueda
+        binaria, usando la última observación publicada en días sin publicación.
+        
+        Args:
+            fechas: Fechas como date, datetime, strings, o arreglo datetime64 de NumPy
+                (la opción más rápida para lotes grandes)
+            currency: Moneda a consultar
+            lookback_days: Días adicionales a pedir antes de la fecha mínima (default: 10)
+            
+        Returns:
+            Tipos de cambio alineados con `fechas` (NaN si no hay dato aplicable);
+            arreglo float64 de NumPy si está instalado, si no `array('d')`
+            
+        Raises:
+            BanxicoDataNotFoundError: Si no hay datos en el rango
+            BanxicoAPIError: Para otros errores
+        """
+        ordinals = _to_ordinal_array(fechas)
+        if not len(ordinals):
+            return RateSeries(currency, array("l"), array("d"))._asof_ordinals(ordinals)
+        
+        if isinstance(ordinals, list):
+            first, last = min(ordinals), max(ordinals)
+        else:
+            first, last = int(ordinals.min()), int(ordinals.max())
+        start = date.fromordinal(first) - timedelta(days=lookback_days)
+        end = date.fromordinal(last)
+        serie = self.get_rates_range(currency, start, end, as_series=True)
+        
+        return serie._asof_ordinals(ordinals)
+    
+    @_instrumented("convert_many")
+    def convert_many(
+        self,
+        amounts: Union[Sequence[float], "np.ndarray"],
+        fechas: Union[Iterable, "np.ndarray"],
+        currency: Currency,
+        lookback_days: int = 10
+    ) -> Union[array, "np.ndarray"]:
+        """
+        Convierte montos en `currency` a pesos, cada uno al tipo de cambio de su fecha
+        
+        Hace una sola petición de rango para todo el lote (ver `rates_asof`).
+        
+        Args:
+            amounts: Montos en la moneda extranjera
+            fechas: Fecha de cada monto (date, datetime, strings o datetime64)
+            currency: Moneda de los montos
+            lookback_days: Días adicionales a pedir antes de la fecha mínima (default: 10)
+            
+        Returns:
+            Montos en pesos (NaN si no hay tipo de cambio aplicable); arreglo
+            float64 de NumPy si está instalado, si no `array('d')`
+            
+        Raises:
+            ValueError: Si `amounts` y `fechas` no tienen la misma longitud
+            BanxicoDataNotFoundError: Si no hay datos en el rango
+            
+        Example:
+            >>> mxn = client.convert_many(
+            ...     [100.0, 250.5, 80.0],
+            ...     ["2024-12-24", "2024-12-25", "2024-12-28"],
+            ...     Currency.USD
+            ... )
+        """
+        # Si ambos tienen longitud se valida antes de ir a la API; un iterador
+        # de fechas sólo se puede contar después de recorrerlo
+        if hasattr(fechas, "__len__") and len(amounts) != len(fechas):
+            raise ValueError("amounts y fechas deben tener la misma longitud")
+        rates = self.rates_asof(fechas, currency, lookback_days)
+        if len(amounts) != len(rates):
+            raise ValueError("amounts y fechas deben tener la misma longitud")
+        
+        if isinstance(rates, array):
+            return array("d", (amount * rate for amount, rate in zip(amounts, rates)))
+        
+        np = _numpy()
+        return np.asarray(amounts, dtype=np.float64) * rates
+    
+    @_instrumented("get_latest")
+    def get_latest(self, currency: Currency) -> Dict:
+        """
+        Obtiene el tipo de cambio más reciente disponible
+        
+        Usa el endpoint "oportuno" del SIE, que regresa la última observación
+        publicada, así que funciona igual en fines de semana, días festivos o
+        antes de la hora de publicación, con una sola petición.
+        
+        Args:
+            currency: Moneda a consultar (Currency.USD, Currency.USD_PAGOS, Currency.EUR, etc)
+            
+        Returns:
+            Dict con el tipo de cambio más reciente
+            
+        Raises:
+            BanxicoDataNotFoundError: Si la serie no tiene datos
+            BanxicoAPIError: Para otros errores
+            
+        Example:
+            >>> # Último USD FIX
+            >>> latest = client.get_latest(Currency.USD)
+            >>> print(f"Último USD: ${latest['valor']} ({latest['fecha']})")
+            
+            >>> # Último USD para liquidación
+            >>> latest = client.get_latest(Currency.USD_PAGOS)
+            >>> print(f"Último USD PAGOS: ${latest['valor']} ({latest['fecha']})")
+        """
+        return self.get_latest_many([currency])[currency]
+    
+    @_instrumented("get_latest_many")
+    def get_latest_many(
+        self,
+        currencies: List[Currency],
+        refresh: bool = False
+    ) -> Dict[Currency, Dict]:
+        """
+        Obtiene el tipo de cambio más reciente de varias monedas en una sola petición
+        
+        Args:
+            currencies: Monedas a consultar
+            refresh: Si True, siempre consulta la API (sin leer la caché) y
+                guarda la respuesta en la caché
+            
+        Returns:
+            Dict de Currency a su tipo de cambio más reciente; las monedas sin
+            datos se omiten
+            
+        Raises:
+            BanxicoDataNotFoundError: Si ninguna moneda tiene datos
+            BanxicoAPIError: Para otros errores
+            
+        Example:
+            >>> latest = client.get_latest_many(list(Currency))
+            >>> for currency, rate in latest.items():
+            ...     print(f"{currency.name}: ${rate['valor']} ({rate['fecha']})")
+        """
+        currencies = self._unique_currencies(currencies)
+        if refresh:
+            cached_results, missing = {}, currencies
+        else:
+            cached_results, missing = self._cached_latest(currencies)
+        
+        stale_results = None
+        if missing and self.stale_while_revalidate and not refresh:
+            stale_results = self._stale_latest(missing)
+        
+        recorder = self._recorder()
+        if recorder is not None:
+            recorder.describe([c.value for c in currencies], None, None)
+            if self.cache is not None:
+                recorder.cache = (
+                    "hit" if not missing else "stale" if stale_results is not None else "miss"
+                )
+        
+        if stale_results is not None:
+            stale_currencies = missing
+            url = self._build_latest_url([c.value for c in stale_currencies])
+            self._revalidate(
+                url,
+                lambda: self._latest_results(self._request_with_retries(url), stale_currencies, {})
+            )
+            cached_results.update(stale_results)
+            missing = []
+        
+        data = None
+        if missing:
+            data = self._request_with_retries(
+                self._build_latest_url([c.value for c in missing])
+            )
+        
+        with self._phase("parse"):
+            return self._latest_results(data, currencies, cached_results)
+    
+    def _stale_latest(self, currencies: List[Currency]) -> Optional[Dict[Currency, Dict]]:
+        """Datos "más reciente" expirados de la caché, sólo si los hay para todas las monedas"""
+        stale_results = {}
+        for currency in currencies:
+            stale = self.cache.get_stale((currency.value, "latest"))
+            if stale is None:
+                return None
+            stale_results[currency] = dict(stale, stale=True)
+        return stale_results
+    
+    @_instrumented("get_rates_many")
+    def get_rates_many(
+        self,
+        currencies: List[Currency],
+        fecha: Optional[Union[str, date, datetime]] = None
+    ) -> Dict[Currency, Dict]:
+        """
+        Obtiene el tipo de cambio de varias monedas en una sola petición HTTP
+        
+        Args:
+            currencies: Monedas a consultar
+            fecha: Fecha de consulta (default: fecha actual)
+            
+        Returns:
+            Dict de Currency al dict de tipo de cambio (mismo formato que `get_rate`).
+            Las monedas sin dato para la fecha se omiten.
+            
+        Raises:
+            BanxicoDataNotFoundError: Si ninguna moneda tiene datos para la fecha
+            BanxicoAPIError: Para otros errores
+            
+        Example:
+            >>> rates = client.get_rates_many([Currency.USD, Currency.EUR])
+            >>> print(f"EUR: ${rates[Currency.EUR]['valor']}")
+        """
+        if fecha is None:
+            fecha = datetime.now()
+        
+        fecha_str = self._resolve_business_day(self._format_date(fecha))
+        results = self._get_series_many(currencies, fecha_str, fecha_str)
+        
+        return {currency: rates[0] for currency, rates in results.items()}
+    
+    @_instrumented("get_rates_range_many")
+    def get_rates_range_many(
+        self,
+        currencies: List[Currency],
+        start_date: Union[str, date, datetime],
+        end_date: Union[str, date, datetime],
+        as_series: bool = False
+    ) -> Dict[Currency, Union[List[Dict], RateSeries]]:
+        """
+        Obtiene tipos de cambio de varias monedas para un rango en una sola petición HTTP
+        
+        Args:
+            currencies: Monedas a consultar
+            start_date: Fecha inicial del rango
+            end_date: Fecha final del rango
+            as_series: Si True, cada moneda se regresa como RateSeries
+            
+        Returns:
+            Dict de Currency a la lista de tipos de cambio del rango (o RateSeries).
+            Las monedas sin datos en el rango se omiten.
+            
+        Raises:
+            BanxicoDataNotFoundError: Si ninguna moneda tiene datos para el rango
+            BanxicoAPIError: Para otros errores
+            
+        Example:
+            >>> rates = client.get_rates_range_many(
+            ...     list(Currency),
+            ...     start_date="2024-01-01",
+            ...     end_date="2024-12-31"
+            ... )
+            >>> for rate in rates[Currency.USD]:
+            ...     print(f"{rate['fecha']}: ${rate['valor']}")
+        """
+        self._check_business_range(self._to_date(start_date), self._to_date(end_date))
+        
+        start_str = self._format_date(start_date)
+        end_str = self._format_date(end_date)
+        
+        return self._get_series_many(currencies, start_str, end_str, as_series)
+    
+    def _get_series_many(
+        self,
+        currencies: List[Currency],
+        start_str: str,
+        end_str: str,
+        as_series: bool = False
+    ) -> Dict[Currency, Union[List[Dict], RateSeries]]:
+        """Consulta varias series en una petición y parsea todas las de la respuesta"""
+        currencies = self._unique_currencies(currencies)
+        
+        data = self._request_range([c.value for c in currencies], start_str, end_str)
+        with self._phase("parse"):
+            results = self._parse_series_response(data, currencies, as_series)
+        
+        if not results:
+            raise BanxicoDataNotFoundError(
+                f"No hay datos disponibles entre {start_str} y {end_str}"
+            )
+        
+        return results
+    
+    @_instrumented("sync")
+    def sync(
+        self,
+        currencies: List[Currency],
+        start_date: Optional[Union[str, date, datetime]] = None,
+        since: Optional[Mapping[Currency, Union[str, date, datetime]]] = None
+    ) -> Dict[Currency, List[Dict]]:
+        """
+        Trae sólo las observaciones nuevas de varias series, en una sola petición
+        
+        La marca de cada serie es la fecha de su última observación conocida:
+        la de `since` si se indica, si no la más reciente del almacén local. Se
+        pide a la API desde el día siguiente a la marca más antigua hasta hoy,
+        con todas las series en la misma petición, y se descartan los puntos
+        que ya estaban. Con almacén, los puntos nuevos se guardan en él, así que
+        la siguiente llamada empieza donde terminó ésta.
+        
+        Args:
+            currencies: Monedas a sincronizar
+            start_date: Fecha inicial para las series que aún no tienen marca
+            since: Marcas propias por moneda (última fecha ya guardada); tienen
+                prioridad sobre las del almacén
+            
+        Returns:
+            Dict de Currency a la lista de tipos de cambio nuevos, en orden de
+            fecha. Las monedas sin observaciones nuevas se omiten.
+            
+        Raises:
+            ValueError: Si no hay almacén ni `since`, o si una serie no tiene
+                marca y no se indicó `start_date`
+            BanxicoAPIError: Para errores de la API
+            
+        Example:
+            >>> client = BanxicoSIEClient("tu_token", store=SQLiteRateStore("banxico.db"))
+            >>> client.sync(list(Currency), start_date="2024-01-01")  # primera carga
+            >>> nuevos = client.sync(list(Currency))  # después, sólo lo publicado desde entonces
+        """
+        if self.store is None and since is None:
+            raise ValueError("sync requiere un store o marcas en `since`")
+        
+        currencies = self._unique_currencies(currencies)
+        marks = {}
+        for currency in currencies:
+            if since is not None and currency in since:
+                mark = self._to_date(since[currency])
+            elif self.store is not None:
+                mark = self.store.last_date(currency.value)
+            else:
+                mark = None
+            
+            if mark is None:
+                if start_date is None:
+                    raise ValueError(
+                        f"{currency.name} no tiene observaciones previas: indica start_date"
+                    )
+                mark = self._to_date(start_date) - timedelta(days=1)
+            marks[currency] = mark
+        
+        today = date.today()
+        start = min(marks.values()) + timedelta(days=1)
+        if start > today:
+            return {}
+        
+        data = self._request_range(
+            [c.value for c in currencies], start.strftime("%Y-%m-%d"), today.strftime("%Y-%m-%d")
+        )
+        series_by_id = self._extract_series(data)
+        
+        results = {}
+        last_final_day = today - timedelta(days=1)
+        for currency in currencies:
+            mark = marks[currency]
+            new_data = [
+                item for item in series_by_id.get(currency.value, [])
+                if parse_fecha(item["fecha"]) > mark
+            ]
+            if self.store is not None:
+                self.store.add_points(currency.value, new_data)
+                if last_final_day > mark:
+                    self.store.mark_covered(
+                        currency.value, mark + timedelta(days=1), last_final_day
+                    )
+            if new_data:
+                with self._phase("parse"):
+                    results[currency] = self._parse_datos(new_data, currency)
+        
+        return results
@@ -0,0 +1,72 @@
+"""Coalescencia de peticiones idénticas concurrentes (single-flight)"""
+
+import threading
+from typing import Any, Callable, Dict, Hashable
+
+
+class _Call:
+    """Petición en curso compartida por todos los hilos que la esperan"""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Ejecuta una sola vez las llamadas concurrentes con la misma llave
+
+    El primer hilo con una llave ejecuta la función; los que llegan mientras
+    está en curso esperan y reciben el mismo resultado (o la misma excepción).
+    Al terminar, la llave se libera y la siguiente llamada vuelve a ejecutarse.
+
+    Example:
+        >>> flight = SingleFlight()
+        >>> data = flight.do(("SF43718", "2024-12-26"), lambda: fetch())
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        # Número de llamadas que se resolvieron con una ejecución ajena
+        self.shared = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        Ejecuta `fn` o espera el resultado de la ejecución en curso con la misma llave
+
+        Args:
+            key: Llave que identifica la petición
+            fn: Función a ejecutar si no hay una en curso
+
+        Returns:
+            El resultado de `fn` (compartido entre los hilos coalescidos)
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self.shared += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
@@ -0,0 +1,237 @@
+"""Eventos de instrumentación por consulta y adaptadores para Prometheus y OpenTelemetry"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, NamedTuple, Optional, Sequence, Tuple
+
+
+class RequestEvent(NamedTuple):
+    """
+    Resumen de una consulta del cliente (p. ej. una llamada a `get_rate`)
+
+    Las fases suman el tiempo de todas las peticiones HTTP de la consulta:
+    "wait" (limitador y esperas entre reintentos), "http" (hasta recibir los
+    headers, incluye DNS, TCP/TLS y la latencia del servidor), "download"
+    (cuerpo de la respuesta), "decode" (JSON) y "parse" (conversión a dicts
+    o RateSeries). Una consulta servida desde la caché no tiene fases.
+    """
+
+    operation: str
+    series_ids: Tuple[str, ...]
+    start_date: Optional[str]
+    end_date: Optional[str]
+    status: Optional[int]
+    duration: float
+    phases: Dict[str, float]
+    response_bytes: int
+    requests: int
+    retries: int
+    cache: Optional[str]
+    error: Optional[BaseException]
+
+
+class _Recorder:
+    """Acumula las mediciones de una consulta en curso (puede compartirse entre hilos)"""
+
+    def __init__(self, operation: str):
+        self.operation = operation
+        self.series_ids: Tuple[str, ...] = ()
+        self.start_date: Optional[str] = None
+        self.end_date: Optional[str] = None
+        self.status: Optional[int] = None
+        self.phases: Dict[str, float] = {}
+        self.response_bytes = 0
+        self.requests = 0
+        self.retries = 0
+        self.cache: Optional[str] = None
+        self.error: Optional[BaseException] = None
+        self._started = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def describe(
+        self, series_ids: Sequence[str], start_date: Optional[str], end_date: Optional[str]
+    ):
+        """Registra series y rango (la primera descripción, la más general, gana)"""
+        if not self.series_ids:
+            self.series_ids = tuple(series_ids)
+            self.start_date = start_date
+            self.end_date = end_date
+
+    def add(self, phase: str, seconds: float) -> None:
+        with self._lock:
+            self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+    def response(self, status: int, size: int) -> None:
+        with self._lock:
+            self.status = status
+            self.response_bytes += size
+            self.requests += 1
+
+    def retry(self) -> None:
+        with self._lock:
+            self.retries += 1
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - started)
+
+    def event(self) -> RequestEvent:
+        return RequestEvent(
+            operation=self.operation,
+            series_ids=self.series_ids,
+            start_date=self.start_date,
+            end_date=self.end_date,
+            status=self.status,
+            duration=time.perf_counter() - self._started,
+            phases=dict(self.phases),
+            response_bytes=self.response_bytes,
+            requests=self.requests,
+            retries=self.retries,
+            cache=self.cache,
+            error=self.error,
+        )
+
+
+class PrometheusInstrumentation:
+    """
+    Hook que exporta los eventos como métricas de Prometheus
+
+    Requiere `prometheus_client` (`pip install banxico-sie-xp[prometheus]`).
+
+    Métricas (con el prefijo `namespace`):
+        requests_total{operation, outcome}: consultas por resultado
+            ("ok", "error" o el status HTTP del error)
+        request_duration_seconds{operation}: duración total de la consulta
+        phase_duration_seconds{operation, phase}: duración por fase
+        response_bytes{operation}: bytes recibidos por consulta
+        retries_total{operation}: reintentos
+        cache_total{operation, result}: aciertos y fallos de caché
+
+    Args:
+        registry: Registro donde crear las métricas (default: el global)
+        namespace: Prefijo de las métricas (default: "banxico_sie")
+
+    Example:
+        >>> client = BanxicoSIEClient("tu_token", hooks=[PrometheusInstrumentation()])
+    """
+
+    def __init__(self, registry=None, namespace: str = "banxico_sie"):
+        try:
+            import prometheus_client
+        except ImportError:
+            raise ImportError(
+                "PrometheusInstrumentation requiere prometheus_client: "
+                "pip install banxico-sie-xp[prometheus]"
+            )
+
+        kwargs = {"namespace": namespace}
+        if registry is not None:
+            kwargs["registry"] = registry
+
+        self.requests = prometheus_client.Counter(
+            "requests", "Consultas al SIE por resultado", ["operation", "outcome"], **kwargs
+        )
+        self.duration = prometheus_client.Histogram(
+            "request_duration_seconds", "Duración de las consultas al SIE", ["operation"], **kwargs
+        )
+        self.phase_duration = prometheus_client.Histogram(
+            "phase_duration_seconds",
+            "Duración por fase de las consultas al SIE",
+            ["operation", "phase"],
+            **kwargs,
+        )
+        self.response_bytes = prometheus_client.Histogram(
+            "response_bytes",
+            "Bytes recibidos por consulta",
+            ["operation"],
+            buckets=(1e3, 1e4, 1e5, 1e6, 1e7, float("inf")),
+            **kwargs,
+        )
+        self.retries = prometheus_client.Counter(
+            "retries", "Reintentos de peticiones al SIE", ["operation"], **kwargs
+        )
+        self.cache = prometheus_client.Counter(
+            "cache", "Aciertos y fallos de la caché", ["operation", "result"], **kwargs
+        )
+
+    def __call__(self, event: RequestEvent) -> None:
+        operation = event.operation
+        if event.error is None:
+            outcome = "ok"
+        else:
+            outcome = str(getattr(event.error, "status_code", None) or "error")
+
+        self.requests.labels(operation, outcome).inc()
+        self.duration.labels(operation).observe(event.duration)
+        for phase, seconds in event.phases.items():
+            self.phase_duration.labels(operation, phase).observe(seconds)
+        if event.requests:
+            self.response_bytes.labels(operation).observe(event.response_bytes)
+        if event.retries:
+            self.retries.labels(operation).inc(event.retries)
+        if event.cache is not None:
+            self.cache.labels(operation, event.cache).inc()
+
+
+class OpenTelemetryInstrumentation:
+    """
+    Hook que registra cada consulta como un span de OpenTelemetry
+
+    Requiere `opentelemetry-api` (`pip install banxico-sie-xp[otel]`). El span
+    se crea al terminar la consulta con sus tiempos reales de inicio y fin;
+    las fases se agregan como atributos `banxico.phase.<fase>` en segundos.
+
+    Args:
+        tracer: Tracer a usar (default: `trace.get_tracer("banxico_sie")`)
+
+    Example:
+        >>> client = BanxicoSIEClient("tu_token", hooks=[OpenTelemetryInstrumentation()])
+    """
+
+    def __init__(self, tracer=None):
+        try:
+            from opentelemetry import trace
+        except ImportError:
+            raise ImportError(
+                "OpenTelemetryInstrumentation requiere opentelemetry-api: "
+                "pip install banxico-sie-xp[otel]"
+            )
+
+        self._trace = trace
+        self.tracer = tracer or trace.get_tracer("banxico_sie")
+
+    def __call__(self, event: RequestEvent) -> None:
+        end_ns = time.time_ns()
+        start_ns = end_ns - int(event.duration * 1e9)
+
+        attributes = {
+            "banxico.series_ids": ",".join(event.series_ids),
+            "banxico.requests": event.requests,
+            "banxico.retries": event.retries,
+            "banxico.response_bytes": event.response_bytes,
+        }
+        if event.start_date is not None:
+            attributes["banxico.start_date"] = event.start_date
+            attributes["banxico.end_date"] = event.end_date
+        if event.status is not None:
+            attributes["http.status_code"] = event.status
+        if event.cache is not None:
+            attributes["banxico.cache"] = event.cache
+        for phase, seconds in event.phases.items():
+            attributes[f"banxico.phase.{phase}"] = seconds
+
+        span = self.tracer.start_span(
+            f"banxico_sie.{event.operation}",
+            kind=self._trace.SpanKind.CLIENT,
+            attributes=attributes,
+            start_time=start_ns,
+        )
+        if event.error is not None:
+            span.record_exception(event.error)
+            span.set_status(self._trace.Status(self._trace.StatusCode.ERROR, str(event.error)))
+        span.end(end_time=end_ns)
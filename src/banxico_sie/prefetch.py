@@ -0,0 +1,213 @@
+"""Actualización en segundo plano de los tipos de cambio a la hora de publicación"""
+
+import threading
+import time as _time
+import warnings
+from datetime import date, datetime, time, timedelta, timezone
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional
+
+from ._dates import to_date
+from .cache import FIX_PUBLICATION_TIME, MEXICO_CITY_TZ
+from .enums import Currency
+from .exceptions import BanxicoAPIError
+
+if TYPE_CHECKING:
+    import asyncio
+
+    from .client import BanxicoSIEClient
+
+
+class PrefetchScheduler:
+    """
+    Consulta las monedas indicadas alrededor de la hora de publicación y
+    llena la caché del cliente antes de que lo pidan los usuarios
+
+    Un hilo de fondo hace una sola petición "oportuno" con todas las monedas
+    (`get_latest_many(..., refresh=True)`) al arrancar, y en cada día hábil
+    cada `poll_interval` segundos desde `lead` antes de la publicación hasta
+    que todas tienen el dato del día (o pasa `window`). Cada observación nueva
+    se guarda en la caché del cliente (para `get_latest` y para `get_rate` de
+    su fecha) y se notifica a los suscriptores.
+
+    Args:
+        client: Cliente a usar; su caché (si tiene) es la que se llena
+        currencies: Monedas a vigilar
+        poll_interval: Segundos entre consultas dentro de la ventana (default: 30)
+        lead: Anticipación con la que se empieza a consultar (default: 1 minuto)
+        window: Tiempo máximo consultando después de la publicación (default: 2 horas)
+        publication_time: Hora de publicación diaria del FIX (default: 12:00)
+        tz: Zona horaria de la publicación (default: Ciudad de México)
+        clock: Función que regresa el tiempo actual en segundos epoch
+
+    Los días hábiles son los del `calendar` del cliente si tiene uno; si no,
+    de lunes a viernes.
+
+    Example:
+        >>> client = BanxicoSIEClient("tu_token", cache=RateCache())
+        >>> scheduler = PrefetchScheduler(client, [Currency.USD, Currency.EUR])
+        >>> scheduler.subscribe(lambda currency, rate: print(currency.name, rate["valor"]))
+        >>> scheduler.start()
+    """
+
+    def __init__(
+        self,
+        client: "BanxicoSIEClient",
+        currencies: List[Currency],
+        poll_interval: float = 30.0,
+        lead: timedelta = timedelta(minutes=1),
+        window: timedelta = timedelta(hours=2),
+        publication_time: time = FIX_PUBLICATION_TIME,
+        tz: timezone = MEXICO_CITY_TZ,
+        clock: Callable[[], float] = _time.time
+    ):
+        if poll_interval <= 0:
+            raise ValueError("poll_interval debe ser mayor a cero")
+
+        self.client = client
+        self.currencies = client._unique_currencies(currencies)
+        self.poll_interval = poll_interval
+        self.lead = lead
+        self.window = window
+        self.publication_time = publication_time
+        self.tz = tz
+        self.clock = clock
+        self.latest: Dict[Currency, Dict] = {}
+        self._callbacks: List[Callable[[Currency, Dict], None]] = []
+        self._events: List[tuple] = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def subscribe(self, callback: Callable[[Currency, Dict], None]) -> None:
+        """
+        Registra una función que se llama con (moneda, tipo de cambio) por cada
+        observación nueva, desde el hilo del scheduler
+
+        Args:
+            callback: Función a llamar; si falla sólo se emite una advertencia
+        """
+        with self._lock:
+            self._callbacks.append(callback)
+
+    def asyncio_event(self) -> "asyncio.Event":
+        """
+        Crea un `asyncio.Event` del loop actual que se activa con cada observación nueva
+
+        Debe llamarse desde una corrutina. El evento queda activo hasta que
+        se llame `clear()`; `scheduler.latest` tiene los datos.
+
+        Returns:
+            El evento
+        """
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        event = asyncio.Event()
+        with self._lock:
+            self._events.append((loop, event))
+        return event
+
+    def start(self) -> "PrefetchScheduler":
+        """Arranca el hilo de fondo (no hace nada si ya está corriendo)"""
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="banxico-sie-prefetch", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Detiene el hilo de fondo y espera a que termine"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def __enter__(self) -> "PrefetchScheduler":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def poll(self) -> Dict[Currency, Dict]:
+        """
+        Hace una consulta: guarda en caché y notifica las observaciones nuevas
+
+        Returns:
+            Dict de Currency a su observación nueva (vacío si no cambió nada)
+
+        Raises:
+            BanxicoAPIError: Si falla la petición
+        """
+        results = self.client.get_latest_many(self.currencies, refresh=True)
+
+        # La primera consulta sólo establece la referencia; no es una novedad
+        baseline = not self.latest
+        new = {}
+        for currency, rate in results.items():
+            previous = self.latest.get(currency)
+            if previous is None or to_date(rate["fecha"]) > to_date(previous["fecha"]):
+                new[currency] = rate
+        self.latest.update(results)
+
+        cache = self.client.cache
+        if cache is not None:
+            for currency, rate in new.items():
+                fecha = to_date(rate["fecha"])
+                cache.set(
+                    (currency.value, fecha.strftime("%Y-%m-%d")), dict(rate),
+                    cache.expires_at_for(fecha)
+                )
+
+        if new and not baseline:
+            self._notify(new)
+        return new
+
+    def seconds_until_next_poll(self) -> float:
+        """Segundos hasta la siguiente consulta según la ventana de publicación"""
+        now = datetime.fromtimestamp(self.clock(), self.tz)
+        day = now.date()
+        while True:
+            publication = datetime.combine(day, self.publication_time, tzinfo=self.tz)
+            start, end = publication - self.lead, publication + self.window
+            if self._is_business_day(day) and now < end and not self._done(day):
+                if now < start:
+                    return (start - now).total_seconds()
+                return self.poll_interval
+            day += timedelta(days=1)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.poll()
+            except BanxicoAPIError:
+                pass  # se reintenta en la siguiente consulta
+            self._stop.wait(self.seconds_until_next_poll())
+
+    def _done(self, day: date) -> bool:
+        """Indica si todas las monedas ya tienen el dato de `day`"""
+        return len(self.latest) == len(self.currencies) and all(
+            to_date(rate["fecha"]) >= day for rate in self.latest.values()
+        )
+
+    def _is_business_day(self, day: date) -> bool:
+        calendar = self.client.calendar
+        if calendar is not None:
+            return calendar.is_business_day(day)
+        return day.weekday() < 5
+
+    def _notify(self, new: Dict[Currency, Dict]) -> None:
+        with self._lock:
+            callbacks = list(self._callbacks)
+            events = list(self._events)
+
+        for currency, rate in new.items():
+            for callback in callbacks:
+                try:
+                    callback(currency, dict(rate))
+                except Exception as e:
+                    warnings.warn(f"Suscriptor de prefetch falló: {e!r}", RuntimeWarning)
+        for loop, event in events:
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(event.set)
@@ -0,0 +1,207 @@
+"""Proxy HTTP local con caché frente a la API del SIE, compartido por varios servicios"""
+
+import json
+import math
+import re
+import threading
+from datetime import date
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from ._dates import to_date
+from .exceptions import BanxicoAPIError
+
+if TYPE_CHECKING:
+    from .client import BanxicoSIEClient
+
+
+SERIES_PATH = "/SieAPIRest/service/v1/series"
+
+# Las mismas rutas del SIE, con o sin el prefijo /SieAPIRest/service/v1
+_ROUTE = re.compile(
+    r"(?:/SieAPIRest/service/v1)?/series/([A-Za-z0-9]+(?:,[A-Za-z0-9]+)*)/datos/"
+    r"(?:(oportuno)|(\d{4}-\d{2}-\d{2})/(\d{4}-\d{2}-\d{2}))/?"
+)
+
+
+class SIEProxyServer:
+    """
+    Servidor HTTP local que responde las consultas del SIE desde un cliente compartido
+
+    Expone `/series/{ids}/datos/{inicio}/{fin}` y `/series/{ids}/datos/oportuno`
+    (también bajo `/SieAPIRest/service/v1`), con respuestas en el formato del
+    SIE (`idSerie` y `datos` por serie). Cada serie de una consulta se guarda
+    por separado en la caché del cliente, con la misma expiración que
+    `RateCache` (rangos pasados no expiran; "oportuno" y los rangos que llegan
+    a hoy expiran en la siguiente publicación si ya traen su dato, y si no en
+    `negative_ttl`), y las series que faltan se piden a la API en una sola
+    petición. Las consultas idénticas simultáneas comparten esa petición
+    (coalescencia del cliente), así que toda la flota hace una llamada a la
+    API por consulta distinta.
+
+    El proxy usa el token de su cliente: el header `Bmx-Token` de las
+    peticiones entrantes se ignora. Está pensado para escuchar en localhost o
+    en una red interna.
+
+    Args:
+        client: Cliente con el que se consulta la API (idealmente con `cache`)
+        host: Interfaz donde escuchar (default: 127.0.0.1)
+        port: Puerto (default: 8080; 0 elige uno libre)
+
+    Example:
+        >>> client = BanxicoSIEClient("tu_token", cache=RateCache(maxsize=4096))
+        >>> with SIEProxyServer(client, port=8080) as proxy:
+        ...     local = BanxicoSIEClient("cualquier_token", base_url=proxy.url)
+        ...     local.get_rate(Currency.USD)
+    """
+
+    def __init__(self, client: "BanxicoSIEClient", host: str = "127.0.0.1", port: int = 8080):
+        self.client = client
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """URL base para el argumento `base_url` de los clientes"""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}{SERIES_PATH}"
+
+    def serve_forever(self) -> None:
+        """Atiende peticiones en el hilo actual hasta `stop()` (o Ctrl+C)"""
+        self._httpd.serve_forever()
+
+    def start(self) -> "SIEProxyServer":
+        """Arranca el servidor en un hilo de fondo"""
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name="banxico-sie-proxy", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Detiene el servidor y libera el puerto"""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "SIEProxyServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def query(
+        self,
+        series_ids: List[str],
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None
+    ) -> Dict:
+        """
+        Responde una consulta desde la caché, pidiendo a la API sólo las series faltantes
+
+        Args:
+            series_ids: IDs de las series
+            start_date: Fecha inicial YYYY-MM-DD (None: dato "oportuno")
+            end_date: Fecha final YYYY-MM-DD
+
+        Returns:
+            Respuesta en el formato del SIE, con las series en el orden pedido
+
+        Raises:
+            BanxicoAPIError: Si falla la petición a la API
+        """
+        client = self.client
+        cache = client.cache
+        series_ids = list(dict.fromkeys(series_ids))
+        suffix: Tuple[str, ...] = ("oportuno",) if start_date is None else (start_date, end_date)
+
+        datos = {}
+        missing = []
+        for series_id in series_ids:
+            cached = None if cache is None else cache.get(("proxy", series_id) + suffix)
+            if cached is None:
+                missing.append(series_id)
+            else:
+                datos[series_id] = cached["datos"]
+
+        if missing:
+            if start_date is None:
+                data = client._request_with_retries(client._build_latest_url(missing))
+            else:
+                data = client._request_range(missing, start_date, end_date)
+            fetched = client._extract_series(data)
+
+            for series_id in missing:
+                datos[series_id] = fetched.get(series_id, [])
+                if cache is not None:
+                    cache.set(
+                        ("proxy", series_id) + suffix, {"datos": datos[series_id]},
+                        self._expires_at(datos[series_id], end_date)
+                    )
+
+        return {"bmx": {"series": [
+            {"idSerie": series_id, "datos": datos[series_id]} for series_id in series_ids
+        ]}}
+
+    def _expires_at(self, datos: List[Dict], end_date: Optional[str]) -> Optional[float]:
+        """Expiración en caché de los `datos` de una serie (end_date None: "oportuno")"""
+        client = self.client
+        if end_date is not None and to_date(end_date) < client.cache.today():
+            return None  # rango pasado: ya no cambia
+        # Hasta la siguiente publicación sólo si ya trae el dato de la última
+        return client._latest_expires_at(datos[-1]["fecha"] if datos else date.min)
+
+    def _handler_class(self):
+        proxy = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                match = _ROUTE.fullmatch(self.path.split("?")[0])
+                if match is None:
+                    return self._send(404, {"error": {"mensaje": "Ruta no encontrada"}})
+
+                series_ids, oportuno, start_date, end_date = match.groups()
+                if not oportuno:
+                    try:
+                        start, end = date.fromisoformat(start_date), date.fromisoformat(end_date)
+                    except ValueError as e:
+                        return self._send(400, {"error": {"mensaje": f"Fecha inválida: {e}"}})
+                    if start > end:
+                        return self._send(400, {"error": {
+                            "mensaje": "La fecha inicial es posterior a la final"
+                        }})
+                try:
+                    if oportuno:
+                        payload = proxy.query(series_ids.split(","))
+                    else:
+                        payload = proxy.query(series_ids.split(","), start_date, end_date)
+                except BanxicoAPIError as e:
+                    headers = {}
+                    retry_after = getattr(e, "retry_after", None)
+                    if retry_after is not None:
+                        headers["Retry-After"] = str(math.ceil(retry_after))
+                    # Sin status (timeout, conexión, circuito abierto): la API no está disponible
+                    return self._send(
+                        e.status_code or 503,
+                        e.response or {"error": {"mensaje": e.message}},
+                        headers
+                    )
+                self._send(200, payload)
+
+            def _send(self, status: int, payload: Dict, headers: Optional[Dict] = None):
+                body = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+        return Handler
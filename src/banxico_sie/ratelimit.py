@@ -0,0 +1,225 @@
+"""Limitador de peticiones (token bucket), política de reintentos e interruptor de circuito"""
+
+import random
+import threading
+import time
+from typing import Callable, Optional
+
+from .exceptions import BanxicoAPIError, BanxicoCircuitOpenError
+
+
+class TokenBucket:
+    """
+    Limitador token bucket compartido por todas las peticiones de un cliente
+
+    Se generan `rate` tokens por segundo hasta un máximo de `capacity`; cada
+    petición consume uno. Ante un 429 el bucket se pausa para todo el cliente,
+    de modo que los hilos no reintentan en ráfaga.
+
+    Args:
+        rate: Tokens generados por segundo (peticiones sostenidas por segundo)
+        capacity: Tamaño máximo de ráfaga (default: igual a `rate`, mínimo 1)
+        clock: Reloj monotónico en segundos
+        sleep: Función para esperar
+
+    Example:
+        >>> # Cuota de Banxico: 200 consultas cada 5 minutos
+        >>> bucket = TokenBucket(rate=200 / 300, capacity=200)
+        >>> client = BanxicoSIEClient("tu_token", rate_limiter=bucket)
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        if rate <= 0:
+            raise ValueError("rate debe ser mayor a cero")
+
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self.clock = clock
+        self.sleep = sleep
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """
+        Consume un token, esperando a que haya uno disponible
+
+        Args:
+            timeout: Máximo de segundos a esperar (default: sin límite)
+
+        Returns:
+            True si se obtuvo el token; False si no habría uno antes del timeout
+        """
+        with self._lock:
+            now = self.clock()
+            self._refill(now)
+            wait = max(self._paused_until - now, (1 - self._tokens) / self.rate, 0.0)
+            if timeout is not None and wait > timeout:
+                return False
+            # Se reserva el token ahora para que los hilos esperen en fila
+            self._tokens -= 1
+
+        if wait > 0:
+            self.sleep(wait)
+        return True
+
+    def pause(self, seconds: float) -> None:
+        """
+        Detiene la entrega de tokens durante `seconds` (p. ej. tras un 429)
+
+        Args:
+            seconds: Segundos sin entregar tokens
+        """
+        with self._lock:
+            now = self.clock()
+            self._refill(now)
+            self._paused_until = max(self._paused_until, now + seconds)
+            self._tokens = min(self._tokens, 0.0)
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        self._updated = now
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+
+
+class RetryPolicy:
+    """
+    Política de reintentos con backoff exponencial y jitter
+
+    Se reintentan los 429, los errores 5xx y los errores de red (timeout o
+    conexión). Si la respuesta trae `Retry-After`, se espera al menos ese tiempo.
+
+    Args:
+        max_retries: Número máximo de reintentos (default: 3)
+        backoff_factor: Espera base en segundos; se duplica en cada intento (default: 0.5)
+        max_backoff: Espera máxima entre intentos en segundos (default: 60)
+        jitter: Si True, la espera es aleatoria entre 0 y el backoff ("full jitter")
+
+    Example:
+        >>> client = BanxicoSIEClient("tu_token", retry=RetryPolicy(max_retries=5), deadline=60)
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 60.0,
+        jitter: bool = True
+    ):
+        if max_retries < 0:
+            raise ValueError("max_retries no puede ser negativo")
+
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+
+    def delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        Calcula la espera antes del reintento número `attempt` (desde 0)
+
+        Args:
+            attempt: Número de reintento, empezando en 0
+            retry_after: Segundos indicados por el servidor en `Retry-After`
+
+        Returns:
+            Segundos a esperar
+        """
+        backoff = min(self.max_backoff, self.backoff_factor * (2 ** attempt))
+        if self.jitter:
+            backoff = random.uniform(0, backoff)
+        if retry_after is not None:
+            return retry_after + (random.uniform(0, self.backoff_factor) if self.jitter else 0)
+        return backoff
+
+
+class CircuitBreaker:
+    """
+    Interruptor de circuito: deja de llamar a la API tras fallas consecutivas
+
+    Cuentan como falla los timeouts, los errores de conexión y los 5xx. Tras
+    `failure_threshold` fallas seguidas el circuito se abre y las peticiones
+    fallan de inmediato con BanxicoCircuitOpenError, sin esperar el timeout.
+    Pasados `recovery_timeout` segundos se deja pasar una sola petición de
+    prueba: si responde, el circuito se cierra; si falla, se abre otra vez.
+
+    Args:
+        failure_threshold: Fallas consecutivas que abren el circuito (default: 5)
+        recovery_timeout: Segundos abierto antes de probar de nuevo (default: 30)
+        clock: Reloj monotónico en segundos
+
+    Example:
+        >>> client = BanxicoSIEClient("tu_token", circuit_breaker=CircuitBreaker())
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        if failure_threshold <= 0:
+            raise ValueError("failure_threshold debe ser mayor a cero")
+        if recovery_timeout < 0:
+            raise ValueError("recovery_timeout no puede ser negativo")
+
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.clock = clock
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """Estado del circuito: "closed", "open" o "half_open" (se puede probar)"""
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            if self._probing or self.clock() - self._opened_at >= self.recovery_timeout:
+                return "half_open"
+            return "open"
+
+    def before_request(self) -> None:
+        """
+        Autoriza una petición
+
+        Raises:
+            BanxicoCircuitOpenError: Si el circuito está abierto, o si ya hay
+                una petición de prueba en curso
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return
+            remaining = self._opened_at + self.recovery_timeout - self.clock()
+            if remaining <= 0 and not self._probing:
+                self._probing = True
+                return
+        raise BanxicoCircuitOpenError(retry_after=max(remaining, 0.0))
+
+    def record(self, error: Optional[BanxicoAPIError] = None) -> None:
+        """
+        Registra el resultado de una petición autorizada
+
+        Args:
+            error: Error de la petición (None si tuvo éxito); los errores 4xx
+                cuentan como éxito, porque la API sí respondió
+        """
+        failed = error is not None and (error.status_code is None or error.status_code >= 500)
+        with self._lock:
+            self._probing = False
+            if not failed:
+                self._failures = 0
+                self._opened_at = None
+                return
+            self._failures += 1
+            if self._opened_at is not None or self._failures >= self.failure_threshold:
+                self._opened_at = self.clock()
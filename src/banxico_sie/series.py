@@ -0,0 +1,264 @@
+"""Serie de tipos de cambio en formato columnar (arreglos contiguos)"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from ._dates import parse_date_string
+from .enums import Currency
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+# date(1970, 1, 1).toordinal(): convierte ordinales de Python a días desde epoch
+_EPOCH_ORDINAL = 719163
+
+_NAN = float("nan")
+
+
+class RateSeries:
+    """
+    Tipos de cambio de una moneda guardados en arreglos contiguos
+
+    Las fechas se guardan como ordinales (`date.toordinal()`) y los valores
+    como `float` de 64 bits (NaN para datos N/E); los metadatos de la moneda se
+    guardan una sola vez. Iterar o indexar regresa dicts con el mismo formato
+    que `get_rates_range`.
+
+    Args:
+        currency: Moneda de la serie
+        ordinals: Fechas como ordinales, en orden ascendente
+        values: Valores del tipo de cambio, alineados con `ordinals`
+
+    Example:
+        >>> serie = client.get_rates_range(Currency.USD, "2000-01-01", "2024-12-31", as_series=True)
+        >>> serie.get("2024-12-26")["valor"]
+        >>> fechas, valores = serie.to_numpy()
+    """
+
+    __slots__ = ("currency", "_ordinals", "_values")
+
+    def __init__(self, currency: Currency, ordinals: array, values: array):
+        if len(ordinals) != len(values):
+            raise ValueError("ordinals y values deben tener la misma longitud")
+
+        self.currency = currency
+        self._ordinals = ordinals
+        self._values = values
+
+    @classmethod
+    def from_datos(cls, currency: Currency, series_data: List[Dict]) -> "RateSeries":
+        """
+        Construye la serie a partir de la lista `datos` de la API
+
+        Args:
+            currency: Moneda de la serie
+            series_data: Lista de dicts {"fecha": "dd/mm/yyyy", "dato": str}
+
+        Returns:
+            RateSeries con las observaciones en el orden recibido
+        """
+        ordinals = array("l")
+        values = array("d")
+        add_ordinal = ordinals.append
+        add_value = values.append
+        # Ordinal del día anterior al primero de cada mes ("mm/yyyy"): una fecha
+        # por mes en lugar de una por observación
+        months: Dict[str, int] = {}
+        for item in series_data:
+            fecha = item["fecha"]
+            month_start = months.get(fecha[3:])
+            if month_start is None:
+                month_start = months[fecha[3:]] = (
+                    date(int(fecha[6:10]), int(fecha[3:5]), 1).toordinal() - 1
+                )
+            add_ordinal(month_start + int(fecha[0:2]))
+            # Manejar valores N/E (No Existe) u otros no numéricos
+            dato = item["dato"]
+            try:
+                add_value(float(dato) if dato else _NAN)
+            except (ValueError, TypeError):
+                add_value(_NAN)
+        return cls(currency, ordinals, values)
+
+    @property
+    def moneda(self) -> str:
+        """Código de la moneda (p. ej. 'USD')"""
+        return self.currency.name.replace("_SPOT", "")
+
+    @property
+    def dates(self) -> List[date]:
+        """Fechas de la serie como objetos date"""
+        return [date.fromordinal(ordinal) for ordinal in self._ordinals]
+
+    @property
+    def values(self) -> array:
+        """Valores de la serie (NaN para datos N/E)"""
+        return self._values
+
+    @property
+    def ordinals(self) -> array:
+        """Fechas de la serie como ordinales (`date.toordinal()`)"""
+        return self._ordinals
+
+    def get(
+        self, fecha: Union[str, date, datetime], default: Optional[Dict] = None
+    ) -> Optional[Dict]:
+        """
+        Busca la observación de una fecha exacta (búsqueda binaria)
+
+        Args:
+            fecha: Fecha como date, datetime o string 'YYYY-MM-DD' / 'dd/mm/yyyy'
+            default: Valor a regresar si no hay observación en esa fecha
+
+        Returns:
+            Dict del tipo de cambio, o `default`
+        """
+        ordinal = _to_ordinal(fecha)
+        index = bisect_left(self._ordinals, ordinal)
+        if index < len(self._ordinals) and self._ordinals[index] == ordinal:
+            return self._record(index)
+        return default
+
+    def asof(
+        self, fecha: Union[str, date, datetime], default: Optional[Dict] = None
+    ) -> Optional[Dict]:
+        """
+        Regresa la última observación en o antes de una fecha
+
+        Args:
+            fecha: Fecha como date, datetime o string 'YYYY-MM-DD' / 'dd/mm/yyyy'
+            default: Valor a regresar si la fecha es anterior a toda la serie
+
+        Returns:
+            Dict del tipo de cambio, o `default`
+        """
+        index = bisect_right(self._ordinals, _to_ordinal(fecha)) - 1
+        if index < 0:
+            return default
+        return self._record(index)
+
+    def asof_values(self, fechas: Union[Iterable, "np.ndarray"]) -> Union[array, "np.ndarray"]:
+        """
+        Valor aplicable a cada fecha: última observación válida en o antes de ella
+
+        Los días sin publicación (o con dato N/E) toman el último valor publicado.
+        Con NumPy instalado la búsqueda es vectorizada (`searchsorted`).
+
+        Args:
+            fechas: Fechas como date, datetime, strings, o arreglo datetime64
+
+        Returns:
+            Valores alineados con `fechas` (NaN si la fecha es anterior a la serie);
+            arreglo float64 de NumPy si está instalado, si no `array('d')`
+        """
+        return self._asof_ordinals(_to_ordinal_array(fechas))
+
+    def _asof_ordinals(self, query):
+        """`asof_values` para fechas ya convertidas con `_to_ordinal_array`"""
+        np = _numpy()
+        if np is not None:
+            all_values = np.frombuffer(self._values, dtype=np.float64)
+            valid = ~np.isnan(all_values)
+            ordinals = np.asarray(self._ordinals, dtype=np.int64)[valid]
+            values = all_values[valid]
+            index = np.searchsorted(ordinals, query, side="right") - 1
+            if not len(values):
+                return np.full(len(index), np.nan)
+            result = values[np.maximum(index, 0)]
+            result[index < 0] = np.nan
+            return result
+
+        pairs = [(o, v) for o, v in zip(self._ordinals, self._values) if v == v]
+        ordinals = [o for o, _ in pairs]
+        result = array("d")
+        for ordinal in query:
+            index = bisect_right(ordinals, ordinal) - 1
+            result.append(pairs[index][1] if index >= 0 else _NAN)
+        return result
+
+    def to_numpy(self) -> Tuple["np.ndarray", "np.ndarray"]:
+        """
+        Convierte la serie a arreglos de NumPy
+
+        Los valores se exponen sin copia sobre el buffer interno.
+
+        Returns:
+            Tupla (fechas como datetime64[D], valores como float64)
+        """
+        np = _numpy()
+        if np is None:
+            raise ImportError("to_numpy requiere numpy: pip install numpy")
+
+        ordinals = np.asarray(self._ordinals, dtype=np.int64)
+        dates = (ordinals - _EPOCH_ORDINAL).astype("datetime64[D]")
+        values = np.frombuffer(self._values, dtype=np.float64)
+        return dates, values
+
+    def to_list(self) -> List[Dict]:
+        """Regresa la serie como lista de dicts (formato de `get_rates_range`)"""
+        return list(self)
+
+    def _record(self, index: int) -> Dict:
+        valor = self._values[index]
+        return {
+            "fecha": date.fromordinal(self._ordinals[index]).strftime("%d/%m/%Y"),
+            "moneda": self.moneda,
+            "moneda_nombre": self.currency.name_es,
+            "simbolo": self.currency.symbol,
+            "valor": None if valor != valor else valor,
+            "tipo": self.currency.tipo
+        }
+
+    def __len__(self) -> int:
+        return len(self._ordinals)
+
+    def __iter__(self) -> Iterator[Dict]:
+        for index in range(len(self._ordinals)):
+            yield self._record(index)
+
+    def __getitem__(self, key: Union[int, slice]) -> Union[Dict, "RateSeries"]:
+        if isinstance(key, slice):
+            return RateSeries(self.currency, self._ordinals[key], self._values[key])
+        if key < 0:
+            key += len(self._ordinals)
+        if not 0 <= key < len(self._ordinals):
+            raise IndexError("índice fuera de rango")
+        return self._record(key)
+
+    def __repr__(self) -> str:
+        if not self._ordinals:
+            return f"RateSeries({self.currency.name}, vacía)"
+        first = date.fromordinal(self._ordinals[0])
+        last = date.fromordinal(self._ordinals[-1])
+        return f"RateSeries({self.currency.name}, {len(self)} datos, {first} a {last})"
+
+
+def _numpy():
+    """Importa NumPy bajo demanda; None si no está instalado"""
+    try:
+        import numpy
+    except ImportError:  # pragma: no cover - dependencia opcional
+        return None
+    return numpy
+
+
+def _to_ordinal_array(fechas: Union[Iterable, "np.ndarray"]):
+    """Convierte fechas (o un arreglo datetime64) a ordinales; int64 si hay NumPy"""
+    np = _numpy()
+    if np is not None:
+        if isinstance(fechas, np.ndarray) and np.issubdtype(fechas.dtype, np.datetime64):
+            return fechas.astype("datetime64[D]").astype(np.int64) + _EPOCH_ORDINAL
+        return np.fromiter((_to_ordinal(fecha) for fecha in fechas), dtype=np.int64)
+    return [_to_ordinal(fecha) for fecha in fechas]
+
+
+def _to_ordinal(fecha: Union[str, date, datetime]) -> int:
+    """Convierte date, datetime o string ('YYYY-MM-DD' o 'dd/mm/yyyy') a ordinal"""
+    if isinstance(fecha, datetime):
+        return fecha.date().toordinal()
+    if isinstance(fecha, date):
+        return fecha.toordinal()
+    return parse_date_string(fecha).toordinal()
@@ -0,0 +1,241 @@
+"""Caché compartida entre procesos (SQLite en modo WAL) para tipos de cambio"""
+
+import json
+import os
+import sqlite3
+import time as _time
+from datetime import date, time, timezone
+from typing import Any, Callable, Hashable, Optional
+
+from .cache import FIX_PUBLICATION_TIME, MEXICO_CITY_TZ, CacheInfo, RateCache, _NotFound
+
+
+# Un acierto sólo actualiza `used_at` (para el desalojo LRU) si es más viejo que
+# esto: así las lecturas casi nunca abren una transacción de escritura
+_TOUCH_INTERVAL = 60.0
+
+
+class SQLiteRateCache(RateCache):
+    """
+    Caché con la misma interfaz y política de expiración que `RateCache`,
+    guardada en un archivo SQLite que comparten todos los procesos del host
+
+    Pensada para despliegues con varios workers (gunicorn, Celery): el dato
+    que pide un worker queda disponible para los demás, así que las
+    peticiones a la API por host no crecen con el número de procesos. El
+    archivo usa el modo WAL, de modo que las lecturas no bloquean a las
+    escrituras; cada proceso abre su propia conexión (también después de un
+    `fork`).
+
+    Las estadísticas de `info()` (aciertos, fallos, desalojos) son del proceso
+    actual; `currsize` es el de la caché compartida. Si el archivo no se puede
+    leer o escribir (p. ej. sigue bloqueado después de `busy_timeout`), la
+    consulta cuenta como fallo y la escritura se omite: el cliente va a la API.
+
+    Args:
+        path: Ruta del archivo SQLite, p. ej. "/tmp/banxico-cache.db"
+        maxsize: Número máximo de entradas (default: 1024)
+        publication_time: Hora de publicación diaria del FIX (default: 12:00)
+        tz: Zona horaria de la publicación (default: Ciudad de México)
+        clock: Función que regresa el tiempo actual en segundos epoch
+        stale_ttl: Segundos que una entrada expirada se conserva (ver `RateCache`)
+        negative_ttl: Segundos que se recuerda que hoy no tiene datos (ver `RateCache`)
+        busy_timeout: Segundos que se espera si otro proceso tiene el archivo
+            bloqueado para escritura (default: 5)
+
+    Example:
+        >>> cache = SQLiteRateCache("/tmp/banxico-cache.db")
+        >>> client = BanxicoSIEClient("tu_token", cache=cache)
+    """
+
+    def __init__(
+        self,
+        path: str,
+        maxsize: int = 1024,
+        publication_time: time = FIX_PUBLICATION_TIME,
+        tz: timezone = MEXICO_CITY_TZ,
+        clock: Callable[[], float] = _time.time,
+        stale_ttl: Optional[float] = None,
+        negative_ttl: Optional[float] = 300.0,
+        busy_timeout: float = 5.0
+    ):
+        super().__init__(maxsize, publication_time, tz, clock, stale_ttl, negative_ttl)
+        self.path = path
+        self.busy_timeout = busy_timeout
+        self._conn = None
+        self._pid = None
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS entries ("
+                    " key TEXT PRIMARY KEY,"
+                    " value TEXT NOT NULL,"
+                    " not_found INTEGER NOT NULL DEFAULT 0,"
+                    " expires_at REAL,"
+                    " used_at REAL NOT NULL"
+                    ")"
+                )
+                conn.execute("CREATE INDEX IF NOT EXISTS entries_used_at ON entries (used_at)")
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Obtiene un valor vigente de la caché
+
+        Args:
+            key: Llave de la entrada
+
+        Returns:
+            El valor guardado, o None si no existe o ya expiró
+        """
+        with self._lock:
+            try:
+                conn = self._connection()
+                now = self.clock()
+                entry = self._entry(conn, key)
+                if entry is not None:
+                    value, expires_at, used_at = entry
+                    if expires_at is None or expires_at > now:
+                        if used_at + _TOUCH_INTERVAL <= now:
+                            with conn:
+                                conn.execute(
+                                    "UPDATE entries SET used_at = ? WHERE key = ?",
+                                    (now, _encode_key(key))
+                                )
+                        self.hits += 1
+                        return value
+                    if not self._keeps_stale(expires_at, now):
+                        self._delete(conn, key)
+            except sqlite3.Error:
+                pass  # archivo bloqueado o inaccesible: se trata como fallo
+            self.misses += 1
+            return None
+
+    def get_stale(self, key: Hashable) -> Optional[Any]:
+        """
+        Obtiene un valor aunque haya expirado, si sigue dentro de `stale_ttl`
+
+        Args:
+            key: Llave de la entrada
+
+        Returns:
+            El valor guardado, o None si no existe o ya pasó su ventana `stale_ttl`
+        """
+        with self._lock:
+            try:
+                conn = self._connection()
+                entry = self._entry(conn, key)
+                if entry is None:
+                    return None
+                value, expires_at, _ = entry
+                now = self.clock()
+                if expires_at is None or expires_at > now or self._keeps_stale(expires_at, now):
+                    return value
+                self._delete(conn, key)
+            except sqlite3.Error:
+                pass
+            return None
+
+    def set(self, key: Hashable, value: Any, expires_at: Optional[float] = None) -> None:
+        """
+        Guarda un valor, desalojando las entradas menos usadas si la caché está llena
+
+        Args:
+            key: Llave de la entrada
+            value: Valor a guardar (dict de tipo de cambio)
+            expires_at: Instante de expiración en segundos epoch (None: no expira)
+        """
+        not_found = isinstance(value, _NotFound)
+        encoded = value.message if not_found else json.dumps(value, default=_encode_date)
+        with self._lock:
+            try:
+                conn = self._connection()
+                with conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO entries"
+                        " (key, value, not_found, expires_at, used_at)"
+                        " VALUES (?, ?, ?, ?, ?)",
+                        (_encode_key(key), encoded, int(not_found), expires_at, self.clock())
+                    )
+                    (size,) = conn.execute("SELECT COUNT(*) FROM entries").fetchone()
+                    if size > self.maxsize:
+                        conn.execute(
+                            "DELETE FROM entries WHERE key IN"
+                            " (SELECT key FROM entries ORDER BY used_at LIMIT ?)",
+                            (size - self.maxsize,)
+                        )
+                        self.evictions += size - self.maxsize
+            except sqlite3.Error:
+                pass  # la caché es una optimización: sin escritura, sólo no se guarda
+
+    def info(self) -> CacheInfo:
+        """Regresa las estadísticas de uso (del proceso) y el tamaño de la caché compartida"""
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.evictions, self._size(), self.maxsize)
+
+    def clear(self) -> None:
+        """Vacía la caché compartida y reinicia las estadísticas del proceso"""
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute("DELETE FROM entries")
+            self.hits = self.misses = self.evictions = 0
+
+    def close(self) -> None:
+        """Cierra la conexión de este proceso"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._size()
+
+    def _connection(self) -> sqlite3.Connection:
+        """Conexión del proceso actual; se reabre si el proceso es un fork"""
+        if self._conn is None or self._pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=self.busy_timeout, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn = conn
+            self._pid = os.getpid()
+        return self._conn
+
+    def _entry(self, conn: sqlite3.Connection, key: Hashable):
+        row = conn.execute(
+            "SELECT value, not_found, expires_at, used_at FROM entries WHERE key = ?",
+            (_encode_key(key),)
+        ).fetchone()
+        if row is None:
+            return None
+        encoded, not_found, expires_at, used_at = row
+        value = _NotFound(encoded) if not_found else json.loads(encoded, object_hook=_decode_date)
+        return value, expires_at, used_at
+
+    def _delete(self, conn: sqlite3.Connection, key: Hashable) -> None:
+        with conn:
+            conn.execute("DELETE FROM entries WHERE key = ?", (_encode_key(key),))
+
+    def _size(self) -> int:
+        return self._connection().execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+
+def _encode_key(key: Hashable) -> str:
+    """Llave como texto: las tuplas de la caché (serie, fecha) se unen con '|'"""
+    if isinstance(key, tuple):
+        return "|".join(str(part) for part in key)
+    return str(key)
+
+
+def _encode_date(value: Any) -> Any:
+    """Codifica los `fecha` date (clientes con parse_dates=True) para JSON"""
+    if isinstance(value, date):
+        return {"$date": value.isoformat()}
+    raise TypeError(f"{type(value).__name__} no es serializable")
+
+
+def _decode_date(obj: dict) -> Any:
+    if len(obj) == 1 and "$date" in obj:
+        return date.fromisoformat(obj["$date"])
+    return obj
@@ -0,0 +1,197 @@
+"""Almacenamiento local persistente (SQLite) de observaciones del SIE"""
+
+import sqlite3
+import threading
+from datetime import date, timedelta
+from typing import List, Dict, Optional, Tuple
+
+
+class SQLiteRateStore:
+    """
+    Almacén en disco de observaciones por serie y fecha
+
+    Además de las observaciones guarda los intervalos de fechas que ya se
+    consultaron a la API, de modo que un rango se puede responder localmente
+    y sólo se piden los sub-intervalos faltantes (incluidos fines de semana
+    y días sin publicación, que no tienen observaciones).
+
+    Args:
+        path: Ruta del archivo SQLite (default: ":memory:")
+
+    Example:
+        >>> store = SQLiteRateStore("banxico.db")
+        >>> client = BanxicoSIEClient("tu_token", store=store)
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS observations ("
+                " series_id TEXT NOT NULL,"
+                " fecha TEXT NOT NULL,"
+                " dato TEXT,"
+                " PRIMARY KEY (series_id, fecha)"
+                ") WITHOUT ROWID"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS coverage ("
+                " series_id TEXT NOT NULL,"
+                " start_date TEXT NOT NULL,"
+                " end_date TEXT NOT NULL,"
+                " PRIMARY KEY (series_id, start_date)"
+                ") WITHOUT ROWID"
+            )
+
+    def get_points(self, series_id: str, start: date, end: date) -> List[Dict]:
+        """
+        Obtiene las observaciones guardadas de una serie en un rango
+
+        Args:
+            series_id: ID de la serie de Banxico
+            start: Fecha inicial (inclusive)
+            end: Fecha final (inclusive)
+
+        Returns:
+            Lista de dicts {"fecha": "dd/mm/yyyy", "dato": str} en orden de fecha,
+            con el mismo formato que `datos` en la respuesta de la API
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT fecha, dato FROM observations"
+                " WHERE series_id = ? AND fecha BETWEEN ? AND ? ORDER BY fecha",
+                (series_id, start.isoformat(), end.isoformat())
+            ).fetchall()
+        return [{"fecha": _to_api_date(fecha), "dato": dato} for fecha, dato in rows]
+
+    def add_points(self, series_id: str, datos: List[Dict]) -> None:
+        """
+        Guarda (o reemplaza) observaciones de una serie
+
+        Args:
+            series_id: ID de la serie de Banxico
+            datos: Lista `datos` tal como viene en la respuesta de la API
+        """
+        rows = [(series_id, _to_iso_date(item["fecha"]), item["dato"]) for item in datos]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO observations (series_id, fecha, dato) VALUES (?, ?, ?)",
+                rows
+            )
+
+    def last_date(self, series_id: str) -> Optional[date]:
+        """
+        Fecha de la observación más reciente guardada de una serie
+
+        Args:
+            series_id: ID de la serie de Banxico
+
+        Returns:
+            La fecha, o None si la serie no tiene observaciones
+        """
+        with self._lock:
+            (fecha,) = self._conn.execute(
+                "SELECT MAX(fecha) FROM observations WHERE series_id = ?", (series_id,)
+            ).fetchone()
+        return None if fecha is None else date.fromisoformat(fecha)
+
+    def missing_intervals(self, series_id: str, start: date, end: date) -> List[Tuple[date, date]]:
+        """
+        Calcula los sub-intervalos de [start, end] que aún no se han consultado
+
+        Args:
+            series_id: ID de la serie de Banxico
+            start: Fecha inicial (inclusive)
+            end: Fecha final (inclusive)
+
+        Returns:
+            Lista de tuplas (inicio, fin) ordenadas y sin traslape
+        """
+        if start > end:
+            return []
+
+        missing = []
+        cursor = start
+        for covered_start, covered_end in self._coverage(series_id):
+            if covered_end < cursor:
+                continue
+            if covered_start > end:
+                break
+            if covered_start > cursor:
+                missing.append((cursor, covered_start - timedelta(days=1)))
+            cursor = covered_end + timedelta(days=1)
+            if cursor > end:
+                return missing
+        missing.append((cursor, end))
+        return missing
+
+    def mark_covered(self, series_id: str, start: date, end: date) -> None:
+        """
+        Registra que el intervalo [start, end] ya se consultó a la API
+
+        Los intervalos traslapados o contiguos se fusionan.
+
+        Args:
+            series_id: ID de la serie de Banxico
+            start: Fecha inicial (inclusive)
+            end: Fecha final (inclusive)
+        """
+        with self._lock, self._conn:
+            intervals = self._coverage_unlocked(series_id) + [(start, end)]
+            intervals.sort()
+            merged = [intervals[0]]
+            for interval_start, interval_end in intervals[1:]:
+                last_start, last_end = merged[-1]
+                if interval_start <= last_end + timedelta(days=1):
+                    merged[-1] = (last_start, max(last_end, interval_end))
+                else:
+                    merged.append((interval_start, interval_end))
+
+            self._conn.execute("DELETE FROM coverage WHERE series_id = ?", (series_id,))
+            self._conn.executemany(
+                "INSERT INTO coverage (series_id, start_date, end_date) VALUES (?, ?, ?)",
+                [(series_id, s.isoformat(), e.isoformat()) for s, e in merged]
+            )
+
+    def clear(self, series_id: str = None) -> None:
+        """
+        Borra observaciones y cobertura (de una serie o de todas)
+
+        Args:
+            series_id: ID de la serie a borrar (default: todas)
+        """
+        with self._lock, self._conn:
+            if series_id is None:
+                self._conn.execute("DELETE FROM observations")
+                self._conn.execute("DELETE FROM coverage")
+            else:
+                self._conn.execute("DELETE FROM observations WHERE series_id = ?", (series_id,))
+                self._conn.execute("DELETE FROM coverage WHERE series_id = ?", (series_id,))
+
+    def close(self) -> None:
+        """Cierra la conexión a la base de datos"""
+        with self._lock:
+            self._conn.close()
+
+    def _coverage(self, series_id: str) -> List[Tuple[date, date]]:
+        with self._lock:
+            return self._coverage_unlocked(series_id)
+
+    def _coverage_unlocked(self, series_id: str) -> List[Tuple[date, date]]:
+        rows = self._conn.execute(
+            "SELECT start_date, end_date FROM coverage WHERE series_id = ? ORDER BY start_date",
+            (series_id,)
+        ).fetchall()
+        return [(date.fromisoformat(s), date.fromisoformat(e)) for s, e in rows]
+
+
+def _to_iso_date(fecha: str) -> str:
+    """Convierte 'dd/mm/yyyy' (formato de la API) a 'yyyy-mm-dd'"""
+    return f"{fecha[6:10]}-{fecha[3:5]}-{fecha[0:2]}"
+
+
+def _to_api_date(fecha: str) -> str:
+    """Convierte 'yyyy-mm-dd' a 'dd/mm/yyyy' (formato de la API)"""
+    return f"{fecha[8:10]}/{fecha[5:7]}/{fecha[0:4]}"
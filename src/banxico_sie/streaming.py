@@ -0,0 +1,100 @@
+"""Parseo incremental de respuestas del SIE sin materializar el JSON completo"""
+
+import re
+from typing import Any, Callable, Iterable, Iterator, Dict, Optional, Tuple
+
+from ._json import loads as _default_loads
+from .exceptions import BanxicoAPIError
+
+
+# Se trabaja sobre los bytes: en UTF-8 los caracteres estructurales de JSON
+# nunca aparecen dentro de un carácter multibyte.
+_STRUCTURAL_RE = re.compile(rb'[{}\[\]"]')
+_STRING = rb'"(?:[^"\\]|\\.)*"'
+_STRING_RE = re.compile(_STRING, re.DOTALL)
+# Un objeto plano (sin objetos ni arreglos anidados), como cada elemento de
+# `datos`; las llaves y corchetes dentro de textos no cuentan.
+_FLAT_OBJECT_RE = re.compile(rb'\{(?:[^{}\[\]"]|' + _STRING + rb')*\}', re.DOTALL)
+# Lo mismo sin el cierre: se detiene donde el objeto deja de ser plano o de estar completo
+_FLAT_PREFIX_RE = re.compile(rb'\{(?:[^{}\[\]"]|' + _STRING + rb')*', re.DOTALL)
+# La llave idSerie de una serie cuyo objeto todavía no termina
+_ID_RE = re.compile(rb'"idSerie"\s*:\s*(' + _STRING + rb')', re.DOTALL)
+# Una llave idSerie cortada al final del fragmento, antes de terminar su valor
+_ID_PENDING_RE = re.compile(rb'"idSerie"\s*(?::\s*(?:"(?:[^"\\]|\\.)*\\?)?)?\Z', re.DOTALL)
+
+
+def iter_series_items(
+    chunks: Iterable[bytes],
+    loads: Callable[[bytes], Any] = _default_loads
+) -> Iterator[Tuple[str, Dict]]:
+    """
+    Recorre una respuesta `bmx.series[*].datos` conforme llegan los bytes
+
+    Sólo se conserva en memoria el fragmento aún no procesado, de modo que el
+    consumo es constante sin importar el tamaño del rango. Supone la forma de
+    las respuestas del SIE: `idSerie` aparece antes que `datos`.
+
+    Args:
+        chunks: Fragmentos del cuerpo de la respuesta (p. ej. `response.iter_content()`)
+        loads: Función que decodifica cada objeto (bytes) de la respuesta
+
+    Yields:
+        Tuplas (idSerie, {"fecha": "dd/mm/yyyy", "dato": str}) en el orden de la respuesta
+
+    Raises:
+        BanxicoAPIError: Si la respuesta no es JSON válido
+    """
+    buffer = b""
+    series_id: Optional[str] = None
+
+    for chunk in chunks:
+        buffer += chunk
+        pos = 0
+        while True:
+            match = _STRUCTURAL_RE.search(buffer, pos)
+            if match is None:
+                pos = len(buffer)
+                break
+            start = match.start()
+            char = buffer[start:start + 1]
+
+            if char == b"{":
+                obj = _FLAT_OBJECT_RE.match(buffer, start)
+                if obj is not None:
+                    item = _decode(loads, obj.group())
+                    if "fecha" in item:
+                        yield series_id, item
+                    elif "idSerie" in item:
+                        # Serie sin datos: su objeto es plano
+                        series_id = item["idSerie"]
+                    pos = obj.end()
+                    continue
+                end = _FLAT_PREFIX_RE.match(buffer, start).end()
+                if end == len(buffer) or buffer[end:end + 1] == b'"':
+                    # Objeto incompleto: se espera al siguiente fragmento
+                    pos = start
+                    break
+                # Objeto con anidados (la serie con sus `datos`): se recorre por dentro
+                pos = start + 1
+            elif char == b'"':
+                ident = _ID_RE.match(buffer, start)
+                if ident is not None:
+                    series_id = _decode(loads, ident.group(1))
+                    pos = ident.end()
+                    continue
+                string = _STRING_RE.match(buffer, start)
+                if string is None or _ID_PENDING_RE.match(buffer, start):
+                    # Texto incompleto, o idSerie sin su valor todavía
+                    pos = start
+                    break
+                pos = string.end()
+            else:
+                pos = start + 1
+        buffer = buffer[pos:]
+
+
+def _decode(loads: Callable[[bytes], Any], content: bytes) -> Any:
+    try:
+        return loads(content)
+    except ValueError as e:
+        raise BanxicoAPIError(f"Error parseando respuesta de Banxico: {e}")
@@ -0,0 +1,30 @@
+"""Fixtures compartidos por los tests"""
+
+from datetime import datetime
+from typing import Union
+
+import pytest
+
+from banxico_sie.cache import MEXICO_CITY_TZ
+
+
+class FakeClock:
+    """Reloj controlable para los tests (segundos epoch)"""
+
+    def __init__(self, when: Union[datetime, float]):
+        self.set(when)
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+    def set(self, when: Union[datetime, float]) -> None:
+        self.now = when.timestamp() if isinstance(when, datetime) else float(when)
+
+
+@pytest.fixture
+def clock():
+    """Reloj fijo el jueves 26/12/2024 a las 10:00 de la Ciudad de México"""
+    return FakeClock(datetime(2024, 12, 26, 10, 0, tzinfo=MEXICO_CITY_TZ))
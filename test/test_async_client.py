@@ -0,0 +1,119 @@
+"""Tests para el cliente asíncrono"""
+
+import asyncio
+
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+from aiohttp import web
+
+from banxico_sie import AsyncBanxicoSIEClient, Currency
+from banxico_sie.exceptions import BanxicoAuthError, BanxicoDataNotFoundError
+
+
+def run_with_server(handler, scenario):
+    """Levanta un servidor SIE local, apunta un cliente a él y ejecuta el escenario"""
+
+    async def main():
+        app = web.Application()
+        app.router.add_get("/series/{ids}/datos/{start}/{end}", handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+
+        client = AsyncBanxicoSIEClient("test_token_123", max_concurrency=2)
+        client.BASE_URL = f"http://127.0.0.1:{port}/series"
+        try:
+            return await scenario(client)
+        finally:
+            await client.close()
+            await runner.cleanup()
+
+    return asyncio.run(main())
+
+
+async def series_handler(request):
+    """Responde un dato por serie con la fecha inicial solicitada"""
+    ids = request.match_info["ids"].split(",")
+    start = request.match_info["start"]
+    fecha = f"{start[8:10]}/{start[5:7]}/{start[0:4]}"
+    return web.json_response({
+        "bmx": {"series": [
+            {"idSerie": series_id, "datos": [{"fecha": fecha, "dato": "20.5"}]}
+            for series_id in ids
+        ]}
+    })
+
+
+class TestAsyncBanxicoSIEClient:
+    """Suite de tests para AsyncBanxicoSIEClient"""
+
+    def test_init_without_token(self):
+        """Se requiere un token"""
+        with pytest.raises(ValueError, match="Se requiere un token de API válido"):
+            AsyncBanxicoSIEClient("")
+
+    def test_get_rate(self):
+        """get_rate usa el mismo parseo que el cliente síncrono"""
+        async def scenario(client):
+            return await client.get_rate(Currency.EUR, fecha="2024-12-26")
+
+        rate = run_with_server(series_handler, scenario)
+
+        assert rate["fecha"] == "26/12/2024"
+        assert rate["moneda"] == "EUR"
+        assert rate["valor"] == 20.5
+
+    def test_get_rates_many(self):
+        """Varias monedas se piden en una sola petición"""
+        async def scenario(client):
+            return await client.get_rates_many([Currency.USD, Currency.GBP], fecha="2024-12-26")
+
+        rates = run_with_server(series_handler, scenario)
+
+        assert set(rates) == {Currency.USD, Currency.GBP}
+
+    def test_concurrency_cap(self):
+        """Nunca hay más peticiones en curso que max_concurrency"""
+        state = {"active": 0, "peak": 0}
+
+        async def slow_handler(request):
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+            await asyncio.sleep(0.02)
+            state["active"] -= 1
+            return await series_handler(request)
+
+        async def scenario(client):
+            return await asyncio.gather(*[
+                client.get_rate(Currency.USD, fecha=f"2024-12-{day:02d}") for day in range(1, 11)
+            ])
+
+        rates = run_with_server(slow_handler, scenario)
+
+        assert len(rates) == 10
+        assert state["peak"] == 2
+
+    def test_auth_error(self):
+        """Un 401 se traduce a BanxicoAuthError"""
+        async def unauthorized(request):
+            return web.json_response({"error": "Invalid token"}, status=401)
+
+        async def scenario(client):
+            await client.get_rate(Currency.USD, fecha="2024-12-26")
+
+        with pytest.raises(BanxicoAuthError):
+            run_with_server(unauthorized, scenario)
+
+    def test_no_data(self):
+        """Una serie sin datos lanza BanxicoDataNotFoundError"""
+        async def empty(request):
+            return web.json_response({"bmx": {"series": [{"idSerie": "SF43718", "datos": []}]}})
+
+        async def scenario(client):
+            await client.get_rates_range(Currency.USD, "2024-12-28", "2024-12-29")
+
+        with pytest.raises(BanxicoDataNotFoundError):
+            run_with_server(empty, scenario)
@@ -0,0 +1,140 @@
+"""Tests para las consultas de varias monedas en una sola petición"""
+
+import pytest
+from unittest.mock import patch
+
+from banxico_sie import BanxicoSIEClient, Currency
+from banxico_sie.exceptions import BanxicoAPIError, BanxicoDataNotFoundError
+
+
+@pytest.fixture
+def client():
+    """Fixture que retorna un cliente de prueba"""
+    return BanxicoSIEClient("test_token_123")
+
+
+@pytest.fixture
+def multi_response():
+    """Fixture con una respuesta de varias series"""
+    return {
+        "bmx": {
+            "series": [
+                {
+                    "idSerie": "SF46410",
+                    "titulo": "Euro",
+                    "datos": [
+                        {"fecha": "26/12/2024", "dato": "21.1234"},
+                        {"fecha": "27/12/2024", "dato": "21.2345"},
+                    ]
+                },
+                {
+                    "idSerie": "SF43718",
+                    "titulo": "Dólar FIX",
+                    "datos": [
+                        {"fecha": "26/12/2024", "dato": "20.3456"},
+                        {"fecha": "27/12/2024", "dato": "N/E"},
+                    ]
+                },
+                {
+                    "idSerie": "SF46406",
+                    "titulo": "Yen",
+                },
+            ]
+        }
+    }
+
+
+class TestBatchRequests:
+    """Suite de tests para get_rates_many y get_rates_range_many"""
+
+    @patch.object(BanxicoSIEClient, '_make_request')
+    def test_get_rates_range_many_single_request(self, mock_request, client, multi_response):
+        """Todas las series se piden en una sola petición"""
+        mock_request.return_value = multi_response
+
+        results = client.get_rates_range_many(
+            [Currency.USD, Currency.EUR, Currency.JPY], "2024-12-26", "2024-12-27"
+        )
+
+        mock_request.assert_called_once_with(
+            ["SF43718", "SF46410", "SF46406"], "2024-12-26", "2024-12-27"
+        )
+        assert list(results) == [Currency.USD, Currency.EUR]
+        assert results[Currency.USD][0]["valor"] == 20.3456
+        assert results[Currency.USD][1]["valor"] is None
+        assert results[Currency.EUR][1]["moneda"] == "EUR"
+        assert results[Currency.EUR][1]["simbolo"] == "€"
+
+    @patch.object(BanxicoSIEClient, '_make_request')
+    def test_get_rates_many(self, mock_request, client, multi_response):
+        """get_rates_many regresa un dato por moneda"""
+        mock_request.return_value = multi_response
+
+        results = client.get_rates_many([Currency.EUR, Currency.USD], fecha="2024-12-26")
+
+        assert results[Currency.EUR]["valor"] == 21.1234
+        assert results[Currency.USD]["fecha"] == "26/12/2024"
+
+    @patch.object(BanxicoSIEClient, '_make_request')
+    def test_duplicate_currencies(self, mock_request, client, multi_response):
+        """Las monedas repetidas se piden una sola vez"""
+        mock_request.return_value = multi_response
+
+        client.get_rates_many([Currency.EUR, Currency.EUR], fecha="2024-12-26")
+
+        assert mock_request.call_args[0][0] == ["SF46410"]
+
+    @patch.object(BanxicoSIEClient, '_make_request')
+    def test_no_data(self, mock_request, client):
+        """Sin datos en ninguna serie se lanza BanxicoDataNotFoundError"""
+        mock_request.return_value = {"bmx": {"series": [{"idSerie": "SF43718", "datos": []}]}}
+
+        with pytest.raises(BanxicoDataNotFoundError):
+            client.get_rates_many([Currency.USD], fecha="2024-12-28")
+
+    @patch.object(BanxicoSIEClient, '_make_request')
+    def test_invalid_structure(self, mock_request, client):
+        """Una respuesta inválida lanza BanxicoAPIError"""
+        mock_request.return_value = {"invalid": "structure"}
+
+        with pytest.raises(BanxicoAPIError):
+            client.get_rates_range_many([Currency.USD], "2024-12-26", "2024-12-27")
+
+    def test_empty_currencies(self, client):
+        """Se requiere al menos una moneda"""
+        with pytest.raises(ValueError):
+            client.get_rates_many([])
+
+
+class TestLatest:
+    """Suite de tests para get_latest / get_latest_many (endpoint oportuno)"""
+
+    @patch.object(BanxicoSIEClient, '_request_with_retries')
+    def test_get_latest_many_uses_oportuno(self, mock_request, client, multi_response):
+        """Todas las monedas se piden en una sola petición al endpoint oportuno"""
+        mock_request.return_value = multi_response
+
+        results = client.get_latest_many([Currency.EUR, Currency.USD, Currency.JPY])
+
+        mock_request.assert_called_once_with(
+            f"{client.BASE_URL}/SF46410,SF43718,SF46406/datos/oportuno"
+        )
+        assert list(results) == [Currency.EUR, Currency.USD]
+        assert results[Currency.EUR]["fecha"] == "27/12/2024"
+
+    @patch.object(BanxicoSIEClient, '_request_with_retries')
+    def test_get_latest(self, mock_request, client, multi_response):
+        """get_latest regresa la última observación de la serie"""
+        mock_request.return_value = multi_response
+
+        result = client.get_latest(Currency.EUR)
+
+        assert result["valor"] == 21.2345
+
+    @patch.object(BanxicoSIEClient, '_request_with_retries')
+    def test_get_latest_no_data(self, mock_request, client, multi_response):
+        """Sin datos se lanza BanxicoDataNotFoundError"""
+        mock_request.return_value = multi_response
+
+        with pytest.raises(BanxicoDataNotFoundError):
+            client.get_latest(Currency.JPY)
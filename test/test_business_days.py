@@ -0,0 +1,103 @@
+"""Tests para el calendario de días hábiles bancarios"""
+
+from datetime import date
+from unittest.mock import patch
+
+import pytest
+
+from banxico_sie import BanxicoSIEClient, BusinessCalendar, Currency
+from banxico_sie.business_days import mexican_bank_holidays
+from banxico_sie.exceptions import BanxicoDataNotFoundError
+
+
+@pytest.fixture
+def calendar():
+    """Fixture con el calendario precalculado para 2023-2025"""
+    return BusinessCalendar(first_year=2023, last_year=2025)
+
+
+class TestBusinessCalendar:
+    """Suite de tests para BusinessCalendar"""
+
+    def test_holidays_2024(self):
+        """Días inhábiles bancarios de 2024"""
+        assert mexican_bank_holidays(2024) == {
+            date(2024, 1, 1),
+            date(2024, 2, 5),
+            date(2024, 3, 18),
+            date(2024, 3, 28),
+            date(2024, 3, 29),
+            date(2024, 5, 1),
+            date(2024, 9, 16),
+            date(2024, 10, 1),
+            date(2024, 11, 2),
+            date(2024, 11, 18),
+            date(2024, 12, 12),
+            date(2024, 12, 25),
+        }
+
+    def test_weekends_and_holidays(self, calendar):
+        """Fines de semana y festivos no son hábiles"""
+        assert calendar.is_business_day(date(2024, 12, 24))
+        assert not calendar.is_business_day(date(2024, 12, 25))
+        assert not calendar.is_business_day(date(2024, 12, 28))
+
+    def test_previous_business_day(self, calendar):
+        """Se recorre al día hábil anterior saltando festivos"""
+        assert calendar.previous_business_day(date(2024, 3, 31)) == date(2024, 3, 27)
+        assert calendar.previous_business_day(date(2024, 3, 27)) == date(2024, 3, 27)
+        previous = calendar.previous_business_day(date(2024, 3, 27), inclusive=False)
+        assert previous == date(2024, 3, 26)
+
+    def test_extra_holidays(self):
+        """Se pueden agregar días inhábiles extraordinarios"""
+        calendar = BusinessCalendar(
+            extra_holidays=[date(2024, 7, 1)], first_year=2024, last_year=2024
+        )
+        assert not calendar.is_business_day(date(2024, 7, 1))
+
+    def test_years_outside_precomputed_range(self, calendar):
+        """Los años fuera del rango precalculado se calculan al vuelo"""
+        assert not calendar.is_business_day(date(2030, 12, 25))
+
+
+class TestClientWithCalendar:
+    """Suite de tests para el cliente con calendario"""
+
+    @patch.object(BanxicoSIEClient, '_make_request')
+    def test_non_business_day_fails_fast(self, mock_request, calendar):
+        """Un sábado lanza BanxicoDataNotFoundError sin ir a la red"""
+        client = BanxicoSIEClient("test_token_123", calendar=calendar)
+
+        with pytest.raises(BanxicoDataNotFoundError):
+            client.get_rate(Currency.USD, fecha="2024-12-28")
+
+        mock_request.assert_not_called()
+
+    @patch.object(BanxicoSIEClient, '_make_request')
+    def test_non_business_day_previous(self, mock_request, calendar):
+        """Con "previous" se consulta el día hábil anterior"""
+        mock_request.return_value = {"bmx": {"series": [{"idSerie": "SF43718", "datos": [
+            {"fecha": "24/12/2024", "dato": "20.2"}
+        ]}]}}
+        client = BanxicoSIEClient("test_token_123", calendar=calendar, non_business_day="previous")
+
+        rate = client.get_rate(Currency.USD, fecha="2024-12-25")
+
+        mock_request.assert_called_once_with(["SF43718"], "2024-12-24", "2024-12-24")
+        assert rate["fecha"] == "24/12/2024"
+
+    @patch.object(BanxicoSIEClient, '_make_request')
+    def test_range_without_business_days(self, mock_request, calendar):
+        """Un rango sin días hábiles no va a la red"""
+        client = BanxicoSIEClient("test_token_123", calendar=calendar)
+
+        with pytest.raises(BanxicoDataNotFoundError):
+            client.get_rates_range(Currency.USD, "2024-03-28", "2024-03-31")
+
+        mock_request.assert_not_called()
+
+    def test_invalid_policy(self):
+        """Sólo se aceptan las políticas conocidas"""
+        with pytest.raises(ValueError):
+            BanxicoSIEClient("test_token_123", non_business_day="next")
@@ -0,0 +1,204 @@
+"""Tests para la caché en memoria"""
+
+import asyncio
+import pytest
+from datetime import date, datetime
+from unittest.mock import AsyncMock, patch
+
+from banxico_sie import BanxicoSIEClient, Currency, RateCache
+from banxico_sie.cache import MEXICO_CITY_TZ
+from banxico_sie.exceptions import BanxicoDataNotFoundError
+
+
+@pytest.fixture
+def cache(clock):
+    """Fixture que retorna una caché con reloj controlable"""
+    return RateCache(maxsize=2, clock=clock)
+
+
+class TestRateCache:
+    """Suite de tests para RateCache"""
+
+    def test_hit_and_miss_counters(self, cache):
+        """Se cuentan aciertos y fallos"""
+        assert cache.get("a") is None
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+
+        info = cache.info()
+        assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+    def test_lru_eviction(self, cache):
+        """Se desaloja la entrada menos usada"""
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.info().evictions == 1
+
+    def test_expiration(self, cache, clock):
+        """Las entradas expiran en su instante de expiración"""
+        cache.set("a", 1, expires_at=clock() + 60)
+        clock.advance(59)
+        assert cache.get("a") == 1
+        clock.advance(2)
+        assert cache.get("a") is None
+
+    def test_historical_dates_never_expire(self, cache):
+        """Las fechas pasadas no expiran"""
+        assert cache.expires_at_for(date(2024, 12, 20)) is None
+
+    def test_today_expires_at_publication(self, cache):
+        """El dato de hoy expira en la siguiente publicación del FIX"""
+        expected = datetime(2024, 12, 26, 12, 0, tzinfo=MEXICO_CITY_TZ).timestamp()
+        assert cache.expires_at_for(date(2024, 12, 26)) == expected
+
+    def test_next_publication_after_noon(self, cache, clock):
+        """Después de la publicación, la siguiente es al día siguiente"""
+        clock.advance(3 * 3600)
+        expected = datetime(2024, 12, 27, 12, 0, tzinfo=MEXICO_CITY_TZ).timestamp()
+        assert cache.next_publication() == expected
+
+    def test_latest_expiry(self, cache, clock):
+        """Lo más reciente dura hasta la publicación sólo si ya es de la última publicación"""
+        noon = datetime(2024, 12, 26, 12, 0, tzinfo=MEXICO_CITY_TZ).timestamp()
+        # Antes de las 12:00 la última publicación es la del 25
+        assert cache.expires_at_for_latest(date(2024, 12, 25)) == noon
+        assert cache.expires_at_for_latest(date(2024, 12, 24)) == clock() + 300
+
+        clock.advance(2 * 3600 + 30)
+        assert cache.expires_at_for_latest(date(2024, 12, 25)) == clock() + 300
+        assert cache.expires_at_for_latest(date(2024, 12, 26)) == noon + 24 * 3600
+
+    def test_publication_day_skips_non_business_days(self, cache, clock):
+        """El lunes antes de las 12:00 la última publicación es la del viernes"""
+        clock.set(datetime(2024, 12, 30, 9, 0, tzinfo=MEXICO_CITY_TZ))
+        assert cache.publication_day() == date(2024, 12, 27)
+
+        def without_friday(day):
+            return day.weekday() < 5 and day != date(2024, 12, 27)
+
+        assert cache.publication_day(without_friday) == date(2024, 12, 26)
+
+    def test_negative_results(self, cache, clock):
+        """Las fechas pasadas sin datos se recuerdan siempre; hoy, sólo negative_ttl"""
+        cache.set_not_found("pasado", date(2024, 12, 25), "sin datos")
+        cache.set_not_found("hoy", date(2024, 12, 26), "sin datos")
+
+        clock.advance(301)
+
+        assert cache.get("pasado").message == "sin datos"
+        assert cache.get("hoy") is None
+
+
+class TestClientWithCache:
+    """Suite de tests para el cliente con caché"""
+
+    @patch.object(BanxicoSIEClient, '_make_request')
+    def test_get_rate_cached(self, mock_request, cache):
+        """La segunda consulta de una fecha no va a la red"""
+        mock_request.return_value = {
+            "bmx": {"series": [{"idSerie": "SF43718", "datos": [
+                {"fecha": "20/12/2024", "dato": "20.1"}
+            ]}]}
+        }
+        client = BanxicoSIEClient("test_token_123", cache=cache)
+
+        first = client.get_rate(Currency.USD, fecha="2024-12-20")
+        first["valor"] = 0
+        second = client.get_rate(Currency.USD, fecha="2024-12-20")
+
+        assert second["valor"] == 20.1
+        mock_request.assert_called_once()
+
+    @patch.object(BanxicoSIEClient, '_request_with_retries')
+    def test_get_latest_expires_at_publication(self, mock_request, cache, clock):
+        """get_latest se cachea hasta la siguiente publicación"""
+        mock_request.return_value = {
+            "bmx": {"series": [{"idSerie": "SF43718", "datos": [
+                {"fecha": "26/12/2024", "dato": "20.3"}
+            ]}]}
+        }
+        client = BanxicoSIEClient("test_token_123", cache=cache)
+
+        client.get_latest(Currency.USD)
+        client.get_latest(Currency.USD)
+        assert mock_request.call_count == 1
+
+        clock.advance(2 * 3600 + 1)
+        client.get_latest(Currency.USD)
+        assert mock_request.call_count == 2
+
+    @patch.object(BanxicoSIEClient, '_request_with_retries')
+    def test_get_latest_old_after_publication(self, mock_request, cache, clock):
+        """Un dato viejo obtenido después de las 12:00 se vuelve a pedir pronto"""
+        mock_request.return_value = {
+            "bmx": {"series": [{"idSerie": "SF43718", "datos": [
+                {"fecha": "24/12/2024", "dato": "20.3"}
+            ]}]}
+        }
+        client = BanxicoSIEClient("test_token_123", cache=cache)
+        clock.advance(2 * 3600 + 30)
+
+        client.get_latest(Currency.USD)
+        client.get_latest(Currency.USD)
+        assert mock_request.call_count == 1
+
+        clock.advance(301)
+        client.get_latest(Currency.USD)
+        assert mock_request.call_count == 2
+
+    @patch.object(BanxicoSIEClient, '_make_request')
+    def test_not_found_cached(self, mock_request, cache, clock):
+        """Una fecha sin datos no se vuelve a pedir; la de hoy, sí al expirar"""
+        mock_request.return_value = {"bmx": {"series": [{"idSerie": "SF43718", "datos": []}]}}
+        client = BanxicoSIEClient("test_token_123", cache=cache)
+
+        for _ in range(2):
+            with pytest.raises(BanxicoDataNotFoundError):
+                client.get_rate(Currency.USD, fecha="2024-12-25")
+            with pytest.raises(BanxicoDataNotFoundError):
+                client.get_rate(Currency.USD, fecha="2024-12-26")
+        assert mock_request.call_count == 2
+
+        clock.advance(301)
+        with pytest.raises(BanxicoDataNotFoundError):
+            client.get_rate(Currency.USD, fecha="2024-12-25")
+        with pytest.raises(BanxicoDataNotFoundError):
+            client.get_rate(Currency.USD, fecha="2024-12-26")
+        assert mock_request.call_count == 3
+
+    def test_not_found_shared_with_async_client(self, cache):
+        """Los resultados sin datos se comparten entre el cliente síncrono y el asíncrono"""
+        pytest.importorskip("aiohttp")
+        from banxico_sie import AsyncBanxicoSIEClient
+
+        empty = {"bmx": {"series": [{"idSerie": "SF43718", "datos": []}]}}
+        sync_client = BanxicoSIEClient("test_token_123", cache=cache)
+
+        async def scenario():
+            async_client = AsyncBanxicoSIEClient("test_token_123", cache=cache)
+            mock = AsyncMock(return_value=empty)
+            try:
+                with patch.object(async_client, "_make_request", mock):
+                    with pytest.raises(BanxicoDataNotFoundError):
+                        await async_client.get_rate(Currency.USD, fecha="2024-12-25")
+                    with pytest.raises(BanxicoDataNotFoundError):
+                        await async_client.get_rate(Currency.USD, fecha="2024-12-24")
+                    return mock.await_count
+            finally:
+                await async_client.close()
+
+        with patch.object(BanxicoSIEClient, "_make_request", return_value=empty) as sync_mock:
+            with pytest.raises(BanxicoDataNotFoundError):
+                sync_client.get_rate(Currency.USD, fecha="2024-12-24")
+
+            # El asíncrono ve el negativo del 24 y guarda el suyo del 25 para el síncrono
+            assert asyncio.run(scenario()) == 1
+            with pytest.raises(BanxicoDataNotFoundError):
+                sync_client.get_rate(Currency.USD, fecha="2024-12-25")
+
+        assert sync_mock.call_count == 1
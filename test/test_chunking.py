@@ -0,0 +1,82 @@
+"""Tests para la división de rangos largos en ventanas paralelas"""
+
+import threading
+import time
+from datetime import date, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from banxico_sie import BanxicoSIEClient, Currency
+
+
+def fake_request(series_ids, start_date, end_date):
+    """Regresa un dato por día hábil del rango, con traslape de un día al inicio"""
+    start = date.fromisoformat(start_date) - timedelta(days=1)
+    end = date.fromisoformat(end_date)
+    datos = []
+    day = start
+    while day <= end:
+        if day.weekday() < 5:
+            datos.append({"fecha": day.strftime("%d/%m/%Y"), "dato": f"{day.toordinal()}"})
+        day += timedelta(days=1)
+    return {"bmx": {"series": [{"idSerie": s, "datos": datos} for s in series_ids]}}
+
+
+class TestChunking:
+    """Suite de tests para chunk_days/max_workers"""
+
+    def test_invalid_chunk_days(self):
+        """chunk_days debe ser positivo"""
+        with pytest.raises(ValueError):
+            BanxicoSIEClient("test_token_123", chunk_days=0)
+
+    def test_split_range(self):
+        """Las ventanas cubren el rango completo sin traslaparse"""
+        client = BanxicoSIEClient("test_token_123", chunk_days=10)
+
+        windows = client._split_range(date(2024, 1, 1), date(2024, 1, 25))
+
+        assert windows == [
+            ("2024-01-01", "2024-01-10"),
+            ("2024-01-11", "2024-01-20"),
+            ("2024-01-21", "2024-01-25"),
+        ]
+
+    @patch.object(BanxicoSIEClient, '_make_request', side_effect=fake_request)
+    def test_results_ordered_and_deduplicated(self, mock_request):
+        """El resultado está en orden de fecha y sin duplicados en las fronteras"""
+        client = BanxicoSIEClient("test_token_123", chunk_days=7, max_workers=3)
+
+        rates = client.get_rates_range(Currency.USD, "2024-01-01", "2024-03-31")
+
+        assert mock_request.call_count == 13
+        ordinals = [int(r["valor"]) for r in rates]
+        assert ordinals == sorted(set(ordinals))
+        assert rates[0]["fecha"] == "01/01/2024"
+        assert rates[-1]["fecha"] == "29/03/2024"
+
+    @patch.object(BanxicoSIEClient, '_make_request')
+    def test_windows_fetched_in_parallel(self, mock_request):
+        """Las ventanas se piden en paralelo, sin exceder max_workers"""
+        state = {"active": 0, "peak": 0}
+        lock = threading.Lock()
+
+        def slow_request(series_ids, start_date, end_date):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.02)
+            with lock:
+                state["active"] -= 1
+            return fake_request(series_ids, start_date, end_date)
+
+        mock_request.side_effect = slow_request
+        client = BanxicoSIEClient("test_token_123", chunk_days=30, max_workers=3)
+
+        results = client.get_rates_range_many(
+            [Currency.USD, Currency.EUR], "2020-01-01", "2020-12-31"
+        )
+
+        assert state["peak"] == 3
+        assert len(results[Currency.USD]) == len(results[Currency.EUR])
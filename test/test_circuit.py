@@ -0,0 +1,150 @@
+"""Tests para el interruptor de circuito y stale-while-revalidate"""
+
+import threading
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from banxico_sie import (
+    BanxicoCircuitOpenError, BanxicoSIEClient, CircuitBreaker, Currency, RateCache
+)
+from banxico_sie.exceptions import BanxicoAPIError, BanxicoDataNotFoundError
+
+
+def latest_response(dato):
+    return {"bmx": {"series": [{"idSerie": "SF43718", "datos": [
+        {"fecha": "26/12/2024", "dato": dato}
+    ]}]}}
+
+
+def wait_revalidations():
+    """Espera a que terminen las actualizaciones en segundo plano"""
+    for thread in threading.enumerate():
+        if thread.name == "banxico-sie-revalidate":
+            thread.join(5)
+
+
+class TestCircuitBreaker:
+    """Suite de tests para CircuitBreaker"""
+
+    def test_opens_after_threshold_and_probes(self, clock):
+        """Se abre tras N fallas, deja pasar una prueba y se cierra si responde"""
+        breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=10, clock=clock)
+        timeout = BanxicoAPIError("Timeout al conectar con la API de Banxico")
+
+        for _ in range(2):
+            breaker.before_request()
+            breaker.record(timeout)
+        assert breaker.state == "open"
+        with pytest.raises(BanxicoCircuitOpenError) as exc_info:
+            breaker.before_request()
+        assert exc_info.value.retry_after == 10
+
+        clock.advance(10)
+        breaker.before_request()
+        with pytest.raises(BanxicoCircuitOpenError):
+            breaker.before_request()  # sólo una prueba a la vez
+        breaker.record()
+        assert breaker.state == "closed"
+
+    def test_failed_probe_reopens(self, clock):
+        """Si la prueba falla el circuito se abre otra vez"""
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10, clock=clock)
+        breaker.record(BanxicoAPIError("error", status_code=503))
+
+        clock.advance(10)
+        breaker.before_request()
+        breaker.record(BanxicoAPIError("error", status_code=503))
+
+        assert breaker.state == "open"
+
+    def test_client_errors_are_not_failures(self):
+        """Un 4xx significa que la API respondió: no abre el circuito"""
+        breaker = CircuitBreaker(failure_threshold=1)
+        breaker.record(BanxicoDataNotFoundError(status_code=404))
+
+        assert breaker.state == "closed"
+
+    @patch('banxico_sie.client.requests.Session.get')
+    def test_client_fails_fast(self, mock_get):
+        """Con el circuito abierto el cliente no hace la petición"""
+        mock_get.side_effect = requests.exceptions.ConnectionError()
+        client = BanxicoSIEClient(
+            "test_token_123", circuit_breaker=CircuitBreaker(failure_threshold=2)
+        )
+
+        for _ in range(2):
+            with pytest.raises(BanxicoAPIError):
+                client.get_rate(Currency.USD, fecha="2024-12-26")
+        with pytest.raises(BanxicoCircuitOpenError):
+            client.get_rate(Currency.USD, fecha="2024-12-27")
+
+        assert mock_get.call_count == 2
+
+
+    @patch('banxico_sie.client.requests.Session.get')
+    def test_deadline_is_not_a_failure(self, mock_get):
+        """Un deadline agotado antes de enviar no cuenta como falla de la API"""
+        breaker = CircuitBreaker(failure_threshold=1)
+        client = BanxicoSIEClient("test_token_123", deadline=0.0, circuit_breaker=breaker)
+
+        with pytest.raises(BanxicoAPIError, match="deadline"):
+            client.get_rate(Currency.USD, fecha="2024-12-26")
+
+        assert breaker.state == "closed"
+        mock_get.assert_not_called()
+
+
+class TestStaleWhileRevalidate:
+    """Suite de tests para servir datos expirados mientras se actualizan"""
+
+    @patch.object(BanxicoSIEClient, '_request_with_retries')
+    def test_serves_stale_and_refreshes_in_background(self, mock_request, clock):
+        """El dato expirado se regresa marcado y una sola actualización corre en fondo"""
+        cache = RateCache(clock=clock, stale_ttl=86400)
+        client = BanxicoSIEClient("test_token_123", cache=cache, stale_while_revalidate=True)
+        mock_request.return_value = latest_response("20.3")
+        client.get_latest(Currency.USD)
+
+        clock.advance(3 * 3600)  # pasó la publicación de las 12:00
+        release = threading.Event()
+
+        def slow_request(url):
+            release.wait(5)
+            return latest_response("20.5")
+
+        mock_request.side_effect = slow_request
+        first = client.get_latest(Currency.USD)
+        second = client.get_latest(Currency.USD)
+        release.set()
+        wait_revalidations()
+
+        assert first["valor"] == second["valor"] == 20.3
+        assert first["stale"] is True
+        assert mock_request.call_count == 2
+        fresh = client.get_latest(Currency.USD)
+        assert fresh["valor"] == 20.5 and "stale" not in fresh
+
+    @patch.object(BanxicoSIEClient, '_make_request')
+    def test_stale_survives_failed_refresh(self, mock_request, clock):
+        """Si la actualización falla se sigue sirviendo el dato viejo"""
+        cache = RateCache(clock=clock, stale_ttl=86400)
+        client = BanxicoSIEClient("test_token_123", cache=cache, stale_while_revalidate=True)
+        mock_request.return_value = latest_response("20.3")
+        client.get_rate(Currency.USD, fecha="2024-12-26")
+
+        clock.advance(3 * 3600)
+        mock_request.side_effect = BanxicoAPIError("Timeout al conectar con la API de Banxico")
+        rate = client.get_rate(Currency.USD, fecha="2024-12-26")
+        wait_revalidations()
+
+        assert rate["valor"] == 20.3 and rate["stale"] is True
+        assert client.get_rate(Currency.USD, fecha="2024-12-26")["stale"] is True
+
+    def test_requires_stale_ttl(self):
+        """stale_while_revalidate sin una caché que conserve expirados es un error"""
+        with pytest.raises(ValueError):
+            BanxicoSIEClient("test_token_123", stale_while_revalidate=True)
+        with pytest.raises(ValueError):
+            BanxicoSIEClient("test_token_123", cache=RateCache(), stale_while_revalidate=True)
@@ -0,0 +1,125 @@
+"""Tests para la línea de comandos banxico-sie"""
+
+import csv
+import json
+from datetime import date, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from banxico_sie import BanxicoAPIError, BanxicoSIEClient
+from banxico_sie.cli import main
+
+
+def fake_iter(fail_after=None, calls=None):
+    """iter_rates_range simulado: un dato por día hábil y moneda, en orden de fecha"""
+    def iter_rates_range(self, currencies, start_date, end_date):
+        if calls is not None:
+            calls.append((start_date, end_date))
+        produced = 0
+        day = start_date
+        while day <= end_date:
+            if day.weekday() < 5:
+                for currency in currencies:
+                    if fail_after is not None and produced >= fail_after:
+                        raise ConnectionError("conexión interrumpida")
+                    item = {"fecha": day.strftime("%d/%m/%Y"), "dato": f"{day.day}.5"}
+                    yield self._parse_datos([item], currency)[0]
+                    produced += 1
+            day += timedelta(days=1)
+    return iter_rates_range
+
+
+ARGS = ["export", "--currency", "USD,USD_SPOT", "--from", "2024-01-01", "--to", "2024-01-31",
+        "--token", "test_token_123"]
+
+
+def read_rows(path, fmt):
+    """Filas escritas como tuplas (fecha, moneda)"""
+    if fmt == "csv":
+        with open(path, newline="", encoding="utf-8") as f:
+            return [(row["fecha"], row["moneda"]) for row in csv.DictReader(f)]
+    if fmt == "jsonl":
+        with open(path, encoding="utf-8") as f:
+            return [(row["fecha"], row["moneda"]) for row in map(json.loads, f)]
+    import pyarrow.parquet
+    table = pyarrow.parquet.read_table(path).sort_by([("fecha", "ascending")])
+    return [(f.isoformat(), m) for f, m in zip(
+        table.column("fecha").to_pylist(), table.column("moneda").to_pylist()
+    )]
+
+
+class TestExport:
+    """Suite de tests para `banxico-sie export`"""
+
+    @pytest.mark.parametrize("fmt", ["csv", "jsonl"])
+    def test_export(self, tmp_path, fmt):
+        """Se escribe una fila por fecha y moneda, distinguiendo USD de USD_SPOT"""
+        output = str(tmp_path / f"tipos.{fmt}")
+
+        with patch.object(BanxicoSIEClient, "iter_rates_range", fake_iter()):
+            assert main(ARGS + ["--format", fmt, "--output", output]) == 0
+
+        rows = read_rows(output, fmt)
+        assert len(rows) == 23 * 2
+        assert rows[:2] == [("2024-01-01", "USD"), ("2024-01-01", "USD_SPOT")]
+
+    @pytest.mark.parametrize("fmt", ["csv", "jsonl", "parquet"])
+    def test_resume_after_interruption(self, tmp_path, fmt):
+        """--resume continúa desde la última fecha escrita sin duplicar filas"""
+        if fmt == "parquet":
+            pytest.importorskip("pyarrow")
+        output = str(tmp_path / f"tipos.{fmt}")
+        args = ARGS + ["--format", fmt, "--output", output]
+
+        with patch.object(BanxicoSIEClient, "iter_rates_range", fake_iter(fail_after=15)):
+            with pytest.raises(ConnectionError):
+                main(args)
+        if fmt == "csv":
+            with open(output, "a", encoding="utf-8") as f:
+                f.write("2024-01-10,US")  # línea a medio escribir
+
+        calls = []
+        with patch.object(BanxicoSIEClient, "iter_rates_range", fake_iter(calls=calls)):
+            assert main(args + ["--resume"]) == 0
+
+        rows = read_rows(output, fmt)
+        assert len(rows) == len(set(rows)) == 23 * 2
+        if fmt != "parquet":
+            # USD llegó al día 10 y USD_SPOT al 9: se reanuda desde el 10
+            assert calls[0][0] == date(2024, 1, 10)
+
+    def test_resume_complete(self, tmp_path, capsys):
+        """Si el archivo ya está completo no se hacen peticiones"""
+        output = str(tmp_path / "tipos.csv")
+        calls = []
+        with patch.object(BanxicoSIEClient, "iter_rates_range", fake_iter(calls=calls)):
+            main(ARGS + ["--output", output])
+            main(ARGS + ["--output", output, "--to", "2024-01-31", "--resume"])
+
+        assert len(calls) == 1
+
+    def test_api_error(self, tmp_path, capsys):
+        """Un error de la API se reporta en stderr con código 1, sin traceback"""
+        output = str(tmp_path / "tipos.csv")
+        error = BanxicoAPIError("Token inválido", status_code=401)
+
+        with patch.object(BanxicoSIEClient, "iter_rates_range", side_effect=error):
+            assert main(ARGS + ["--output", output]) == 1
+
+        assert "Token inválido" in capsys.readouterr().err
+
+    def test_unknown_currency(self):
+        """Las monedas desconocidas son un error de uso"""
+        with pytest.raises(SystemExit):
+            main(["export", "--currency", "XXX", "--from", "2024-01-01", "--output", "x.csv"])
+
+
+class TestServe:
+    """Suite de tests para `banxico-sie serve`"""
+
+    def test_requires_token(self, monkeypatch):
+        """Sin token el comando termina con código 2"""
+        monkeypatch.delenv("BANXICO_TOKEN", raising=False)
+
+        assert main(["serve", "--port", "0"]) == 2
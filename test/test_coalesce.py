@@ -0,0 +1,113 @@
+"""Tests para la coalescencia de peticiones concurrentes"""
+
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+import pytest
+
+from banxico_sie import BanxicoSIEClient, Currency
+from banxico_sie.coalesce import SingleFlight
+from banxico_sie.exceptions import BanxicoAPIError
+
+
+PAYLOAD = {"bmx": {"series": [{"idSerie": "SF43718", "datos": [
+    {"fecha": "26/12/2024", "dato": "20.3456"}
+]}]}}
+
+
+def slow_response(*args, **kwargs):
+    """Respuesta HTTP exitosa que tarda en llegar"""
+    time.sleep(0.05)
+    response = Mock()
+    response.status_code = 200
+    response.content = json.dumps(PAYLOAD).encode("utf-8")
+    return response
+
+
+class TestSingleFlight:
+    """Suite de tests para SingleFlight"""
+
+    def test_concurrent_calls_share_execution(self):
+        """Las llamadas concurrentes con la misma llave ejecutan la función una vez"""
+        flight = SingleFlight()
+        calls = []
+        barrier = threading.Barrier(8)
+
+        def work():
+            calls.append(1)
+            time.sleep(0.05)
+            return {"ok": True}
+
+        def caller():
+            barrier.wait()
+            return flight.do("key", work)
+
+        with ThreadPoolExecutor(8) as executor:
+            results = list(executor.map(lambda _: caller(), range(8)))
+
+        assert len(calls) == 1
+        assert all(r is results[0] for r in results)
+        assert flight.shared == 7
+
+    def test_errors_are_shared(self):
+        """Los hilos en espera reciben la misma excepción"""
+        flight = SingleFlight()
+        started = threading.Event()
+
+        def failing():
+            started.set()
+            time.sleep(0.05)
+            raise BanxicoAPIError("falla")
+
+        with ThreadPoolExecutor(2) as executor:
+            leader = executor.submit(flight.do, "key", failing)
+            started.wait()
+            follower = executor.submit(flight.do, "key", failing)
+            with pytest.raises(BanxicoAPIError):
+                leader.result()
+            with pytest.raises(BanxicoAPIError):
+                follower.result()
+
+    def test_key_released_after_completion(self):
+        """Una llamada posterior vuelve a ejecutarse"""
+        flight = SingleFlight()
+        assert flight.do("key", lambda: 1) == 1
+        assert flight.do("key", lambda: 2) == 2
+
+
+class TestClientCoalescing:
+    """Suite de tests para la coalescencia en el cliente"""
+
+    @patch('banxico_sie.client.requests.Session.get', side_effect=slow_response)
+    def test_identical_requests_coalesced(self, mock_get):
+        """Consultas idénticas concurrentes hacen una sola petición HTTP"""
+        client = BanxicoSIEClient("test_token_123")
+        barrier = threading.Barrier(10)
+
+        def lookup(_):
+            barrier.wait()
+            return client.get_rate(Currency.USD, fecha="2024-12-26")
+
+        with ThreadPoolExecutor(10) as executor:
+            rates = list(executor.map(lookup, range(10)))
+
+        assert mock_get.call_count == 1
+        assert all(rate["valor"] == 20.3456 for rate in rates)
+
+    @patch('banxico_sie.client.requests.Session.get', side_effect=slow_response)
+    def test_coalescing_disabled(self, mock_get):
+        """Con coalesce=False cada consulta hace su propia petición"""
+        client = BanxicoSIEClient("test_token_123", coalesce=False)
+        barrier = threading.Barrier(4)
+
+        def lookup(_):
+            barrier.wait()
+            return client.get_rate(Currency.USD, fecha="2024-12-26")
+
+        with ThreadPoolExecutor(4) as executor:
+            list(executor.map(lookup, range(4)))
+
+        assert mock_get.call_count == 4
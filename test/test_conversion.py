@@ -0,0 +1,83 @@
+"""Tests para la conversión masiva con as-of"""
+
+from array import array
+from datetime import date
+from unittest.mock import patch
+
+import pytest
+
+from banxico_sie import BanxicoSIEClient, Currency, RateSeries
+import banxico_sie.series as series_module
+
+
+RESPONSE = {"bmx": {"series": [{"idSerie": "SF43718", "datos": [
+    {"fecha": "23/12/2024", "dato": "20.0"},
+    {"fecha": "24/12/2024", "dato": "20.5"},
+    {"fecha": "26/12/2024", "dato": "N/E"},
+    {"fecha": "27/12/2024", "dato": "21.0"},
+]}]}}
+
+
+@pytest.fixture
+def client():
+    """Fixture que retorna un cliente de prueba"""
+    return BanxicoSIEClient("test_token_123")
+
+
+class TestConvertMany:
+    """Suite de tests para rates_asof / convert_many"""
+
+    @patch.object(BanxicoSIEClient, '_make_request', return_value=RESPONSE)
+    def test_single_request_covering_all_dates(self, mock_request, client):
+        """Se hace una sola petición desde la fecha mínima menos lookback"""
+        client.rates_asof(["2024-12-28", date(2024, 12, 24)], Currency.USD, lookback_days=5)
+
+        mock_request.assert_called_once_with(["SF43718"], "2024-12-19", "2024-12-28")
+
+    @patch.object(BanxicoSIEClient, '_make_request', return_value=RESPONSE)
+    def test_last_observation_carried_forward(self, mock_request, client):
+        """Festivos, fines de semana y N/E usan el último valor publicado"""
+        np = pytest.importorskip("numpy")
+        fechas = np.array(
+            ["2024-12-22", "2024-12-23", "2024-12-25", "2024-12-26", "2024-12-29"],
+            dtype="datetime64[D]"
+        )
+
+        converted = client.convert_many([1, 2, 10, 10, 100], fechas, Currency.USD)
+
+        assert np.isnan(converted[0])
+        assert list(converted[1:]) == [40.0, 205.0, 205.0, 2100.0]
+
+    @patch.object(BanxicoSIEClient, '_make_request', return_value=RESPONSE)
+    def test_without_numpy(self, mock_request, client, monkeypatch):
+        """Sin NumPy se regresa array('d') con el mismo resultado"""
+        monkeypatch.setattr(series_module, "_numpy", lambda: None)
+        monkeypatch.setattr("banxico_sie.client._numpy", lambda: None)
+
+        converted = client.convert_many([2, 10], ["2024-12-23", "2024-12-25"], Currency.USD)
+
+        assert isinstance(converted, array)
+        assert list(converted) == [40.0, 205.0]
+
+    @patch.object(BanxicoSIEClient, '_make_request', return_value=RESPONSE)
+    def test_length_mismatch(self, mock_request, client):
+        """Montos y fechas deben tener la misma longitud; se valida antes de la petición"""
+        with pytest.raises(ValueError):
+            client.convert_many([1, 2], ["2024-12-23"], Currency.USD)
+        mock_request.assert_not_called()
+
+    @patch.object(BanxicoSIEClient, '_make_request', return_value=RESPONSE)
+    def test_length_mismatch_iterator(self, mock_request, client):
+        """Con un iterador de fechas la longitud se valida después de recorrerlo"""
+        with pytest.raises(ValueError):
+            client.convert_many([1, 2], iter(["2024-12-23"]), Currency.USD)
+
+
+class TestAsofValues:
+    """Suite de tests para RateSeries.asof_values"""
+
+    def test_empty_series(self):
+        """Una serie vacía regresa NaN"""
+        serie = RateSeries(Currency.USD, array("l"), array("d"))
+        values = serie.asof_values(["2024-12-23"])
+        assert values[0] != values[0]
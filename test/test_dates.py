@@ -0,0 +1,88 @@
+"""Tests para la conversión rápida de fechas y la opción parse_dates"""
+
+from datetime import date, datetime
+from unittest.mock import patch
+
+import pytest
+
+from banxico_sie import BanxicoSIEClient, Currency
+from banxico_sie._dates import format_date, parse_date_string
+
+
+RESPONSE = {"bmx": {"series": [{"idSerie": "SF43718", "datos": [
+    {"fecha": "26/12/2024", "dato": "20.3456"},
+    {"fecha": "27/12/2024", "dato": "20.4567"},
+]}]}}
+
+
+class TestParseDateString:
+    """Suite de tests para parse_date_string"""
+
+    @pytest.mark.parametrize("value, expected", [
+        ("2024-12-26", date(2024, 12, 26)),
+        ("2024-1-5", date(2024, 1, 5)),
+        ("26/12/2024", date(2024, 12, 26)),
+        ("01/02/2024", date(2024, 2, 1)),
+        (" 5/1/2024 ", date(2024, 1, 5)),
+        ("2024-12-01T10:30:00", date(2024, 12, 1)),
+        ("2024-12-01 10:30", date(2024, 12, 1)),
+        ("2024-12-05T00:00:00Z", date(2024, 12, 5)),
+    ])
+    def test_fast_path(self, value, expected):
+        """ISO y dd/mm/yyyy se resuelven sin dateutil"""
+        with patch("dateutil.parser.parse", side_effect=AssertionError("dateutil")):
+            assert parse_date_string(value) == expected
+
+    def test_fallback_day_first(self):
+        """Otros formatos se delegan a dateutil con el día primero"""
+        assert parse_date_string("26 Dec 2024") == date(2024, 12, 26)
+        assert parse_date_string("01.02.2024") == date(2024, 2, 1)
+
+    def test_fallback_year_first(self):
+        """Si el string empieza con el año no se aplica el día primero"""
+        assert parse_date_string("2024/12/01") == date(2024, 12, 1)
+        assert parse_date_string("2024.12.05 10:30") == date(2024, 12, 5)
+        assert parse_date_string("20241201") == date(2024, 12, 1)
+        assert parse_date_string("20241205T1030") == date(2024, 12, 5)
+
+    def test_invalid(self):
+        """Fechas imposibles lanzan ValueError"""
+        with pytest.raises(ValueError):
+            parse_date_string("2024-13-01")
+
+    def test_memoized(self):
+        """Las entradas repetidas salen de la memoización"""
+        parse_date_string("2023-06-15")
+        hits = parse_date_string.cache_info().hits
+
+        parse_date_string("2023-06-15")
+
+        assert parse_date_string.cache_info().hits == hits + 1
+
+    def test_format_date(self):
+        """Strings, date y datetime se formatean como YYYY-MM-DD"""
+        assert format_date("26/12/2024") == "2024-12-26"
+        assert format_date(date(2024, 12, 26)) == "2024-12-26"
+        assert format_date(datetime(2024, 12, 26, 15, 30)) == "2024-12-26"
+
+
+class TestParseDatesOption:
+    """Suite de tests para BanxicoSIEClient(parse_dates=True)"""
+
+    def test_default_keeps_strings(self):
+        """Por default `fecha` sigue siendo el string del SIE"""
+        client = BanxicoSIEClient("test_token_123")
+
+        rates = client._parse_response(RESPONSE, Currency.USD)
+
+        assert rates[0]["fecha"] == "26/12/2024"
+
+    @patch.object(BanxicoSIEClient, '_make_request')
+    def test_fecha_as_date(self, mock_request):
+        """Con parse_dates=True `fecha` es un datetime.date"""
+        mock_request.return_value = RESPONSE
+        client = BanxicoSIEClient("test_token_123", parse_dates=True)
+
+        rates = client.get_rates_range(Currency.USD, "2024-12-26", "2024-12-27")
+
+        assert [rate["fecha"] for rate in rates] == [date(2024, 12, 26), date(2024, 12, 27)]
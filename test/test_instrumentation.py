@@ -0,0 +1,175 @@
+"""Tests para los eventos de instrumentación y sus adaptadores"""
+
+import json
+import warnings
+from datetime import timedelta
+from unittest.mock import Mock, patch
+
+import pytest
+
+from banxico_sie import BanxicoSIEClient, Currency, RateCache, RetryPolicy
+from banxico_sie.exceptions import BanxicoAuthError
+from banxico_sie.instrumentation import (
+    OpenTelemetryInstrumentation, PrometheusInstrumentation, RequestEvent
+)
+
+
+PAYLOAD = {"bmx": {"series": [{"idSerie": "SF43718", "datos": [
+    {"fecha": "26/12/2024", "dato": "20.3456"}
+]}]}}
+
+
+def make_response(status_code=200, payload=PAYLOAD):
+    """Respuesta HTTP simulada con cuerpo y tiempos"""
+    body = json.dumps(payload).encode("utf-8")
+    response = Mock()
+    response.status_code = status_code
+    response.content = body
+    response.headers = {}
+    response.elapsed = timedelta(0)
+    return response
+
+
+@pytest.fixture
+def events():
+    """Lista donde el hook acumula los eventos"""
+    return []
+
+
+class TestRequestEvents:
+    """Suite de tests para los eventos emitidos por el cliente"""
+
+    @patch('banxico_sie.client.requests.Session.get')
+    def test_event_per_call(self, mock_get, events):
+        """Una llamada emite un evento con series, rango, status, bytes y fases"""
+        mock_get.return_value = make_response()
+        client = BanxicoSIEClient("test_token_123", hooks=[events.append])
+
+        client.get_rate(Currency.USD, fecha="2024-12-26")
+
+        [event] = events
+        assert isinstance(event, RequestEvent)
+        assert event.operation == "get_rate"
+        assert event.series_ids == ("SF43718",)
+        assert (event.start_date, event.end_date) == ("2024-12-26", "2024-12-26")
+        assert event.status == 200
+        assert event.requests == 1 and event.retries == 0
+        assert event.response_bytes == len(mock_get.return_value.content)
+        assert {"wait", "http", "download", "decode", "parse"} <= set(event.phases)
+        assert event.cache is None and event.error is None
+
+    @patch('banxico_sie.client.requests.Session.get')
+    def test_cache_hit(self, mock_get, events):
+        """Los aciertos de caché se reportan sin peticiones"""
+        mock_get.return_value = make_response()
+        client = BanxicoSIEClient("test_token_123", cache=RateCache(), hooks=[events.append])
+
+        client.get_rate(Currency.USD, fecha="2024-12-26")
+        client.get_rate(Currency.USD, fecha="2024-12-26")
+
+        assert [e.cache for e in events] == ["miss", "hit"]
+        assert events[1].requests == 0
+
+    @patch('banxico_sie.client.time.sleep')
+    @patch('banxico_sie.client.requests.Session.get')
+    def test_retries_and_errors(self, mock_get, mock_sleep, events):
+        """Se cuentan los reintentos y se reporta el error final"""
+        mock_get.side_effect = [make_response(503, {}), make_response()]
+        client = BanxicoSIEClient("test_token_123", retry=RetryPolicy(), hooks=[events.append])
+
+        client.get_rates_range(Currency.USD, "2024-12-26", "2024-12-26")
+
+        assert events[0].requests == 2
+        assert events[0].retries == 1
+
+        mock_get.side_effect = [make_response(401, {})]
+        with pytest.raises(BanxicoAuthError):
+            client.get_rate(Currency.USD, fecha="2024-12-26")
+
+        assert events[1].status == 401
+        assert isinstance(events[1].error, BanxicoAuthError)
+
+    @patch('banxico_sie.client.requests.Session.get')
+    def test_nested_calls_single_event(self, mock_get, events):
+        """get_latest (que usa get_latest_many) emite un solo evento"""
+        mock_get.return_value = make_response()
+        client = BanxicoSIEClient("test_token_123", hooks=[events.append])
+
+        client.get_latest(Currency.USD)
+
+        assert [e.operation for e in events] == ["get_latest"]
+        assert events[0].start_date is None
+
+    @patch('banxico_sie.client.requests.Session.get')
+    def test_failing_hook_does_not_break_call(self, mock_get):
+        """Un hook que falla sólo emite una advertencia"""
+        mock_get.return_value = make_response()
+
+        def broken(event):
+            raise RuntimeError("falla")
+
+        client = BanxicoSIEClient("test_token_123", hooks=[broken])
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            rate = client.get_rate(Currency.USD, fecha="2024-12-26")
+
+        assert rate["valor"] == 20.3456
+        assert caught and issubclass(caught[0].category, RuntimeWarning)
+
+
+def sample_event(**overrides):
+    """Evento de ejemplo para los adaptadores"""
+    fields = dict(
+        operation="get_rate", series_ids=("SF43718",), start_date="2024-12-26",
+        end_date="2024-12-26", status=200, duration=0.25,
+        phases={"http": 0.2, "parse": 0.01}, response_bytes=512, requests=1,
+        retries=1, cache="miss", error=None,
+    )
+    fields.update(overrides)
+    return RequestEvent(**fields)
+
+
+class TestAdapters:
+    """Suite de tests para los adaptadores de Prometheus y OpenTelemetry"""
+
+    def test_prometheus(self):
+        """Las métricas se registran con el prefijo y las etiquetas esperadas"""
+        prometheus_client = pytest.importorskip("prometheus_client")
+        registry = prometheus_client.CollectorRegistry()
+        hook = PrometheusInstrumentation(registry=registry)
+
+        hook(sample_event())
+        hook(sample_event(error=BanxicoAuthError(status_code=401), status=401))
+
+        value = registry.get_sample_value
+        assert value("banxico_sie_requests_total", {"operation": "get_rate", "outcome": "ok"}) == 1
+        assert value("banxico_sie_requests_total", {"operation": "get_rate", "outcome": "401"}) == 1
+        assert value("banxico_sie_retries_total", {"operation": "get_rate"}) == 2
+        assert value(
+            "banxico_sie_phase_duration_seconds_count", {"operation": "get_rate", "phase": "http"}
+        ) == 2
+        assert value("banxico_sie_cache_total", {"operation": "get_rate", "result": "miss"}) == 2
+
+    def test_opentelemetry(self):
+        """Cada evento se vuelve un span con sus atributos y estado de error"""
+        pytest.importorskip("opentelemetry.sdk")
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+        from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+        from opentelemetry.trace import StatusCode
+
+        exporter = InMemorySpanExporter()
+        provider = TracerProvider()
+        provider.add_span_processor(SimpleSpanProcessor(exporter))
+        hook = OpenTelemetryInstrumentation(tracer=provider.get_tracer("test"))
+
+        hook(sample_event())
+        hook(sample_event(error=BanxicoAuthError(status_code=401), status=401))
+
+        ok, failed = exporter.get_finished_spans()
+        assert ok.name == "banxico_sie.get_rate"
+        assert ok.attributes["banxico.series_ids"] == "SF43718"
+        assert ok.attributes["banxico.phase.http"] == 0.2
+        assert ok.end_time - ok.start_time == 250_000_000
+        assert failed.status.status_code == StatusCode.ERROR
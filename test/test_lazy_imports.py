@@ -0,0 +1,47 @@
+"""Tests para la importación perezosa del paquete"""
+
+import os
+import subprocess
+import sys
+
+import banxico_sie
+
+
+SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+HEAVY = ("requests", "aiohttp", "dateutil", "sqlite3", "urllib3")
+
+
+def loaded_after(code: str):
+    """Módulos pesados cargados tras ejecutar `code` en un intérprete nuevo"""
+    script = f"import sys\n{code}\nprint(','.join(m for m in {HEAVY!r} if m in sys.modules))"
+    env = dict(os.environ, PYTHONPATH=SRC)
+    output = subprocess.run(
+        [sys.executable, "-c", script], env=env, check=True, capture_output=True, text=True
+    ).stdout.strip()
+    return set(filter(None, output.split(",")))
+
+
+class TestLazyImports:
+    """Suite de tests para la importación perezosa"""
+
+    def test_import_is_light(self):
+        """Importar el paquete, Currency o las excepciones no carga dependencias pesadas"""
+        assert loaded_after(
+            "import banxico_sie\n"
+            "from banxico_sie import Currency, BanxicoAPIError\n"
+            "from banxico_sie.exceptions import BanxicoAuthError"
+        ) == set()
+
+    def test_client_loads_dependencies(self):
+        """Usar el cliente importa requests"""
+        assert "requests" in loaded_after("from banxico_sie import BanxicoSIEClient")
+
+    def test_all_names_resolve(self):
+        """Todos los nombres de __all__ existen y aparecen en dir()"""
+        for name in banxico_sie.__all__:
+            assert getattr(banxico_sie, name) is not None
+            assert name in dir(banxico_sie)
+
+    def test_unknown_attribute(self):
+        """Los nombres desconocidos siguen lanzando AttributeError"""
+        assert not hasattr(banxico_sie, "NoExiste")
@@ -0,0 +1,91 @@
+"""Tests para la decodificación JSON y el parseo de respuestas"""
+
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+
+from banxico_sie import BanxicoSIEClient, Currency
+from banxico_sie import _json
+from banxico_sie.exceptions import BanxicoAPIError
+
+
+PAYLOAD = {"bmx": {"series": [{"idSerie": "SF60653", "datos": [
+    {"fecha": "26/12/2024", "dato": "20.3456"},
+    {"fecha": "27/12/2024", "dato": "N/E"},
+    {"fecha": "30/12/2024", "dato": ""},
+]}]}}
+
+
+def make_response(status_code, content):
+    """Respuesta HTTP simulada con cuerpo crudo"""
+    response = Mock()
+    response.status_code = status_code
+    response.content = content
+    response.headers = {}
+    return response
+
+
+class TestJsonDecoding:
+    """Suite de tests para el decodificador JSON"""
+
+    def test_default_backend(self):
+        """Sin configuración se usa el decodificador del módulo (orjson o json)"""
+        client = BanxicoSIEClient("test_token_123")
+
+        assert client.json_loads is _json.loads
+        assert _json.JSON_BACKEND in ("json", "orjson")
+        assert _json.loads(b'{"a": [1, "\\u00e9"]}') == {"a": [1, "é"]}
+
+    @patch('banxico_sie.client.requests.Session.get')
+    def test_custom_decoder(self, mock_get):
+        """Se puede inyectar otro decodificador, que recibe los bytes del cuerpo"""
+        body = json.dumps(PAYLOAD).encode("utf-8")
+        mock_get.return_value = make_response(200, body)
+        decoder = Mock(side_effect=json.loads)
+        client = BanxicoSIEClient("test_token_123", json_loads=decoder)
+
+        client.get_rate(Currency.USD_SPOT, fecha="2024-12-26")
+
+        decoder.assert_called_once_with(body)
+
+    @patch('banxico_sie.client.requests.Session.get')
+    def test_non_json_error_body(self, mock_get):
+        """Un error con cuerpo HTML conserva el status HTTP"""
+        mock_get.return_value = make_response(503, b"<html>Service Unavailable</html>")
+        client = BanxicoSIEClient("test_token_123")
+
+        with pytest.raises(BanxicoAPIError) as exc_info:
+            client.get_rate(Currency.USD, fecha="2024-12-26")
+
+        assert exc_info.value.status_code == 503
+
+    @patch('banxico_sie.client.requests.Session.get')
+    def test_invalid_json_body(self, mock_get):
+        """Un cuerpo exitoso que no es JSON lanza BanxicoAPIError"""
+        mock_get.return_value = make_response(200, b"{truncado")
+        client = BanxicoSIEClient("test_token_123")
+
+        with pytest.raises(BanxicoAPIError):
+            client.get_rate(Currency.USD, fecha="2024-12-26")
+
+
+class TestParseDatos:
+    """Suite de tests para _parse_datos"""
+
+    def test_rows(self):
+        """Cada fila lleva los campos de la moneda y el valor numérico (o None)"""
+        client = BanxicoSIEClient("test_token_123")
+
+        rates = client._parse_response(PAYLOAD, Currency.USD_SPOT)
+
+        assert [rate["valor"] for rate in rates] == [20.3456, None, None]
+        assert rates[0] == {
+            "fecha": "26/12/2024",
+            "moneda": "USD",
+            "moneda_nombre": "Dólar estadounidense",
+            "simbolo": "$",
+            "valor": 20.3456,
+            "tipo": "Para liquidación (obligaciones)",
+        }
+        assert rates[0] is not rates[1]
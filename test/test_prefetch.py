@@ -0,0 +1,113 @@
+"""Tests para PrefetchScheduler"""
+
+import asyncio
+import time
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from banxico_sie import BanxicoSIEClient, Currency, PrefetchScheduler, RateCache
+from banxico_sie.cache import MEXICO_CITY_TZ
+
+
+def at(day, hour, minute=0):
+    """Instante del diciembre de 2024 en la Ciudad de México"""
+    return datetime(2024, 12, day, hour, minute, tzinfo=MEXICO_CITY_TZ)
+
+
+def latest_response(fecha, usd="20.3", eur="21.1"):
+    return {"bmx": {"series": [
+        {"idSerie": "SF43718", "datos": [{"fecha": fecha, "dato": usd}]},
+        {"idSerie": "SF46410", "datos": [{"fecha": fecha, "dato": eur}]},
+    ]}}
+
+
+@pytest.fixture
+def cache(clock):
+    return RateCache(clock=clock)
+
+
+@pytest.fixture
+def scheduler(cache, clock):
+    client = BanxicoSIEClient("test_token_123", cache=cache)
+    return PrefetchScheduler(client, [Currency.USD, Currency.EUR], clock=clock)
+
+
+class TestPrefetchScheduler:
+    """Suite de tests para PrefetchScheduler"""
+
+    @patch.object(BanxicoSIEClient, '_request_with_retries')
+    def test_poll_fills_cache_and_notifies(self, mock_request, scheduler, cache):
+        """Una petición para todas las monedas; sólo las novedades se notifican y cachean"""
+        received = []
+        scheduler.subscribe(lambda currency, rate: received.append((currency, rate["valor"])))
+
+        mock_request.return_value = latest_response("24/12/2024")
+        scheduler.poll()
+        assert received == []
+
+        mock_request.return_value = latest_response("26/12/2024", usd="20.5")
+        new = scheduler.poll()
+
+        assert mock_request.call_count == 2
+        assert set(new) == {Currency.USD, Currency.EUR}
+        assert (Currency.USD, 20.5) in received
+        assert cache.get(("SF43718", "2024-12-26"))["valor"] == 20.5
+        assert cache.get(("SF43718", "latest"))["valor"] == 20.5
+
+    @patch.object(BanxicoSIEClient, '_request_with_retries')
+    def test_poll_bypasses_cache(self, mock_request, scheduler):
+        """Cada consulta va a la API aunque el dato "más reciente" esté en caché"""
+        mock_request.return_value = latest_response("24/12/2024")
+        scheduler.poll()
+        scheduler.poll()
+
+        assert mock_request.call_count == 2
+
+    @patch.object(BanxicoSIEClient, '_request_with_retries')
+    def test_schedule(self, mock_request, scheduler, clock):
+        """Espera a la ventana, consulta seguido en ella y descansa al tener el dato del día"""
+        mock_request.return_value = latest_response("24/12/2024")
+        scheduler.poll()
+
+        assert scheduler.seconds_until_next_poll() == 2 * 3600 - 60
+        clock.set(at(26, 12, 5))
+        assert scheduler.seconds_until_next_poll() == 30
+
+        mock_request.return_value = latest_response("26/12/2024")
+        scheduler.poll()
+        # Hasta el viernes a las 11:59
+        expected = (at(27, 11, 59) - at(26, 12, 5)).total_seconds()
+        assert scheduler.seconds_until_next_poll() == expected
+
+        clock.set(at(27, 15))  # el viernes ya pasó la ventana: hasta el lunes
+        assert scheduler.seconds_until_next_poll() == (at(30, 11, 59) - at(27, 15)).total_seconds()
+
+    @patch.object(BanxicoSIEClient, '_request_with_retries')
+    def test_asyncio_event(self, mock_request, scheduler):
+        """Los suscriptores asyncio reciben un evento activado desde el hilo de fondo"""
+        mock_request.side_effect = [latest_response("24/12/2024"), latest_response("26/12/2024")]
+
+        async def main():
+            event = scheduler.asyncio_event()
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, scheduler.poll)
+            await loop.run_in_executor(None, scheduler.poll)
+            await asyncio.wait_for(event.wait(), 5)
+            return scheduler.latest[Currency.USD]["fecha"]
+
+        assert asyncio.run(main()) == "26/12/2024"
+
+    @patch.object(BanxicoSIEClient, '_request_with_retries')
+    def test_background_thread(self, mock_request, scheduler):
+        """start() hace la primera consulta en segundo plano y stop() lo detiene"""
+        mock_request.return_value = latest_response("24/12/2024")
+
+        with scheduler:
+            for _ in range(100):
+                if scheduler.latest:
+                    break
+                time.sleep(0.01)
+
+        assert scheduler.latest[Currency.USD]["valor"] == 20.3
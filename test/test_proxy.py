@@ -0,0 +1,161 @@
+"""Tests para el proxy local (banxico-sie serve)"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from banxico_sie import BanxicoSIEClient, Currency, RateCache, SIEProxyServer
+from banxico_sie.cache import MEXICO_CITY_TZ
+from banxico_sie.exceptions import BanxicoAPIError, BanxicoAuthError
+
+
+class FakeUpstream:
+    """Sustituye la petición HTTP del cliente del proxy; responde según la URL"""
+
+    def __init__(self, delay: float = 0.0, error: Exception = None):
+        self.urls = []
+        self.delay = delay
+        self.error = error
+        self._lock = threading.Lock()
+
+    def __call__(self, url, stream=False):
+        with self._lock:
+            self.urls.append(url)
+        time.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        series_ids, *dates = url.split("/series/")[1].split("/datos/")
+        fecha = "26/12/2024" if dates == ["oportuno"] else "20/12/2024"
+        return {"bmx": {"series": [
+            {"idSerie": series_id, "titulo": "...", "datos": [{"fecha": fecha, "dato": "20.1"}]}
+            for series_id in series_ids.split(",")
+        ]}}
+
+
+@pytest.fixture
+def upstream():
+    return FakeUpstream()
+
+
+@pytest.fixture
+def proxy(upstream):
+    """Proxy en un puerto libre, con la API sustituida por `upstream`"""
+    client = BanxicoSIEClient("test_token_123", cache=RateCache())
+    with patch.object(client, "_request_with_retries_uncoalesced", upstream):
+        with SIEProxyServer(client, port=0) as server:
+            yield server
+
+
+@pytest.fixture
+def local(proxy):
+    """Cliente de un servicio que apunta al proxy"""
+    with BanxicoSIEClient("otro_token", base_url=proxy.url) as client:
+        yield client
+
+
+class TestSIEProxyServer:
+    """Suite de tests para SIEProxyServer"""
+
+    def test_range_and_per_series_cache(self, local, upstream):
+        """Las series ya pedidas se responden desde la caché; sólo las faltantes van a la API"""
+        rates = local.get_rates_range_many([Currency.USD, Currency.EUR], "2024-12-20", "2024-12-20")
+        assert rates[Currency.EUR][0]["valor"] == 20.1
+
+        local.get_rates_range(Currency.USD, "2024-12-20", "2024-12-20")
+        local.get_rates_range_many([Currency.USD, Currency.JPY], "2024-12-20", "2024-12-20")
+
+        assert len(upstream.urls) == 2
+        assert upstream.urls[1].endswith("/SF46406/datos/2024-12-20/2024-12-20")
+
+    def test_latest(self, local, upstream):
+        """El dato oportuno también pasa por el proxy"""
+        assert local.get_latest(Currency.USD)["fecha"] == "26/12/2024"
+        assert local.get_latest(Currency.USD)["fecha"] == "26/12/2024"
+        assert len(upstream.urls) == 1
+
+    def test_concurrent_identical_queries_coalesce(self, proxy, upstream):
+        """La misma consulta simultánea desde varios servicios hace una sola petición a la API"""
+        upstream.delay = 0.2
+        services = [BanxicoSIEClient("otro_token", base_url=proxy.url) for _ in range(8)]
+
+        with ThreadPoolExecutor(8) as executor:
+            results = list(executor.map(
+                lambda service: service.get_rate(Currency.USD, fecha="2024-12-20"), services
+            ))
+
+        assert all(r["valor"] == 20.1 for r in results)
+        assert len(upstream.urls) == 1
+
+    def test_errors_are_forwarded(self, local, upstream):
+        """Los errores de la API llegan a los clientes con su status"""
+        upstream.error = BanxicoAuthError(status_code=401)
+        with pytest.raises(BanxicoAuthError):
+            local.get_rate(Currency.USD, fecha="2024-12-20")
+
+        upstream.error = BanxicoAPIError("Timeout al conectar con la API de Banxico")
+        with pytest.raises(BanxicoAPIError) as exc_info:
+            local.get_rate(Currency.USD, fecha="2024-12-23")
+        assert exc_info.value.status_code == 503
+
+    def test_routes(self, proxy):
+        """Acepta las rutas con y sin prefijo; lo demás es 404"""
+        base = proxy.url.split("/SieAPIRest")[0]
+
+        assert requests.get(f"{base}/series/SF43718/datos/oportuno").status_code == 200
+        assert requests.get(f"{base}/series/SF43718/datos/ayer").status_code == 404
+        assert requests.get(f"{base}/otra/ruta").status_code == 404
+
+
+    def test_invalid_dates(self, proxy, upstream):
+        """Fechas imposibles o un rango invertido son 400, sin ir a la API"""
+        base = proxy.url.split("/SieAPIRest")[0]
+
+        invalid = requests.get(f"{base}/series/SF43718/datos/2024-13-45/2024-12-31")
+        inverted = requests.get(f"{base}/series/SF43718/datos/2024-12-31/2024-12-01")
+
+        assert invalid.status_code == inverted.status_code == 400
+        assert "Fecha inválida" in invalid.json()["error"]["mensaje"]
+        assert upstream.urls == []
+
+    @pytest.mark.parametrize("day, refetched", [(26, False), (27, True)])
+    def test_latest_expiry_depends_on_observation(self, upstream, clock, day, refetched):
+        """Después de las 12:00, un oportuno que no es del día sólo se guarda negative_ttl"""
+        clock.set(datetime(2024, 12, day, 12, 0, 30, tzinfo=MEXICO_CITY_TZ))
+        client = BanxicoSIEClient("test_token_123", cache=RateCache(clock=clock))
+
+        with patch.object(client, "_request_with_retries_uncoalesced", upstream), \
+                SIEProxyServer(client, port=0) as proxy:
+            proxy.query(["SF43718"])  # el upstream regresa el dato del 26
+            clock.advance(301)
+            proxy.query(["SF43718"])
+
+        assert len(upstream.urls) == (2 if refetched else 1)
+
+    def test_range_to_today_without_todays_observation(self, upstream, clock):
+        """Un rango hasta hoy sin el dato del día se vuelve a pedir pronto; uno pasado, nunca"""
+        clock.set(datetime(2024, 12, 26, 12, 0, 30, tzinfo=MEXICO_CITY_TZ))
+        client = BanxicoSIEClient("test_token_123", cache=RateCache(clock=clock))
+
+        with patch.object(client, "_request_with_retries_uncoalesced", upstream), \
+                SIEProxyServer(client, port=0) as proxy:
+            for _ in range(2):
+                proxy.query(["SF43718"], "2024-12-20", "2024-12-26")  # sólo trae el 20
+                proxy.query(["SF43718"], "2024-12-20", "2024-12-20")
+                clock.advance(301)
+
+        assert [url.split("/datos/")[1] for url in upstream.urls] == [
+            "2024-12-20/2024-12-26", "2024-12-20/2024-12-20", "2024-12-20/2024-12-26"
+        ]
+
+def test_base_url():
+    """base_url reemplaza la URL de la API pública"""
+    client = BanxicoSIEClient("test_token_123", base_url="http://localhost:8080/series/")
+
+    expected = "http://localhost:8080/series/SF43718/datos/oportuno"
+    assert client._build_latest_url(["SF43718"]) == expected
+    assert BanxicoSIEClient.BASE_URL.startswith("https://www.banxico.org.mx")
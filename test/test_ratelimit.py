@@ -0,0 +1,157 @@
+"""Tests para el limitador de peticiones y los reintentos"""
+
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+
+from banxico_sie import BanxicoSIEClient, RetryPolicy, TokenBucket
+from banxico_sie.exceptions import BanxicoAPIError, BanxicoAuthError, BanxicoRateLimitError
+
+
+class FakeTime:
+    """Reloj monotónico y sleep simulados"""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def clock(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def make_response(status_code, payload=None, headers=None):
+    """Construye una respuesta HTTP simulada"""
+    response = Mock()
+    response.status_code = status_code
+    response.content = json.dumps(payload).encode("utf-8") if payload is not None else b""
+    response.headers = headers or {}
+    return response
+
+
+OK_PAYLOAD = {"bmx": {"series": [{"idSerie": "SF43718", "datos": []}]}}
+
+
+class TestTokenBucket:
+    """Suite de tests para TokenBucket"""
+
+    def test_burst_then_throttle(self):
+        """Se permite la ráfaga de `capacity` y luego se espera 1/rate por petición"""
+        fake = FakeTime()
+        bucket = TokenBucket(rate=2, capacity=2, clock=fake.clock, sleep=fake.sleep)
+
+        for _ in range(4):
+            bucket.acquire()
+
+        assert fake.sleeps == [0.5, 0.5]
+
+    def test_timeout(self):
+        """Si no hay token antes del timeout no se consume nada"""
+        fake = FakeTime()
+        bucket = TokenBucket(rate=1, capacity=1, clock=fake.clock, sleep=fake.sleep)
+        bucket.acquire()
+
+        assert bucket.acquire(timeout=0.5) is False
+        assert bucket.acquire(timeout=1.0) is True
+
+    def test_pause(self):
+        """pause detiene la entrega de tokens"""
+        fake = FakeTime()
+        bucket = TokenBucket(rate=10, capacity=10, clock=fake.clock, sleep=fake.sleep)
+
+        bucket.pause(3)
+        bucket.acquire()
+
+        assert fake.sleeps == [3]
+
+
+class TestRetryPolicy:
+    """Suite de tests para RetryPolicy"""
+
+    def test_exponential_backoff(self):
+        """Sin jitter la espera se duplica hasta max_backoff"""
+        policy = RetryPolicy(backoff_factor=1, max_backoff=5, jitter=False)
+        assert [policy.delay(i) for i in range(4)] == [1, 2, 4, 5]
+
+    def test_retry_after(self):
+        """Retry-After tiene prioridad sobre el backoff"""
+        policy = RetryPolicy(jitter=False)
+        assert policy.delay(0, retry_after=7) == 7
+
+
+class TestClientRetries:
+    """Suite de tests para reintentos en _make_request"""
+
+    @patch('banxico_sie.client.time.sleep')
+    @patch('banxico_sie.client.requests.Session.get')
+    def test_retries_rate_limit_honoring_retry_after(self, mock_get, mock_sleep):
+        """Un 429 se reintenta esperando lo indicado en Retry-After"""
+        mock_get.side_effect = [
+            make_response(429, {"error": "Rate limit"}, {"Retry-After": "2"}),
+            make_response(200, OK_PAYLOAD),
+        ]
+        client = BanxicoSIEClient("test_token_123", retry=RetryPolicy(jitter=False))
+
+        result = client._make_request(["SF43718"], "2024-12-26", "2024-12-27")
+
+        assert result == OK_PAYLOAD
+        mock_sleep.assert_called_once_with(2.0)
+
+    @patch('banxico_sie.client.time.sleep')
+    @patch('banxico_sie.client.requests.Session.get')
+    def test_retries_exhausted(self, mock_get, mock_sleep):
+        """Al agotar los reintentos se lanza el último error"""
+        mock_get.return_value = make_response(503, {"error": "Unavailable"})
+        client = BanxicoSIEClient("test_token_123", retry=RetryPolicy(max_retries=2))
+
+        with pytest.raises(BanxicoAPIError) as exc_info:
+            client._make_request(["SF43718"], "2024-12-26", "2024-12-27")
+
+        assert exc_info.value.status_code == 503
+        assert mock_get.call_count == 3
+
+    @patch('banxico_sie.client.requests.Session.get')
+    def test_auth_error_not_retried(self, mock_get):
+        """Los errores de autenticación no se reintentan"""
+        mock_get.return_value = make_response(401, {"error": "Invalid token"})
+        client = BanxicoSIEClient("test_token_123", retry=RetryPolicy())
+
+        with pytest.raises(BanxicoAuthError):
+            client._make_request(["SF43718"], "2024-12-26", "2024-12-27")
+
+        assert mock_get.call_count == 1
+
+    @patch('banxico_sie.client.time.sleep')
+    @patch('banxico_sie.client.requests.Session.get')
+    def test_deadline_stops_retries(self, mock_get, mock_sleep):
+        """No se reintenta si la espera rebasaría el deadline"""
+        mock_get.return_value = make_response(429, {"error": "Rate limit"}, {"Retry-After": "30"})
+        client = BanxicoSIEClient("test_token_123", retry=RetryPolicy(), deadline=10)
+
+        with pytest.raises(BanxicoRateLimitError) as exc_info:
+            client._make_request(["SF43718"], "2024-12-26", "2024-12-27")
+
+        assert exc_info.value.retry_after == 30
+        assert mock_get.call_count == 1
+        mock_sleep.assert_not_called()
+
+    @patch('banxico_sie.client.requests.Session.get')
+    def test_rate_limit_pauses_bucket(self, mock_get):
+        """Un 429 pausa el limitador compartido en lugar de dormir el hilo"""
+        fake = FakeTime()
+        bucket = TokenBucket(rate=10, capacity=10, clock=fake.clock, sleep=fake.sleep)
+        mock_get.side_effect = [
+            make_response(429, {"error": "Rate limit"}, {"Retry-After": "5"}),
+            make_response(200, OK_PAYLOAD),
+        ]
+        client = BanxicoSIEClient(
+            "test_token_123", rate_limiter=bucket, retry=RetryPolicy(jitter=False)
+        )
+
+        client._make_request(["SF43718"], "2024-12-26", "2024-12-27")
+
+        assert fake.sleeps == [5]
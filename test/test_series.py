@@ -0,0 +1,87 @@
+"""Tests para la serie columnar RateSeries"""
+
+from array import array
+from datetime import date
+from unittest.mock import patch
+
+import pytest
+
+from banxico_sie import BanxicoSIEClient, Currency, RateSeries
+
+
+@pytest.fixture
+def serie():
+    """Serie USD con un dato N/E"""
+    return RateSeries.from_datos(Currency.USD, [
+        {"fecha": "26/12/2024", "dato": "20.3456"},
+        {"fecha": "27/12/2024", "dato": "N/E"},
+        {"fecha": "30/12/2024", "dato": "20.5"},
+    ])
+
+
+class TestRateSeries:
+    """Suite de tests para RateSeries"""
+
+    def test_storage_is_contiguous(self, serie):
+        """Fechas y valores se guardan en arreglos"""
+        assert isinstance(serie.ordinals, array)
+        assert isinstance(serie.values, array)
+        assert serie.dates == [date(2024, 12, 26), date(2024, 12, 27), date(2024, 12, 30)]
+
+    def test_iteration_matches_dict_format(self, serie):
+        """Iterar regresa el mismo formato que get_rates_range"""
+        records = list(serie)
+
+        assert records[0] == {
+            "fecha": "26/12/2024",
+            "moneda": "USD",
+            "moneda_nombre": "Dólar estadounidense",
+            "simbolo": "$",
+            "valor": 20.3456,
+            "tipo": "FIX - Determinación publicada en DOF"
+        }
+        assert records[1]["valor"] is None
+
+    def test_indexing_and_slicing(self, serie):
+        """Soporta índices negativos y rebanadas"""
+        assert serie[-1]["fecha"] == "30/12/2024"
+        tail = serie[1:]
+        assert isinstance(tail, RateSeries)
+        assert len(tail) == 2
+        with pytest.raises(IndexError):
+            serie[3]
+
+    def test_date_lookup(self, serie):
+        """Búsqueda exacta y as-of por fecha"""
+        assert serie.get("2024-12-26")["valor"] == 20.3456
+        assert serie.get("28/12/2024") is None
+        assert serie.asof(date(2024, 12, 29))["fecha"] == "27/12/2024"
+        assert serie.asof("2024-12-01") is None
+
+    def test_to_numpy(self, serie):
+        """to_numpy regresa datetime64 y float64"""
+        np = pytest.importorskip("numpy")
+
+        dates, values = serie.to_numpy()
+
+        assert dates[0] == np.datetime64("2024-12-26")
+        assert values.dtype == np.float64
+        assert np.isnan(values[1])
+
+
+class TestClientAsSeries:
+    """Suite de tests para get_rates_range(as_series=True)"""
+
+    @patch.object(BanxicoSIEClient, '_make_request')
+    def test_get_rates_range_as_series(self, mock_request):
+        """El cliente puede regresar RateSeries"""
+        mock_request.return_value = {"bmx": {"series": [{"idSerie": "SF46410", "datos": [
+            {"fecha": "26/12/2024", "dato": "21.5"},
+        ]}]}}
+        client = BanxicoSIEClient("test_token_123")
+
+        serie = client.get_rates_range(Currency.EUR, "2024-12-26", "2024-12-26", as_series=True)
+
+        assert isinstance(serie, RateSeries)
+        assert serie.moneda == "EUR"
+        assert serie[0]["valor"] == 21.5
@@ -0,0 +1,77 @@
+"""Tests para el uso del cliente desde varios hilos"""
+
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from unittest.mock import Mock
+
+import pytest
+import requests
+
+from banxico_sie import BanxicoSIEClient, Currency
+
+
+class TestThreadLocalSessions:
+    """Suite de tests para las sesiones por hilo"""
+
+    def test_session_per_thread(self):
+        """Cada hilo tiene su propia sesión"""
+        client = BanxicoSIEClient("test_token_123")
+        barrier = threading.Barrier(4)
+
+        def get_session(_):
+            barrier.wait()
+            return client.session
+
+        with ThreadPoolExecutor(4) as executor:
+            sessions = list(executor.map(get_session, range(4)))
+
+        assert len({id(s) for s in sessions}) == 4
+        assert client.session is client.session
+
+    def test_sessions_share_connection_pool(self):
+        """Todas las sesiones montan el mismo adaptador y los headers del token"""
+        client = BanxicoSIEClient("test_token_123", pool_maxsize=32)
+
+        with ThreadPoolExecutor(1) as executor:
+            other = executor.submit(lambda: client.session).result()
+
+        url = client.BASE_URL
+        assert other.get_adapter(url) is client.session.get_adapter(url)
+        assert other.get_adapter(url)._pool_maxsize == 32
+        assert other.headers["Bmx-Token"] == "test_token_123"
+
+    def test_injected_session(self):
+        """Una sesión asignada se usa en todos los hilos; None regresa a las sesiones por hilo"""
+        client = BanxicoSIEClient("test_token_123")
+        response = Mock(status_code=200, headers={})
+        response.content = json.dumps({"bmx": {"series": [{"idSerie": "SF43718", "datos": [
+            {"fecha": "20/12/2024", "dato": "20.1"}
+        ]}]}}).encode("utf-8")
+        custom = Mock(spec=requests.Session)
+        custom.get.return_value = response
+
+        client.session = custom
+        with ThreadPoolExecutor(1) as executor:
+            assert executor.submit(lambda: client.session).result() is custom
+        assert client.get_rate(Currency.USD, fecha="2024-12-20")["valor"] == 20.1
+        custom.get.assert_called_once()
+
+        client.session = None
+        assert isinstance(client.session, requests.Session)
+        assert client.session is not custom
+
+    def test_invalid_pool_size(self):
+        """El tamaño del pool debe ser positivo"""
+        with pytest.raises(ValueError):
+            BanxicoSIEClient("test_token_123", pool_maxsize=0)
+
+    def test_context_manager_closes_pool(self):
+        """Al salir del bloque with se cierra el pool"""
+        with BanxicoSIEClient("test_token_123") as client:
+            adapter = client.session.get_adapter(client.BASE_URL)
+            adapter.poolmanager.connection_from_url(client.BASE_URL)
+            assert len(adapter.poolmanager.pools) == 1
+
+        assert len(adapter.poolmanager.pools) == 0
@@ -0,0 +1,117 @@
+"""Tests para la caché compartida entre procesos (SQLite)"""
+
+import multiprocessing
+import sqlite3
+from datetime import date
+from unittest.mock import patch
+
+import pytest
+
+from banxico_sie import BanxicoSIEClient, Currency, SQLiteRateCache
+from banxico_sie.exceptions import BanxicoDataNotFoundError
+
+
+@pytest.fixture
+def path(tmp_path):
+    """Ruta del archivo de la caché"""
+    return str(tmp_path / "cache.db")
+
+
+def fill_cache(path):
+    """Proceso worker que guarda un dato en la caché compartida"""
+    SQLiteRateCache(path).set(("SF43718", "2024-12-20"), {"valor": 20.1})
+
+
+class TestSQLiteRateCache:
+    """Suite de tests para SQLiteRateCache"""
+
+    def test_shared_between_instances(self, path):
+        """Lo que guarda una instancia lo ve otra sobre el mismo archivo"""
+        first, second = SQLiteRateCache(path), SQLiteRateCache(path)
+
+        first.set(("SF43718", "2024-12-20"), {"fecha": date(2024, 12, 20), "valor": 20.1})
+
+        assert second.get(("SF43718", "2024-12-20")) == {"fecha": date(2024, 12, 20), "valor": 20.1}
+        assert len(second) == 1
+
+    def test_shared_between_processes(self, path):
+        """Lo que guarda un proceso lo ve otro"""
+        cache = SQLiteRateCache(path)
+        process = multiprocessing.get_context("spawn").Process(target=fill_cache, args=(path,))
+        process.start()
+        process.join(30)
+
+        assert process.exitcode == 0
+        assert cache.get(("SF43718", "2024-12-20")) == {"valor": 20.1}
+
+    def test_expiration_and_lru(self, path, clock):
+        """Expira igual que RateCache y desaloja la entrada menos usada"""
+        cache = SQLiteRateCache(path, maxsize=2, clock=clock)
+        cache.set("a", {"v": 1}, expires_at=clock() + 600)
+        clock.advance(61)
+        cache.set("b", {"v": 2})
+        clock.advance(61)
+        cache.get("a")
+        clock.advance(1)
+        cache.set("c", {"v": 3})
+
+        assert cache.get("b") is None
+        assert cache.info().evictions == 1
+        clock.advance(600)
+        assert cache.get("a") is None
+        assert cache.get("c") == {"v": 3}
+
+    def test_recent_hits_do_not_write(self, path, clock):
+        """Un acierto sólo actualiza used_at si pasó el intervalo: las lecturas no escriben"""
+        cache = SQLiteRateCache(path, clock=clock)
+        cache.set("a", {"v": 1})
+
+        def used_at():
+            conn = sqlite3.connect(path)
+            try:
+                return conn.execute("SELECT used_at FROM entries").fetchone()[0]
+            finally:
+                conn.close()
+
+        written = used_at()
+
+        clock.advance(30)
+        assert cache.get("a") == {"v": 1}
+        assert used_at() == written
+
+        clock.advance(31)
+        assert cache.get("a") == {"v": 1}
+        assert used_at() == clock()
+
+    def test_database_errors_degrade(self, path):
+        """Si SQLite falla (p. ej. archivo bloqueado) se trata como fallo y no se escribe"""
+        cache = SQLiteRateCache(path)
+        locked = sqlite3.OperationalError("database is locked")
+
+        with patch.object(cache, "_connection", side_effect=locked):
+            cache.set("a", {"v": 1})
+            assert cache.get("a") is None
+            assert cache.get_stale("a") is None
+
+        assert cache.info().misses == 1
+        assert len(cache) == 0
+
+    @patch.object(BanxicoSIEClient, '_make_request')
+    def test_clients_share_results(self, mock_request, path, clock):
+        """El dato (o la falta de dato) pedido por un cliente sirve a los demás"""
+        mock_request.return_value = {"bmx": {"series": [{"idSerie": "SF43718", "datos": [
+            {"fecha": "20/12/2024", "dato": "20.1"}
+        ]}]}}
+        worker_a = BanxicoSIEClient("test_token_123", cache=SQLiteRateCache(path, clock=clock))
+        worker_b = BanxicoSIEClient("test_token_123", cache=SQLiteRateCache(path, clock=clock))
+
+        worker_a.get_rate(Currency.USD, fecha="2024-12-20")
+        assert worker_b.get_rate(Currency.USD, fecha="2024-12-20")["valor"] == 20.1
+
+        mock_request.return_value = {"bmx": {"series": [{"idSerie": "SF43718", "datos": []}]}}
+        with pytest.raises(BanxicoDataNotFoundError):
+            worker_a.get_rate(Currency.USD, fecha="2024-12-21")
+        with pytest.raises(BanxicoDataNotFoundError):
+            worker_b.get_rate(Currency.USD, fecha="2024-12-21")
+
+        assert mock_request.call_count == 2
@@ -0,0 +1,120 @@
+"""Tests para el almacén local SQLite"""
+
+import pytest
+from datetime import date
+from unittest.mock import patch
+
+from banxico_sie import BanxicoSIEClient, Currency, SQLiteRateStore
+from banxico_sie.exceptions import BanxicoDataNotFoundError
+
+
+def make_response(series_id, datos):
+    """Construye una respuesta de la API con una sola serie"""
+    return {"bmx": {"series": [{"idSerie": series_id, "datos": datos}]}}
+
+
+@pytest.fixture
+def store():
+    """Fixture que retorna un almacén en memoria"""
+    return SQLiteRateStore()
+
+
+@pytest.fixture
+def client(store):
+    """Fixture que retorna un cliente con almacén local"""
+    return BanxicoSIEClient("test_token_123", store=store)
+
+
+class TestSQLiteRateStore:
+    """Suite de tests para SQLiteRateStore"""
+
+    def test_points_roundtrip(self, store):
+        """Las observaciones se regresan en formato de la API y en orden"""
+        store.add_points("SF43718", [
+            {"fecha": "27/12/2024", "dato": "20.4567"},
+            {"fecha": "26/12/2024", "dato": "20.3456"},
+        ])
+
+        points = store.get_points("SF43718", date(2024, 12, 1), date(2024, 12, 31))
+
+        assert points == [
+            {"fecha": "26/12/2024", "dato": "20.3456"},
+            {"fecha": "27/12/2024", "dato": "20.4567"},
+        ]
+
+    def test_missing_intervals(self, store):
+        """Sólo se reportan los huecos no consultados"""
+        store.mark_covered("SF43718", date(2024, 1, 10), date(2024, 1, 20))
+        store.mark_covered("SF43718", date(2024, 1, 21), date(2024, 1, 25))
+
+        missing = store.missing_intervals("SF43718", date(2024, 1, 1), date(2024, 1, 31))
+
+        assert missing == [
+            (date(2024, 1, 1), date(2024, 1, 9)),
+            (date(2024, 1, 26), date(2024, 1, 31)),
+        ]
+        assert store.missing_intervals("SF43718", date(2024, 1, 12), date(2024, 1, 22)) == []
+
+    def test_persistence(self, tmp_path):
+        """Los datos sobreviven a reabrir el archivo"""
+        path = str(tmp_path / "rates.db")
+        store = SQLiteRateStore(path)
+        store.add_points("SF46410", [{"fecha": "02/01/2024", "dato": "19.0"}])
+        store.mark_covered("SF46410", date(2024, 1, 1), date(2024, 1, 2))
+        store.close()
+
+        reopened = SQLiteRateStore(path)
+        assert reopened.missing_intervals("SF46410", date(2024, 1, 1), date(2024, 1, 2)) == []
+        assert len(reopened.get_points("SF46410", date(2024, 1, 1), date(2024, 1, 2))) == 1
+
+
+class TestClientWithStore:
+    """Suite de tests para el cliente respaldado por almacén local"""
+
+    @patch.object(BanxicoSIEClient, '_make_request')
+    def test_range_fetches_only_missing(self, mock_request, client):
+        """Un rango ya consultado se responde sin red; sólo se pide lo nuevo"""
+        mock_request.return_value = make_response("SF43718", [
+            {"fecha": "02/01/2024", "dato": "17.0"},
+            {"fecha": "03/01/2024", "dato": "17.1"},
+        ])
+        first = client.get_rates_range(Currency.USD, "2024-01-01", "2024-01-05")
+
+        assert len(first) == 2
+        mock_request.assert_called_once_with(["SF43718"], "2024-01-01", "2024-01-05")
+
+        mock_request.reset_mock()
+        mock_request.return_value = make_response("SF43718", [
+            {"fecha": "08/01/2024", "dato": "17.2"},
+        ])
+        second = client.get_rates_range(Currency.USD, "2024-01-02", "2024-01-10")
+
+        mock_request.assert_called_once_with(["SF43718"], "2024-01-06", "2024-01-10")
+        assert [r["fecha"] for r in second] == ["02/01/2024", "03/01/2024", "08/01/2024"]
+        assert second[2]["valor"] == 17.2
+
+    @patch.object(BanxicoSIEClient, '_make_request')
+    def test_get_rate_uses_store(self, mock_request, client):
+        """get_rate también se responde desde el almacén"""
+        mock_request.return_value = make_response("SF43718", [
+            {"fecha": "02/01/2024", "dato": "17.0"},
+        ])
+        client.get_rates_range(Currency.USD, "2024-01-01", "2024-01-05")
+        mock_request.reset_mock()
+
+        rate = client.get_rate(Currency.USD, fecha="2024-01-02")
+
+        assert rate["valor"] == 17.0
+        mock_request.assert_not_called()
+
+    @patch.object(BanxicoSIEClient, '_make_request')
+    def test_empty_range_is_remembered(self, mock_request, client):
+        """Un rango sin datos no se vuelve a pedir, pero sigue sin datos"""
+        mock_request.return_value = make_response("SF43718", [])
+
+        with pytest.raises(BanxicoDataNotFoundError):
+            client.get_rate(Currency.USD, fecha="2024-01-06")
+        with pytest.raises(BanxicoDataNotFoundError):
+            client.get_rate(Currency.USD, fecha="2024-01-06")
+
+        mock_request.assert_called_once()
@@ -0,0 +1,127 @@
+"""Tests para el parseo incremental y iter_rates_range"""
+
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+
+from banxico_sie import BanxicoAPIError, BanxicoSIEClient, Currency
+from banxico_sie.streaming import iter_series_items
+
+
+RESPONSE = {
+    "bmx": {
+        "series": [
+            {
+                "idSerie": "SF43718",
+                "titulo": "Tipo de cambio Pesos por dólar E.U.A.",
+                "datos": [
+                    {"fecha": "26/12/2024", "dato": "20.3456"},
+                    {"fecha": "27/12/2024", "dato": "N/E"},
+                ]
+            },
+            {"idSerie": "SF46406", "titulo": "Yen japonés"},
+            {
+                "idSerie": "SF46410",
+                "titulo": "Euro",
+                "datos": [{"fecha": "26/12/2024", "dato": "21.1234"}]
+            },
+        ]
+    }
+}
+
+
+def chunked(data: bytes, size: int):
+    """Parte el cuerpo en fragmentos de `size` bytes"""
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+class TestIterSeriesItems:
+    """Suite de tests para iter_series_items"""
+
+    def test_any_chunk_size(self):
+        """El resultado no depende de dónde se corten los fragmentos"""
+        body = json.dumps(RESPONSE, ensure_ascii=False, indent=1).encode("utf-8")
+        expected = [
+            ("SF43718", {"fecha": "26/12/2024", "dato": "20.3456"}),
+            ("SF43718", {"fecha": "27/12/2024", "dato": "N/E"}),
+            ("SF46410", {"fecha": "26/12/2024", "dato": "21.1234"}),
+        ]
+
+        for size in (1, 2, 7, 64, len(body)):
+            assert list(iter_series_items(chunked(body, size))) == expected
+
+    def test_brackets_inside_strings(self):
+        """Las llaves, corchetes y comillas escapadas dentro de textos no rompen el recorrido"""
+        response = {"bmx": {"series": [
+            {
+                "idSerie": "SF43718",
+                "titulo": 'Tipo {x} [y] "z" }]',
+                "datos": [{"fecha": "26/12/2024", "dato": "20.3456", "nota": "{a} [b]"}]
+            },
+            {"idSerie": "SF46410", "titulo": "Euro ]}", "datos": []},
+        ]}}
+        body = json.dumps(response).encode("utf-8")
+        expected = [
+            ("SF43718", {"fecha": "26/12/2024", "dato": "20.3456", "nota": "{a} [b]"}),
+        ]
+
+        for size in (1, 3, len(body)):
+            assert list(iter_series_items(chunked(body, size))) == expected
+
+    def test_uses_given_loads(self):
+        """Cada objeto se decodifica con la función indicada"""
+        body = json.dumps(RESPONSE).encode("utf-8")
+        decoded = []
+
+        def loads(content):
+            decoded.append(content)
+            return json.loads(content)
+
+        list(iter_series_items(chunked(body, 10), loads))
+
+        assert decoded and all(isinstance(content, bytes) for content in decoded)
+
+    def test_invalid_json(self):
+        """Un objeto inválido se reporta como BanxicoAPIError"""
+        body = b'{"bmx": {"series": [{"idSerie": "SF43718", "datos": [{"fecha": 26/12}]}]}}'
+
+        with pytest.raises(BanxicoAPIError, match="parseando"):
+            list(iter_series_items([body]))
+
+    def test_is_lazy(self):
+        """Los datos salen antes de consumir todos los fragmentos"""
+        body = json.dumps(RESPONSE).encode("utf-8")
+        consumed = []
+
+        def chunks():
+            for chunk in chunked(body, 16):
+                consumed.append(chunk)
+                yield chunk
+
+        next(iter_series_items(chunks()))
+
+        assert len(consumed) < len(chunked(body, 16))
+
+
+class TestIterRatesRange:
+    """Suite de tests para BanxicoSIEClient.iter_rates_range"""
+
+    @patch('banxico_sie.client.requests.Session.get')
+    def test_streams_records(self, mock_get):
+        """Se pide la respuesta en modo stream y se producen dicts parseados"""
+        response = Mock()
+        response.status_code = 200
+        response.iter_content.return_value = chunked(json.dumps(RESPONSE).encode("utf-8"), 10)
+        mock_get.return_value = response
+        client = BanxicoSIEClient("test_token_123")
+
+        records = list(client.iter_rates_range(
+            [Currency.USD, Currency.EUR, Currency.JPY], "2024-12-26", "2024-12-27"
+        ))
+
+        assert mock_get.call_args[1]["stream"] is True
+        assert [(r["moneda"], r["valor"]) for r in records] == [
+            ("USD", 20.3456), ("USD", None), ("EUR", 21.1234)
+        ]
+        response.close.assert_called_once()
@@ -0,0 +1,111 @@
+"""Tests para la sincronización incremental (sync)"""
+
+from datetime import date, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from banxico_sie import BanxicoSIEClient, Currency, SQLiteRateStore
+
+
+TODAY = date.today()
+
+
+def day(offset):
+    """Fecha relativa a hoy"""
+    return TODAY + timedelta(days=offset)
+
+
+def api_date(d):
+    return d.strftime("%d/%m/%Y")
+
+
+def make_response(series):
+    """Respuesta de la API con varias series: {idSerie: [(fecha, dato), ...]}"""
+    return {"bmx": {"series": [
+        {"idSerie": series_id, "datos": [{"fecha": api_date(f), "dato": v} for f, v in points]}
+        for series_id, points in series.items()
+    ]}}
+
+
+@pytest.fixture
+def store():
+    """Fixture que retorna un almacén en memoria"""
+    return SQLiteRateStore()
+
+
+class TestSync:
+    """Suite de tests para BanxicoSIEClient.sync"""
+
+    @patch.object(BanxicoSIEClient, '_make_request')
+    def test_first_sync_and_incremental(self, mock_request, store):
+        """La primera carga usa start_date; las siguientes sólo piden lo posterior a la marca"""
+        client = BanxicoSIEClient("test_token_123", store=store)
+        mock_request.return_value = make_response({
+            "SF43718": [(day(-10), "17.0"), (day(-9), "17.1")],
+            "SF46410": [(day(-10), "18.0")],
+        })
+
+        first = client.sync([Currency.USD, Currency.EUR], start_date=day(-10))
+
+        mock_request.assert_called_once_with(
+            ["SF43718", "SF46410"], day(-10).isoformat(), TODAY.isoformat()
+        )
+        assert len(first[Currency.USD]) == 2 and len(first[Currency.EUR]) == 1
+        assert store.last_date("SF43718") == day(-9)
+
+        mock_request.reset_mock()
+        # La API regresa desde la marca más antigua; lo ya guardado se descarta
+        mock_request.return_value = make_response({
+            "SF43718": [(day(-9), "17.1"), (day(-2), "17.5")],
+            "SF46410": [(day(-9), "18.1")],
+        })
+
+        second = client.sync([Currency.USD, Currency.EUR])
+
+        mock_request.assert_called_once_with(
+            ["SF43718", "SF46410"], day(-9).isoformat(), TODAY.isoformat()
+        )
+        assert [r["fecha"] for r in second[Currency.USD]] == [api_date(day(-2))]
+        assert [r["valor"] for r in second[Currency.EUR]] == [18.1]
+
+    @patch.object(BanxicoSIEClient, '_make_request')
+    def test_synced_range_served_from_store(self, mock_request, store):
+        """Lo sincronizado cuenta como consultado para get_rates_range"""
+        client = BanxicoSIEClient("test_token_123", store=store)
+        mock_request.return_value = make_response({"SF43718": [(day(-3), "17.0")]})
+        client.sync([Currency.USD], start_date=day(-5))
+        mock_request.reset_mock()
+
+        rates = client.get_rates_range(Currency.USD, day(-5), day(-1))
+
+        assert [r["valor"] for r in rates] == [17.0]
+        mock_request.assert_not_called()
+
+    @patch.object(BanxicoSIEClient, '_make_request')
+    def test_user_supplied_marks(self, mock_request):
+        """Sin almacén se usan las marcas de `since` y no se guarda nada"""
+        client = BanxicoSIEClient("test_token_123")
+        mock_request.return_value = make_response({
+            "SF43718": [(day(-4), "17.0"), (day(-3), "17.1")],
+        })
+
+        new = client.sync([Currency.USD], since={Currency.USD: day(-4)})
+
+        mock_request.assert_called_once_with(["SF43718"], day(-3).isoformat(), TODAY.isoformat())
+        assert [r["valor"] for r in new[Currency.USD]] == [17.1]
+
+    @patch.object(BanxicoSIEClient, '_make_request')
+    def test_up_to_date_makes_no_request(self, mock_request):
+        """Si la marca ya es hoy no hay petición"""
+        client = BanxicoSIEClient("test_token_123")
+
+        assert client.sync([Currency.USD], since={Currency.USD: TODAY}) == {}
+        mock_request.assert_not_called()
+
+    def test_missing_marks(self, store):
+        """Sin marca ni start_date, o sin almacén ni since, es un error"""
+        with pytest.raises(ValueError):
+            BanxicoSIEClient("test_token_123").sync([Currency.USD])
+        with pytest.raises(ValueError):
+            BanxicoSIEClient("test_token_123", store=store).sync([Currency.USD])